@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
@@ -19,6 +20,7 @@ from homeassistant.helpers.issue_registry import (
     async_delete_issue,
 )
 from homeassistant.loader import async_get_loaded_integration
+from homeassistant.util.hass_dict import HassKey
 
 from .api import (
     EatonUpsClientAuthenticationError,
@@ -34,25 +36,58 @@ from .const import (
     CERT_UPLOAD_INSTRUCTIONS,
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_CRITICAL_TOPICS,
+    CONF_METRICS_EXPORTER,
     CONF_SERVER_CERT,
+    DEFAULT_CRITICAL_TOPICS,
     DOMAIN,
     LOGGER,
 )
 from .coordinator import EatonUPSDataUpdateCoordinator
 from .data import EatonUpsData
+from .services import async_setup_services
+from .snapshot import EatonUpsSnapshotView
+from .websocket import async_setup_websocket
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import EatonUpsConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
+    Platform.EVENT,
 ]
 
 ISSUE_ID_CERT_UPLOAD = "cert_upload_{entry_id}"
 
+METRICS_VIEW_REGISTERED: HassKey[bool] = HassKey(f"{DOMAIN}_metrics_view")
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the integration services, websocket commands and HTTP views."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    if hass.http is not None:
+        hass.http.register_view(EatonUpsSnapshotView())
+    return True
+
+
+def _register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once, when an entry first enables the exporter."""
+    if hass.http is None or hass.data.get(METRICS_VIEW_REGISTERED):
+        return
+    # The exporter is opt-in, so its module is not imported at integration load
+    from .metrics import EatonUpsMetricsView  # noqa: PLC0415
+
+    # The view serves only entries with the exporter option enabled
+    hass.http.register_view(EatonUpsMetricsView())
+    hass.data[METRICS_VIEW_REGISTERED] = True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -115,6 +150,9 @@ async def async_setup_entry(
         server_cert=data[CONF_SERVER_CERT],
         client_cert=data[CONF_CLIENT_CERT],
         client_key=data[CONF_CLIENT_KEY],
+        critical_topics=tuple(
+            entry.options.get(CONF_CRITICAL_TOPICS, DEFAULT_CRITICAL_TOPICS)
+        ),
     )
     entry.runtime_data = EatonUpsData(
         client=EatonUpsMqttClient(config=config, session=async_get_clientsession(hass)),
@@ -136,6 +174,9 @@ async def async_setup_entry(
     # Connection succeeded — delete any pending cert upload issue
     async_delete_issue(hass, DOMAIN, issue_id)
 
+    coordinator.devices.async_register_devices(entry.entry_id)
+    if entry.options.get(CONF_METRICS_EXPORTER, False):
+        _register_metrics_view(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -0,0 +1,125 @@
+"""Active alarm tracking for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .listeners import async_register_listener
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+    AlarmListener = Callable[[list[dict[str, Any]], list[dict[str, Any]]], None]
+
+ACTIVE_ALARMS_TOPIC = "alarmService/activeAlarms"
+MOST_CRITICAL_TOPIC = "alarmService/mostCritical"
+
+
+def get_alarm_id(member: dict[str, Any]) -> str | None:
+    """Return the stable identifier of an alarm member."""
+    alarm_id = member.get("id", member.get("@id"))
+    return str(alarm_id) if alarm_id is not None else None
+
+
+class AlarmTracker:
+    """
+    Track active alarms by id and report raised and cleared alarms.
+
+    Active alarms are kept in a dict keyed by alarm id, so a new member list
+    is diffed with key-view set operations instead of comparing whole lists.
+    Unchanged republishes never reach the tracker because the client
+    suppresses duplicate payloads. Alarms present at startup are adopted
+    without being reported as raised.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._active: dict[str, dict[str, Any]] = {}
+        self._most_critical: dict[str, Any] | None = None
+        self._listeners: list[AlarmListener] = []
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    @property
+    def active(self) -> Mapping[str, dict[str, Any]]:
+        """Return the active alarms keyed by alarm id."""
+        return self._active
+
+    @property
+    def most_critical(self) -> dict[str, Any] | None:
+        """Return the most critical active alarm, if any."""
+        return self._most_critical
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Subscribe to the alarm topics, adopting the current alarms silently."""
+        if self._unsubscribes:
+            return
+        if isinstance(current := data.get(ACTIVE_ALARMS_TOPIC), dict):
+            self._active = self._index(current)
+        self._handle_most_critical(data.get(MOST_CRITICAL_TOPIC))
+        self._unsubscribes.append(
+            client.subscribe_to_topic(ACTIVE_ALARMS_TOPIC, self._handle_active_alarms)
+        )
+        self._unsubscribes.append(
+            client.subscribe_to_topic(MOST_CRITICAL_TOPIC, self._handle_most_critical)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the alarm topics."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    @callback
+    def async_add_listener(self, listener: AlarmListener) -> CALLBACK_TYPE:
+        """
+        Call listener with the raised and cleared alarms of every change.
+
+        A change of the most critical alarm alone calls listener with two
+        empty lists. Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @staticmethod
+    def _index(payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Index the members of an activeAlarms payload by alarm id."""
+        indexed = {}
+        for member in payload.get("members") or ():
+            if isinstance(member, dict) and (alarm_id := get_alarm_id(member)):
+                indexed[alarm_id] = member
+        return indexed
+
+    @callback
+    def _handle_active_alarms(self, payload: Any) -> None:
+        """Diff a new member list against the active alarms."""
+        if not isinstance(payload, dict):
+            return
+        previous = self._active
+        current = self._index(payload)
+        raised = [current[alarm_id] for alarm_id in current.keys() - previous.keys()]
+        cleared = [previous[alarm_id] for alarm_id in previous.keys() - current.keys()]
+        self._active = current
+        if not (raised or cleared):
+            return
+        self._notify(raised, cleared)
+
+    @callback
+    def _handle_most_critical(self, payload: Any) -> None:
+        """Store the most critical alarm; the card publishes {} when none."""
+        most_critical = payload if isinstance(payload, dict) and payload else None
+        if most_critical == self._most_critical:
+            return
+        self._most_critical = most_critical
+        self._notify([], [])
+
+    def _notify(
+        self, raised: list[dict[str, Any]], cleared: list[dict[str, Any]]
+    ) -> None:
+        """Call every listener with a change."""
+        for listener in list(self._listeners):
+            listener(raised, cleared)
@@ -8,21 +8,29 @@ import json
 import logging
 import ssl
 import tempfile
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import paho.mqtt.client as mqtt
-from paho.mqtt.client import Client, MQTTv31
-
-from .const import MQTT_CONNECTION_ATTEMPTS, MQTT_SUPPORTED_PREFIXES
+from .const import (
+    DEFAULT_CRITICAL_TOPICS,
+    MQTT_COALESCE_WINDOW,
+    MQTT_CONNECTION_ATTEMPTS,
+    MQTT_SUPPORTED_PREFIXES,
+)
+from .ingest import IngestCounters
+from .suppliers import SupplierIndex
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     import aiohttp
+    import paho.mqtt.client as mqtt
+    from paho.mqtt.client import Client
 
 
 @dataclass
@@ -34,6 +42,7 @@ class EatonUpsMqttConfig:
     server_cert: str
     client_cert: str
     client_key: str
+    critical_topics: tuple[str, ...] = DEFAULT_CRITICAL_TOPICS
 
 
 logger = logging.getLogger(__name__)
@@ -55,16 +64,37 @@ class EatonUpsClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class EatonUpsCommandError(
+    EatonUpsClientError,
+):
+    """Exception to indicate a command was not confirmed."""
+
+
 class EatonUpsMqttClient:
     """Eaton UPS MQTT API Client."""
 
     _mqtt_client: Client | None
     _mqtt_connected: bool
     _mqtt_data: dict[str, Any]
+    _topic_received_at: dict[str, float]
+    _topic_payloads: dict[str, bytes]
+    _topic_versions: dict[str, int]
+    _version: int
+    _epoch: str
     _mqtt_prefix: str | None
     _temp_files: list[str]
     _update_callbacks: list[Callable[[dict[str, Any]], None]]
+    _topic_callbacks: dict[str, list[Callable[[dict[str, Any]], None]]]
+    _critical_topics: frozenset[str]
+    _critical_latency: dict[str, float]
+    _latency_callbacks: list[Callable[[str, float], None]]
+    _change_callbacks: list[Callable[[set[str]], None]]
+    _changed_keys: deque[str]
+    _flush_pending: bool
+    _flush_handle: asyncio.TimerHandle | None
     _loop: asyncio.AbstractEventLoop | None
+    _ingest: IngestCounters | None
+    _suppliers: SupplierIndex
 
     def __init__(
         self, config: EatonUpsMqttConfig, session: aiohttp.ClientSession
@@ -79,16 +109,107 @@ class EatonUpsMqttClient:
         self._mqtt_client = None
         self._mqtt_connected = False
         self._mqtt_data = {}
+        self._topic_received_at = {}
+        self._topic_payloads = {}
+        self._topic_versions = {}
+        self._version = 0
+        self._epoch = uuid.uuid4().hex
         self._mqtt_prefix = None
         self._temp_files = []
         self._update_callbacks = []
+        self._topic_callbacks = {}
+        self._critical_topics = frozenset(config.critical_topics)
+        self._critical_latency = {}
+        self._latency_callbacks = []
+        self._change_callbacks = []
+        self._changed_keys = deque()
+        self._flush_pending = False
+        self._flush_handle = None
         self._loop = None
+        self._ingest = None
+        self._suppliers = SupplierIndex()
+        self._has_connected = False
+        self._connect_started: float | None = None
+        self._socket_opened: float | None = None
 
     @property
     def mqtt_prefix(self) -> str | None:
         """Return the detected MQTT topic prefix."""
         return self._mqtt_prefix
 
+    @property
+    def topic_received_at(self) -> Mapping[str, float]:
+        """Return the monotonic receive timestamp of each topic."""
+        return self._topic_received_at
+
+    @property
+    def version(self) -> int:
+        """Return the topic store version, increased on every changed payload."""
+        return self._version
+
+    @property
+    def epoch(self) -> str:
+        """Return the id of this topic store, whose version starts at 0."""
+        return self._epoch
+
+    @property
+    def topic_versions(self) -> Mapping[str, int]:
+        """Return the store version at which each topic last changed."""
+        return self._topic_versions
+
+    @property
+    def critical_topics(self) -> frozenset[str]:
+        """Return the topics dispatched ahead of coalesced bulk updates."""
+        return self._critical_topics
+
+    @property
+    def critical_topic_latency(self) -> Mapping[str, float]:
+        """Return the last receive-to-dispatched latency of each critical topic."""
+        return self._critical_latency
+
+    @property
+    def suppliers(self) -> SupplierIndex:
+        """Return the powerService supplier index."""
+        return self._suppliers
+
+    @property
+    def ingest_counters(self) -> IngestCounters | None:
+        """Return the ingest counters, or None when instrumentation is off."""
+        return self._ingest
+
+    def enable_ingest_stats(self) -> IngestCounters:
+        """
+        Enable ingest self-instrumentation.
+
+        Must be called before async_setup so connection timings are captured.
+        """
+        if self._ingest is None:
+            self._ingest = IngestCounters()
+        return self._ingest
+
+    def set_message_probe(self, probe: Callable[[str, float], None] | None) -> None:
+        """
+        Route messages through a timing probe, or restore the plain handler.
+
+        The probe is called with the topic and the handling time in seconds
+        from the paho network thread.
+        """
+        if self._mqtt_client is None:
+            return
+        if probe is None:
+            self._mqtt_client.on_message = self._on_message
+            return
+
+        def on_message(
+            client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage
+        ) -> None:
+            """Handle a message and report its handling time."""
+            start = time.perf_counter()
+            self._on_message(client, userdata, msg)
+            probe(msg.topic, time.perf_counter() - start)
+
+        self._mqtt_client.on_message = on_message
+
     def subscribe_to_updates(
         self, callback: Callable[[dict[str, Any]], None]
     ) -> Callable[[], None]:
@@ -106,6 +227,68 @@ class EatonUpsMqttClient:
 
         return unsubscribe
 
+    def subscribe_to_topic(
+        self, key: str, callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to changes of a single topic.
+
+        The callback receives the decoded payload of the topic key on the
+        event loop as soon as it changes, bypassing bulk coalescing.
+        Returns a function that can be called to unsubscribe.
+        """
+        callbacks = self._topic_callbacks.setdefault(key, [])
+        callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            """Unsubscribe from topic changes."""
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks and self._topic_callbacks.get(key) is callbacks:
+                del self._topic_callbacks[key]
+
+        return unsubscribe
+
+    def subscribe_to_changes(
+        self, callback: Callable[[set[str]], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to batches of changed topic keys.
+
+        The callback receives the keys of all topics that changed since the
+        previous batch, once per coalesced flush or critical dispatch.
+        Returns a function that can be called to unsubscribe.
+        """
+        self._change_callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            """Unsubscribe from change batches."""
+            if callback in self._change_callbacks:
+                self._change_callbacks.remove(callback)
+            if not self._change_callbacks:
+                self._changed_keys.clear()
+
+        return unsubscribe
+
+    def subscribe_to_critical_latency(
+        self, callback: Callable[[str, float], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to critical topic latency measurements.
+
+        The callback receives the topic key and the latency in seconds from
+        receipt in the network thread until all update callbacks returned.
+        Returns a function that can be called to unsubscribe.
+        """
+        self._latency_callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            """Unsubscribe from latency measurements."""
+            if callback in self._latency_callbacks:
+                self._latency_callbacks.remove(callback)
+
+        return unsubscribe
+
     async def async_setup(self) -> None:
         """Set up the MQTT client connection."""
         if self._mqtt_client is not None:
@@ -114,12 +297,15 @@ class EatonUpsMqttClient:
         # Store the event loop for later use
         self._loop = asyncio.get_running_loop()
 
+        # paho is only needed once a connection is made, not at integration load
+        import paho.mqtt.client as mqtt  # noqa: PLC0415
+
         # Create the MQTT client
         client_id = f"hass-eaton-ups-{uuid.uuid4()}"
         self._mqtt_client = mqtt.Client(
             callback_api_version=mqtt.CallbackAPIVersion.VERSION2,
             client_id=client_id,
-            protocol=MQTTv31,
+            protocol=mqtt.MQTTv31,
         )
         self._mqtt_client.reconnect_delay_set(min_delay=1, max_delay=30)
         self._mqtt_client.enable_logger(logger)
@@ -128,6 +314,9 @@ class EatonUpsMqttClient:
         self._mqtt_client.on_connect = self._on_connect
         self._mqtt_client.on_message = self._on_message
         self._mqtt_client.on_disconnect = self._on_disconnect
+        if self._ingest is not None:
+            self._mqtt_client.on_pre_connect = self._on_pre_connect
+            self._mqtt_client.on_socket_open = self._on_socket_open
 
         # Create temporary certificate files
         self._temp_files = await self._create_temp_cert_files()
@@ -190,8 +379,13 @@ class EatonUpsMqttClient:
         # Return the current data
         return self._mqtt_data
 
-    async def async_set_title(self, value: str) -> dict[str, bool]:
-        """Set a value via MQTT (placeholder for now)."""
+    async def async_publish_command(self, key: str, payload: dict[str, Any]) -> None:
+        """
+        Publish a command payload to a topic key under the detected prefix.
+
+        The card confirms commands through its status topics, not a reply,
+        so this only hands the message to the broker.
+        """
         if not self._mqtt_connected:
             await self.async_setup()
 
@@ -203,15 +397,18 @@ class EatonUpsMqttClient:
             msg = "MQTT prefix not yet detected"
             raise EatonUpsClientError(msg)
 
-        # This is a placeholder for actual command sending
-        # In a real implementation, you would publish to a specific topic
-        topic = self._mqtt_prefix + "powerDistributions/1/command"
-        payload = json.dumps({"command": value})
-        self._mqtt_client.publish(topic, payload)
-        return {"success": True}
+        topic = self._mqtt_prefix + key
+        info = self._mqtt_client.publish(topic, json.dumps(payload), qos=1)
+        if info.rc != 0:
+            msg = f"Failed to publish command to {topic}: {info.rc}"
+            raise EatonUpsClientCommunicationError(msg)
 
     async def async_disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_pending = False
         if self._mqtt_client is not None:
             self._mqtt_client.disconnect()
             self._mqtt_client.loop_stop()
@@ -225,12 +422,24 @@ class EatonUpsMqttClient:
             return
         self._mqtt_client.subscribe(
             topic=[
+                ("mbdetnrs/+/alarmService/#", 0),
                 ("mbdetnrs/+/managers/#", 0),
                 ("mbdetnrs/+/powerDistributions/#", 0),
+                ("mbdetnrs/+/powerService/#", 0),
                 ("mbdetnrs/+/sensors/#", 0),
             ]
         )
 
+    def _on_pre_connect(self, _client: mqtt.Client, _userdata: Any) -> None:
+        """Record when a connection attempt starts (instrumentation only)."""
+        self._connect_started = time.monotonic()
+
+    def _on_socket_open(self, _client: mqtt.Client, _userdata: Any, _sock: Any) -> None:
+        """Record TCP connect and TLS handshake time (instrumentation only)."""
+        self._socket_opened = time.monotonic()
+        if self._ingest is not None and self._connect_started is not None:
+            self._ingest.tls_handshake = self._socket_opened - self._connect_started
+
     def _on_connect(
         self,
         _client: mqtt.Client,
@@ -256,6 +465,14 @@ class EatonUpsMqttClient:
                 connect_flags.session_present,
             )
             self._mqtt_connected = True
+            if self._ingest is not None:
+                if self._socket_opened is not None:
+                    self._ingest.connack_latency = (
+                        time.monotonic() - self._socket_opened
+                    )
+                if self._has_connected:
+                    self._ingest.reconnects += 1
+            self._has_connected = True
             # Resubscribe to topics on reconnect
             self._subscribe_to_topics()
 
@@ -287,38 +504,46 @@ class EatonUpsMqttClient:
         try:
             topic = msg.topic
             logger.debug("MQTT message received: %s", topic)
-            payload = msg.payload.decode("utf-8")
+            received = time.monotonic()
+            ingest = self._ingest
+            if ingest is not None:
+                ingest.record_message(len(msg.payload))
 
-            # Try to parse as JSON if possible
-            data = json.loads(payload)
-
-            # Detect prefix from first message
-            if self._mqtt_prefix is None:
-                for prefix in MQTT_SUPPORTED_PREFIXES:
-                    if topic.startswith(prefix):
-                        self._mqtt_prefix = prefix
-                        logger.info("Detected MQTT prefix: %s", prefix)
-                        break
-                else:
-                    logger.warning("Unknown MQTT topic prefix: %s", topic)
-                    return
-
-            if not topic.startswith(self._mqtt_prefix):
+            if not self._match_prefix(topic):
                 return
 
             # Store in the data dictionary using flat structure
             # Topics are stored without the version prefix and payload data
             # is stored without modifications. This makes it possible to use
             # the storage key for direct lookups in the data dictionary.
-            key = topic.removeprefix(self._mqtt_prefix)
+            key = topic.removeprefix(self._mqtt_prefix or "")
+
+            # The card republishes its whole tree every few seconds (see the
+            # publish cadence in const.py); skip decoding and dispatch when
+            # the payload is unchanged.
+            if self._topic_payloads.get(key) == msg.payload:
+                self._topic_received_at[key] = received
+                if ingest is not None:
+                    ingest.duplicates += 1
+                return
+
+            # Try to parse as JSON if possible
+            if ingest is None:
+                data = json.loads(msg.payload.decode("utf-8"))
+            else:
+                start = time.perf_counter()
+                data = json.loads(msg.payload.decode("utf-8"))
+                ingest.decode_samples.append(time.perf_counter() - start)
+
             self._mqtt_data[key] = data
+            self._topic_payloads[key] = msg.payload
+            self._topic_received_at[key] = received
+            # Only the network thread writes, so the increment cannot race
+            self._version += 1
+            self._topic_versions[key] = self._version
+            self._suppliers.observe(key, data)
 
-            # Use the event loop to safely notify callbacks
-            if self._loop and self._update_callbacks:
-                for callback in self._update_callbacks:
-                    self._loop.call_soon_threadsafe(
-                        lambda cb=callback: cb(self._mqtt_data)
-                    )
+            self._schedule_dispatch(key, received)
 
         except json.JSONDecodeError as e:
             # Just log the error and continue
@@ -328,6 +553,88 @@ class EatonUpsMqttClient:
             # Just log the error and continue
             logger.exception("Error processing MQTT message")
 
+    def _match_prefix(self, topic: str) -> bool:
+        """Detect the prefix from the first message and match topics against it."""
+        if self._mqtt_prefix is None:
+            for prefix in MQTT_SUPPORTED_PREFIXES:
+                if topic.startswith(prefix):
+                    self._mqtt_prefix = prefix
+                    logger.info("Detected MQTT prefix: %s", prefix)
+                    break
+            else:
+                logger.warning("Unknown MQTT topic prefix: %s", topic)
+                return False
+
+        return topic.startswith(self._mqtt_prefix)
+
+    def _schedule_dispatch(self, key: str, received: float) -> None:
+        """
+        Hand an update over to the event loop.
+
+        Critical topics are queued for immediate dispatch. Everything else
+        only arms a single coalescing flush, so a full-tree republish turns
+        into one coordinator update instead of one per topic.
+        """
+        if self._loop is None:
+            return
+        if key in self._topic_callbacks:
+            self._loop.call_soon_threadsafe(self._dispatch_topic, key)
+        if self._change_callbacks:
+            # deque appends and pops are thread-safe, unlike swapping a set
+            self._changed_keys.append(key)
+        elif not self._update_callbacks:
+            return
+        if key in self._critical_topics:
+            self._loop.call_soon_threadsafe(self._dispatch_critical, key, received)
+        elif not self._flush_pending:
+            self._flush_pending = True
+            self._loop.call_soon_threadsafe(self._schedule_flush, time.monotonic())
+
+    def _dispatch_topic(self, key: str) -> None:
+        """Notify the subscribers of a single topic."""
+        data = self._mqtt_data.get(key)
+        for callback in list(self._topic_callbacks.get(key, ())):
+            callback(data)
+
+    def _dispatch_critical(self, key: str, received: float) -> None:
+        """Notify callbacks for a critical topic and record its latency."""
+        if self._ingest is not None:
+            self._ingest.dispatch_lag_samples.append(time.monotonic() - received)
+        self._notify_update_callbacks()
+        latency = time.monotonic() - received
+        self._critical_latency[key] = latency
+        for callback in list(self._latency_callbacks):
+            callback(key, latency)
+
+    def _schedule_flush(self, scheduled: float) -> None:
+        """Arm the coalescing timer for bulk updates."""
+        if self._ingest is not None:
+            self._ingest.dispatch_lag_samples.append(time.monotonic() - scheduled)
+        if self._loop is not None:
+            self._flush_handle = self._loop.call_later(
+                MQTT_COALESCE_WINDOW, self._flush_updates
+            )
+
+    def _flush_updates(self) -> None:
+        """Notify callbacks of all bulk updates received during the window."""
+        self._flush_handle = None
+        # Clear before reading the data so later messages arm a new flush
+        self._flush_pending = False
+        self._notify_update_callbacks()
+
+    def _notify_update_callbacks(self) -> None:
+        """Notify all update callbacks with the current data."""
+        for callback in list(self._update_callbacks):
+            callback(self._mqtt_data)
+        if not self._changed_keys:
+            return
+        changed = set()
+        # Only drain what is queued now; later keys go into the next batch
+        for _ in range(len(self._changed_keys)):
+            changed.add(self._changed_keys.popleft())
+        for change_callback in list(self._change_callbacks):
+            change_callback(changed)
+
     async def _create_temp_cert_files(self) -> list[str]:
         """Create temporary certificate files and return their paths."""
         # Create temp files in the executor to avoid blocking
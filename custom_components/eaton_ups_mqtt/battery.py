@@ -0,0 +1,309 @@
+"""Battery discharge analytics for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    BATTERY_CURVE_SIZE,
+    BATTERY_MAX_DISCHARGES,
+    BATTERY_MIN_DISCHARGE_DURATION,
+    BATTERY_MIN_SOC_DROP,
+    BATTERY_SAVE_DELAY,
+    BATTERY_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from .listeners import async_register_listener
+from .payload import get_number
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from .api import EatonUpsMqttClient
+
+POWER_BANK_MEASURES_TOPIC = "powerDistributions/1/backupSystem/powerBank/measures"
+POWER_BANK_STATUS_TOPIC = "powerDistributions/1/backupSystem/powerBank/status"
+OUTPUT_MEASURES_TOPIC = "powerDistributions/1/outputs/1/measures"
+
+STORAGE_VERSION = 1
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_YEAR = 365 * 24 * SECONDS_PER_HOUR
+
+# Points needed for a curve integral and for a regression line
+MIN_POINTS = 2
+
+# Curve channels, in the order samples are appended
+CURVE_CHANNELS = ("elapsed", "soc", "voltage", "power")
+
+
+class DischargeCurve:
+    """
+    Fixed-size voltage and state of charge curve of one discharge.
+
+    Samples go into parallel array('d') buffers. When the buffers fill up,
+    every other sample is dropped and only every other incoming sample is
+    kept from then on, so a discharge of any length fits the same size with
+    evenly spread samples.
+    """
+
+    def __init__(self, size: int = BATTERY_CURVE_SIZE) -> None:
+        """Initialize an empty curve."""
+        self._size = size
+        self._stride = 1
+        self._skipped = 0
+        self.channels = {channel: array("d") for channel in CURVE_CHANNELS}
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.channels["elapsed"])
+
+    def append(self, elapsed: float, soc: float, voltage: float, power: float) -> None:
+        """Add a sample, thinning the curve out when it is full."""
+        self._skipped += 1
+        if self._skipped < self._stride:
+            return
+        self._skipped = 0
+        if len(self) >= self._size:
+            for channel, values in self.channels.items():
+                self.channels[channel] = values[::2]
+            self._stride *= 2
+        for channel, value in zip(
+            CURVE_CHANNELS, (elapsed, soc, voltage, power), strict=True
+        ):
+            self.channels[channel].append(value)
+
+    def as_dict(self) -> dict[str, list[float]]:
+        """Return the curve as lists for storage."""
+        return {channel: values.tolist() for channel, values in self.channels.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class BatteryAnalysis:
+    """Capacity estimate and fade derived from recorded discharges."""
+
+    capacity: float | None = None
+    capacity_fade: float | None = None
+    discharges: int = 0
+
+
+def discharge_capacity(curve: Mapping[str, Sequence[float]]) -> float | None:
+    """
+    Return the full capacity in Wh implied by one discharge curve.
+
+    The energy delivered is the trapezoidal integral of the output power,
+    scaled up from the state of charge the discharge consumed.
+    """
+    elapsed = curve.get("elapsed") or ()
+    soc = curve.get("soc") or ()
+    power = curve.get("power") or ()
+    if len(elapsed) < MIN_POINTS or not len(elapsed) == len(soc) == len(power):
+        return None
+    drop = soc[0] - soc[-1]
+    if drop < BATTERY_MIN_SOC_DROP:
+        return None
+    energy = sum(
+        (power[i] + power[i - 1]) * (elapsed[i] - elapsed[i - 1])
+        for i in range(1, len(elapsed))
+    ) / (2 * SECONDS_PER_HOUR)
+    if energy <= 0:
+        return None
+    return energy * 100 / drop
+
+
+def analyze_discharges(discharges: Sequence[Mapping[str, Any]]) -> BatteryAnalysis:
+    """
+    Fit capacity against time over all recorded discharges.
+
+    Runs in the executor. The capacity is the least-squares fit at the most
+    recent discharge, and the fade the fitted yearly loss relative to the
+    fit at the oldest one.
+    """
+    points = [
+        (discharge["start"], capacity)
+        for discharge in discharges
+        if (capacity := discharge_capacity(discharge["curve"])) is not None
+    ]
+    if not points:
+        return BatteryAnalysis(discharges=len(discharges))
+    starts = [start for start, _ in points]
+    capacities = [capacity for _, capacity in points]
+    if len(set(starts)) < MIN_POINTS:
+        return BatteryAnalysis(
+            capacity=round(statistics.fmean(capacities), 1),
+            discharges=len(discharges),
+        )
+    slope, intercept = statistics.linear_regression(starts, capacities)
+    first = slope * min(starts) + intercept
+    latest = slope * max(starts) + intercept
+    fade = -slope * SECONDS_PER_YEAR * 100 / first if first > 0 else None
+    return BatteryAnalysis(
+        capacity=round(latest, 1),
+        capacity_fade=None if fade is None else round(fade, 2),
+        discharges=len(discharges),
+    )
+
+
+class BatteryAnalytics:
+    """
+    Record battery discharges and derive capacity and runtime from them.
+
+    A discharge lasts while the power bank supplies the load. Its state of
+    charge, voltage and output power are sampled into a fixed-size curve,
+    and finished discharges are persisted. The regression over all of them
+    runs in the executor once at startup and once per finished discharge,
+    never on the ingest path. The runtime estimate scales the fitted
+    capacity by the current state of charge and load.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the analytics."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.battery"
+        )
+        self._discharges: list[dict[str, Any]] = []
+        self._measures: dict[str, Any] = {}
+        self._power: float | None = None
+        self._curve: DischargeCurve | None = None
+        self._started = 0.0
+        self._started_at = 0.0
+        self._analysis = BatteryAnalysis()
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.snapshot: dict[str, Any] = {}
+
+    @property
+    def discharging(self) -> bool:
+        """Return whether a discharge is being recorded."""
+        return self._curve is not None
+
+    async def async_start(
+        self, client: EatonUpsMqttClient, data: Mapping[str, Any]
+    ) -> None:
+        """Load the recorded discharges and follow the power bank topics."""
+        if self._unsubscribes:
+            return
+        if (stored := await self._store.async_load()) is not None:
+            self._discharges = list(stored.get("discharges", ()))
+        handlers: dict[str, Callable[[Any], None]] = {
+            POWER_BANK_MEASURES_TOPIC: self._handle_measures,
+            OUTPUT_MEASURES_TOPIC: self._handle_output,
+            POWER_BANK_STATUS_TOPIC: self._handle_status,
+        }
+        for topic, handler in handlers.items():
+            self._unsubscribes.append(client.subscribe_to_topic(topic, handler))
+            handler(data.get(topic))
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_publish,
+            timedelta(seconds=BATTERY_UPDATE_INTERVAL),
+            cancel_on_shutdown=True,
+        )
+        await self._async_analyze()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the power bank topics."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener after every published snapshot.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @callback
+    def _handle_measures(self, payload: Any) -> None:
+        """Keep the latest power bank measures and sample a discharge."""
+        if not isinstance(payload, dict):
+            return
+        self._measures = payload
+        soc = get_number(payload, "stateOfCharge")
+        voltage = get_number(payload, "voltage")
+        if self._curve is None or soc is None or voltage is None:
+            return
+        self._curve.append(
+            time.monotonic() - self._started, soc, voltage, self._power or 0.0
+        )
+
+    @callback
+    def _handle_output(self, payload: Any) -> None:
+        """Keep the latest output power."""
+        self._power = get_number(payload, "activePower")
+
+    @callback
+    def _handle_status(self, payload: Any) -> None:
+        """Start or finish a discharge when the power bank supply changes."""
+        if not isinstance(payload, dict):
+            return
+        supplying = bool(payload.get("supply"))
+        if supplying and self._curve is None:
+            self._curve = DischargeCurve()
+            self._started = time.monotonic()
+            self._started_at = time.time()
+            self._handle_measures(self._measures)
+        elif not supplying and self._curve is not None:
+            self._finish_discharge()
+
+    @callback
+    def _finish_discharge(self) -> None:
+        """Persist a finished discharge and refit in the executor."""
+        curve, self._curve = self._curve, None
+        duration = time.monotonic() - self._started
+        if curve is None or duration < BATTERY_MIN_DISCHARGE_DURATION:
+            return
+        self._discharges.append(
+            {"start": self._started_at, "duration": duration, "curve": curve.as_dict()}
+        )
+        del self._discharges[:-BATTERY_MAX_DISCHARGES]
+        self._store.async_delay_save(self._data_to_save, BATTERY_SAVE_DELAY)
+        self._hass.async_create_task(self._async_analyze())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the recorded discharges for storage."""
+        return {"discharges": self._discharges}
+
+    async def _async_analyze(self) -> None:
+        """Refit the recorded discharges in the executor and publish."""
+        self._analysis = await self._hass.async_add_executor_job(
+            analyze_discharges, list(self._discharges)
+        )
+        self._async_publish()
+
+    def _runtime(self) -> float | None:
+        """Return the runtime in seconds at the current charge and load."""
+        capacity = self._analysis.capacity
+        soc = get_number(self._measures, "stateOfCharge")
+        if capacity is None or soc is None or not self._power or self._power <= 0:
+            return None
+        return round(capacity * soc / 100 / self._power * SECONDS_PER_HOUR)
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Publish a new snapshot and notify listeners."""
+        self.snapshot = {
+            "capacity": self._analysis.capacity,
+            "capacity_fade": self._analysis.capacity_fade,
+            "discharges": self._analysis.discharges,
+            "estimated_runtime": self._runtime(),
+        }
+        for listener in list(self._listeners):
+            listener()
@@ -12,6 +12,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.helpers.entity import EntityCategory
 
+from .distributions import (
+    TEMPLATE_PREFIX,
+    DistributionLayout,
+    get_descriptions,
+    index_distributions,
+)
 from .entity import EatonUpsEntity
 
 if TYPE_CHECKING:
@@ -21,159 +27,171 @@ if TYPE_CHECKING:
     from .coordinator import EatonUPSDataUpdateCoordinator
     from .data import EatonUpsConfigEntry
 
-BASE_ENTITY_DESCRIPTIONS = (
-    # UPS Status
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$bootloaderMode",
-        name="Bootloader Mode",
-        translation_key="bootloader_mode",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$communicationFault",
-        name="Communication Fault",
-        translation_key="communication_fault",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$configurationFault",
-        name="Configuration Fault",
-        translation_key="configuration_fault",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$emergencySwitchOff",
-        name="Emergency Switch Off",
-        translation_key="emergency_switch_off",
-        device_class=BinarySensorDeviceClass.SAFETY,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$fanFault",
-        name="Fan Fault",
-        translation_key="fan_fault",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$internalFailure",
-        name="Internal Failure",
-        translation_key="internal_failure",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$shutdownImminent",
-        name="Shutdown Imminent",
-        translation_key="shutdown_imminent",
-        device_class=BinarySensorDeviceClass.SAFETY,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$systemAlarm",
-        name="System Alarm",
-        translation_key="system_alarm",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/status$temperatureOutOfRange",
-        name="Temperature Out Of Range",
-        translation_key="temperature_out_of_range",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    # Battery Status
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$criticalLowStateOfCharge",
-        name="Critical Low Battery",
-        translation_key="critical_low_battery",
-        device_class=BinarySensorDeviceClass.SAFETY,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$internalFailure",
-        name="Battery Internal Failure",
-        translation_key="battery_internal_failure",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lcmExpired",
-        name="Battery Expired",
-        translation_key="battery_expired",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lowStateOfCharge",
-        name="Low Battery",
-        translation_key="low_battery",
-        device_class=BinarySensorDeviceClass.BATTERY,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$supplied",
-        name="Battery Supplied",
-        translation_key="battery_supplied",
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$supply",
-        name="Battery Supply",
-        translation_key="battery_supply",
-        device_class=BinarySensorDeviceClass.POWER,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$testFailed",
-        name="Battery Test Failed",
-        translation_key="battery_test_failed",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    # Charger Status
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$active",
-        name="Charger Active",
-        translation_key="charger_active",
-        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$enabled",
-        name="Charger Enabled",
-        translation_key="charger_enabled",
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$installed",
-        name="Charger Installed",
-        translation_key="charger_installed",
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$internalFailure",
-        name="Charger Internal Failure",
-        translation_key="charger_internal_failure",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$supply",
-        name="Charger Supply",
-        translation_key="charger_supply",
-        device_class=BinarySensorDeviceClass.POWER,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$voltageTooHigh",
-        name="Charger Voltage Too High",
-        translation_key="charger_voltage_too_high",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$voltageTooLow",
-        name="Charger Voltage Too Low",
-        translation_key="charger_voltage_too_low",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-    # Environment Status
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/environment/status$buildingAlarm1",
-        name="Building Alarm",
-        translation_key="building_alarm",
-        device_class=BinarySensorDeviceClass.SAFETY,
-    ),
-    BinarySensorEntityDescription(
-        key="powerDistributions/1/environment/status$temperatureTooHigh",
-        name="Temperature Too High",
-        translation_key="temperature_too_high",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-    ),
-)
+
+def _generate_base_descriptions() -> tuple[BinarySensorEntityDescription, ...]:
+    """Return the descriptions of entities that are not discovered dynamically."""
+    return (
+        # UPS Status
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$bootloaderMode",
+            name="Bootloader Mode",
+            translation_key="bootloader_mode",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$communicationFault",
+            name="Communication Fault",
+            translation_key="communication_fault",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$configurationFault",
+            name="Configuration Fault",
+            translation_key="configuration_fault",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$emergencySwitchOff",
+            name="Emergency Switch Off",
+            translation_key="emergency_switch_off",
+            device_class=BinarySensorDeviceClass.SAFETY,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$fanFault",
+            name="Fan Fault",
+            translation_key="fan_fault",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$internalFailure",
+            name="Internal Failure",
+            translation_key="internal_failure",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$shutdownImminent",
+            name="Shutdown Imminent",
+            translation_key="shutdown_imminent",
+            device_class=BinarySensorDeviceClass.SAFETY,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$systemAlarm",
+            name="System Alarm",
+            translation_key="system_alarm",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/status$temperatureOutOfRange",
+            name="Temperature Out Of Range",
+            translation_key="temperature_out_of_range",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        # Battery Status
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$criticalLowStateOfCharge",
+            name="Critical Low Battery",
+            translation_key="critical_low_battery",
+            device_class=BinarySensorDeviceClass.SAFETY,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$internalFailure",
+            name="Battery Internal Failure",
+            translation_key="battery_internal_failure",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lcmExpired",
+            name="Battery Expired",
+            translation_key="battery_expired",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lowStateOfCharge",
+            name="Low Battery",
+            translation_key="low_battery",
+            device_class=BinarySensorDeviceClass.BATTERY,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$supplied",
+            name="Battery Supplied",
+            translation_key="battery_supplied",
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$supply",
+            name="Battery Supply",
+            translation_key="battery_supply",
+            device_class=BinarySensorDeviceClass.POWER,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$testFailed",
+            name="Battery Test Failed",
+            translation_key="battery_test_failed",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        # Charger Status
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$active",
+            name="Charger Active",
+            translation_key="charger_active",
+            device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$enabled",
+            name="Charger Enabled",
+            translation_key="charger_enabled",
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$installed",
+            name="Charger Installed",
+            translation_key="charger_installed",
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$internalFailure",
+            name="Charger Internal Failure",
+            translation_key="charger_internal_failure",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$supply",
+            name="Charger Supply",
+            translation_key="charger_supply",
+            device_class=BinarySensorDeviceClass.POWER,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$voltageTooHigh",
+            name="Charger Voltage Too High",
+            translation_key="charger_voltage_too_high",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$voltageTooLow",
+            name="Charger Voltage Too Low",
+            translation_key="charger_voltage_too_low",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        # Environment Status
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/environment/status$buildingAlarm1",
+            name="Building Alarm",
+            translation_key="building_alarm",
+            device_class=BinarySensorDeviceClass.SAFETY,
+        ),
+        BinarySensorEntityDescription(
+            key="powerDistributions/1/environment/status$temperatureTooHigh",
+            name="Temperature Too High",
+            translation_key="temperature_too_high",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+    )
+
+
+def _generate_card_descriptions() -> tuple[BinarySensorEntityDescription, ...]:
+    """Return the card-level base descriptions."""
+    return tuple(
+        description
+        for description in _generate_base_descriptions()
+        if not description.key.startswith(TEMPLATE_PREFIX)
+    )
 
 
 def _generate_input_binary_descriptions(
@@ -257,6 +275,46 @@ def _generate_outlet_binary_descriptions(
     )
 
 
+def _generate_distribution_binary_descriptions() -> tuple[
+    BinarySensorEntityDescription, ...
+]:
+    """Return the base descriptions rebased onto every powerDistribution."""
+    return tuple(
+        description
+        for description in _generate_base_descriptions()
+        if description.key.startswith(TEMPLATE_PREFIX)
+    )
+
+
+def _get_distribution_binary_descriptions(
+    layout: DistributionLayout, distribution_id: str
+) -> list[BinarySensorEntityDescription]:
+    """Select the shared descriptions that apply to one distribution."""
+    descriptions = list(
+        get_descriptions(
+            _generate_distribution_binary_descriptions,
+            distribution_id=distribution_id,
+        )
+    )
+    for input_num in layout.numbers("inputs"):
+        descriptions.extend(
+            get_descriptions(
+                _generate_input_binary_descriptions,
+                input_num,
+                distribution_id=distribution_id,
+            )
+        )
+    for outlet_num in layout.numbers("outlets"):
+        descriptions.extend(
+            get_descriptions(
+                _generate_outlet_binary_descriptions,
+                outlet_num,
+                distribution_id=distribution_id,
+            )
+        )
+    return descriptions
+
+
 SENSOR_DIGITAL_INPUT_PATTERN = re.compile(
     r"^sensors/devices/([^/]+)/channels/digitalInputs/([^/]+)/measures$"
 )
@@ -316,23 +374,13 @@ def get_binary_entity_descriptions(
     coordinator: EatonUPSDataUpdateCoordinator,
 ) -> tuple[BinarySensorEntityDescription, ...]:
     """Get binary entity descriptions based on available MQTT topics."""
-    descriptions = list(BASE_ENTITY_DESCRIPTIONS)
-
-    # Detect inputs
-    for input_num in range(1, 10):  # Check reasonable range
-        if any(
-            key.startswith(f"powerDistributions/1/inputs/{input_num}/")
-            for key in coordinator.data
-        ):
-            descriptions.extend(_generate_input_binary_descriptions(input_num))
-
-    # Detect outlets
-    for outlet_num in range(1, 10):
-        if any(
-            key.startswith(f"powerDistributions/1/outlets/{outlet_num}/")
-            for key in coordinator.data
-        ):
-            descriptions.extend(_generate_outlet_binary_descriptions(outlet_num))
+    descriptions = list(get_descriptions(_generate_card_descriptions))
+
+    # Detect distributions with their inputs and outlets
+    for distribution_id, layout in index_distributions(coordinator.data).items():
+        descriptions.extend(
+            _get_distribution_binary_descriptions(layout, distribution_id)
+        )
 
     # Detect environmental sensor probe channels
     for key in coordinator.data:
@@ -392,8 +440,7 @@ class EatonUpsBinarySensor(EatonUpsEntity, BinarySensorEntity):
         entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
-        self.entity_description = entity_description
+        super().__init__(coordinator, entity_description)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
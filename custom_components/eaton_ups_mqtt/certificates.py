@@ -7,10 +7,6 @@ import ssl
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from cryptography import x509
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-
 from .const import CERT_DEFAULT_CN, CERT_KEY_SIZE, CERT_VALIDITY_YEARS
 
 if TYPE_CHECKING:
@@ -30,6 +26,11 @@ def generate_client_certificate(common_name: str) -> tuple[str, str]:
         Tuple of (certificate PEM, private key PEM).
 
     """
+    # cryptography is slow to import and unused once certificates are stored
+    from cryptography import x509  # noqa: PLC0415
+    from cryptography.hazmat.primitives import hashes, serialization  # noqa: PLC0415
+    from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: PLC0415
+
     key = rsa.generate_private_key(public_exponent=65537, key_size=CERT_KEY_SIZE)
 
     subject = issuer = x509.Name(
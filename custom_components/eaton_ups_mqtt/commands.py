@@ -0,0 +1,228 @@
+"""UPS commands confirmed through status topics for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .alarms import ACTIVE_ALARMS_TOPIC, get_alarm_id
+from .api import EatonUpsCommandError
+from .battery import POWER_BANK_STATUS_TOPIC
+from .const import (
+    COMMAND_BATTERY_TEST_TIMEOUT,
+    COMMAND_TIMEOUT,
+    MQTT_SUPPORTED_PREFIXES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+BATTERY_TEST_ACTION = "powerDistributions/1/batteries/test/actions/deepTest"
+OUTLET_ACTION = "powerDistributions/1/outlets/{outlet_num}/actions/{action}"
+OUTLET_STATUS_TOPIC = "powerDistributions/1/outlets/{outlet_num}/status"
+OUTLET_SPECIFICATIONS_TOPIC = "powerDistributions/1/outlets/{outlet_num}/specifications"
+ALARM_TOPIC_PREFIX = f"{ACTIVE_ALARMS_TOPIC}/"
+ALARM_ACKNOWLEDGE_ACTION = "{alarm_topic}/actions/acknowledge"
+
+# Power bank status fields that change once a battery test starts or ends
+BATTERY_TEST_FIELDS = ("testStatus", "lastTestResultDate")
+
+
+@dataclass(frozen=True, slots=True)
+class Command:
+    """A command and the status topic change that confirms it."""
+
+    action: str
+    confirm_topic: str
+    # Called with the confirming payload and the payload when it was sent
+    confirmed: Callable[[Any, Any], bool]
+    timeout: float = COMMAND_TIMEOUT
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+def _battery_test_changed(payload: Any, baseline: Any) -> bool:
+    """Return whether the battery test state moved since the command."""
+    if not isinstance(payload, dict):
+        return False
+    before = baseline if isinstance(baseline, dict) else {}
+    return any(payload.get(key) != before.get(key) for key in BATTERY_TEST_FIELDS)
+
+
+def _outlet_switched(payload: Any, _baseline: Any, *, switched_on: bool) -> bool:
+    """Return whether the outlet reports the requested switch state."""
+    return isinstance(payload, dict) and payload.get("switchedOn") is switched_on
+
+
+def _alarm_acknowledged(payload: Any, _baseline: Any, *, alarm_id: str) -> bool:
+    """Return whether the alarm is acknowledged or no longer active."""
+    if not isinstance(payload, dict):
+        return False
+    for member in payload.get("members") or ():
+        if isinstance(member, dict) and get_alarm_id(member) == alarm_id:
+            return member.get("acknowledged") is True
+    return True
+
+
+def alarm_topic(alarm_id: str) -> str | None:
+    """
+    Return the topic of an active alarm, without the version prefix.
+
+    Members without an id are identified by their @id link, such as
+    "/mbdetnrs/1.0/alarmService/activeAlarms/x", whose path is the topic.
+    Returns None when the id names no active alarm.
+    """
+    if "/" not in alarm_id:
+        return f"{ALARM_TOPIC_PREFIX}{alarm_id}" if alarm_id else None
+    topic = alarm_id.removeprefix("/")
+    for prefix in MQTT_SUPPORTED_PREFIXES:
+        topic = topic.removeprefix(prefix)
+    name = topic.removeprefix(ALARM_TOPIC_PREFIX)
+    if name == topic or not name or "/" in name:
+        return None
+    return topic
+
+
+def battery_test_command() -> Command:
+    """Return the command that starts a deep battery test."""
+    return Command(
+        action=BATTERY_TEST_ACTION,
+        confirm_topic=POWER_BANK_STATUS_TOPIC,
+        confirmed=_battery_test_changed,
+        timeout=COMMAND_BATTERY_TEST_TIMEOUT,
+    )
+
+
+def outlet_switch_command(outlet_num: int, *, switched_on: bool) -> Command:
+    """Return the command that switches an outlet on or off."""
+    return Command(
+        action=OUTLET_ACTION.format(
+            outlet_num=outlet_num, action="switchOn" if switched_on else "switchOff"
+        ),
+        confirm_topic=OUTLET_STATUS_TOPIC.format(outlet_num=outlet_num),
+        confirmed=partial(_outlet_switched, switched_on=switched_on),
+    )
+
+
+def alarm_acknowledge_command(alarm_id: str) -> Command:
+    """
+    Return the command that acknowledges an active alarm.
+
+    Raises ValueError when the alarm id names no active alarm.
+    """
+    if (topic := alarm_topic(alarm_id)) is None:
+        msg = f"Alarm {alarm_id} has no topic to acknowledge"
+        raise ValueError(msg)
+    return Command(
+        action=ALARM_ACKNOWLEDGE_ACTION.format(alarm_topic=topic),
+        confirm_topic=ACTIVE_ALARMS_TOPIC,
+        confirmed=partial(_alarm_acknowledged, alarm_id=alarm_id),
+    )
+
+
+@dataclass(slots=True, eq=False)
+class _PendingCommand:
+    """A sent command waiting for its confirmation."""
+
+    command: Command
+    baseline: Any
+    future: asyncio.Future[Any]
+
+
+class CommandDispatcher:
+    """
+    Send commands and wait for the status topics that confirm them.
+
+    The card publishes no replies, so a command resolves when its confirming
+    topic arrives in the requested state. Every command waits on its own
+    future with its own timeout, so commands in flight never block each
+    other. A confirming topic is only subscribed while a command awaits it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        self._client: EatonUpsMqttClient | None = None
+        self._data: Mapping[str, Any] = {}
+        self._pending: dict[str, list[_PendingCommand]] = {}
+        self._unsubscribes: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Send commands through client, reading current status from data."""
+        self._client = client
+        self._data = data
+
+    @callback
+    def async_stop(self) -> None:
+        """Fail the commands in flight and drop the topic subscriptions."""
+        self._client = None
+        for pending in self._pending.values():
+            for command in pending:
+                if not command.future.done():
+                    command.future.set_exception(
+                        EatonUpsCommandError("UPS connection closed")
+                    )
+        self._pending.clear()
+        for unsubscribe in self._unsubscribes.values():
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    async def async_send(self, command: Command) -> Any:
+        """
+        Send a command and return the payload that confirmed it.
+
+        Raises EatonUpsCommandError when no confirmation arrives in time.
+        """
+        if self._client is None:
+            msg = "UPS connection is not set up"
+            raise EatonUpsCommandError(msg)
+        topic = command.confirm_topic
+        pending = _PendingCommand(
+            command,
+            self._data.get(topic),
+            asyncio.get_running_loop().create_future(),
+        )
+        waiting = self._pending.setdefault(topic, [])
+        if not waiting:
+            self._unsubscribes[topic] = self._client.subscribe_to_topic(
+                topic, partial(self._handle_status, topic)
+            )
+        waiting.append(pending)
+        try:
+            await self._client.async_publish_command(command.action, command.payload)
+            # Unchanged payloads are never dispatched, so a command that asks
+            # for the current state is confirmed by the state already held
+            self._handle_status(topic, self._data.get(topic))
+            async with asyncio.timeout(command.timeout):
+                return await pending.future
+        except TimeoutError as err:
+            msg = f"{command.action} not confirmed within {command.timeout:g} s"
+            raise EatonUpsCommandError(msg) from err
+        finally:
+            self._discard(topic, pending)
+
+    @callback
+    def _handle_status(self, topic: str, payload: Any) -> None:
+        """Resolve the commands that payload confirms."""
+        for pending in list(self._pending.get(topic, ())):
+            if not pending.future.done() and pending.command.confirmed(
+                payload, pending.baseline
+            ):
+                pending.future.set_result(payload)
+
+    @callback
+    def _discard(self, topic: str, pending: _PendingCommand) -> None:
+        """Forget a finished command, unsubscribing its topic when idle."""
+        waiting = self._pending.get(topic)
+        if waiting is None or pending not in waiting:
+            return
+        waiting.remove(pending)
+        if not waiting:
+            del self._pending[topic]
+            if (unsubscribe := self._unsubscribes.pop(topic, None)) is not None:
+                unsubscribe()
@@ -15,6 +15,7 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
@@ -32,8 +33,22 @@ from .certificates import (
 from .const import (
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_CRITICAL_TOPICS,
+    CONF_EXPERIMENTAL_COMMANDS,
+    CONF_FLEET,
+    CONF_INGEST_DIAGNOSTICS,
+    CONF_MEASUREMENT_HISTORY,
+    CONF_METRICS_EXPORTER,
+    CONF_PQ_FREQUENCY_TOLERANCE,
+    CONF_PQ_SAG_THRESHOLD,
+    CONF_PQ_SWELL_THRESHOLD,
     CONF_SERVER_CERT,
+    CONF_STATISTICS_MODE,
+    DEFAULT_CRITICAL_TOPICS,
     DEFAULT_PORT,
+    DEFAULT_PQ_FREQUENCY_TOLERANCE,
+    DEFAULT_PQ_SAG_THRESHOLD,
+    DEFAULT_PQ_SWELL_THRESHOLD,
     DOMAIN,
     LOGGER,
     MQTT_TIMEOUT,
@@ -63,6 +78,39 @@ PEM_CERT_SELECTOR = selector.TextSelector(
         type=selector.TextSelectorType.TEXT,
     ),
 )
+TOPIC_LIST_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(
+        multiple=True,
+        type=selector.TextSelectorType.TEXT,
+    ),
+)
+SAG_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        mode=selector.NumberSelectorMode.BOX,
+        min=50,
+        max=99,
+        step=1,
+        unit_of_measurement="%",
+    )
+)
+SWELL_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        mode=selector.NumberSelectorMode.BOX,
+        min=101,
+        max=150,
+        step=1,
+        unit_of_measurement="%",
+    )
+)
+FREQUENCY_TOLERANCE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        mode=selector.NumberSelectorMode.BOX,
+        min=0.1,
+        max=10,
+        step=0.1,
+        unit_of_measurement="%",
+    )
+)
 PEM_KEY_SELECTOR = selector.TextSelector(
     selector.TextSelectorConfig(
         multiline=True,
@@ -85,6 +133,14 @@ class EatonUpsFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry,
+    ) -> EatonUpsOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return EatonUpsOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -312,6 +368,87 @@ class EatonUpsFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         await client.async_get_data()
 
 
+class EatonUpsOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow handler for Eaton UPS integration."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the integration options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_INGEST_DIAGNOSTICS,
+                        default=self.config_entry.options.get(
+                            CONF_INGEST_DIAGNOSTICS, False
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MEASUREMENT_HISTORY,
+                        default=self.config_entry.options.get(
+                            CONF_MEASUREMENT_HISTORY, False
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_STATISTICS_MODE,
+                        default=self.config_entry.options.get(
+                            CONF_STATISTICS_MODE, False
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_METRICS_EXPORTER,
+                        default=self.config_entry.options.get(
+                            CONF_METRICS_EXPORTER, False
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_FLEET,
+                        default=self.config_entry.options.get(CONF_FLEET, False),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_EXPERIMENTAL_COMMANDS,
+                        default=self.config_entry.options.get(
+                            CONF_EXPERIMENTAL_COMMANDS, False
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_PQ_SAG_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_PQ_SAG_THRESHOLD, DEFAULT_PQ_SAG_THRESHOLD
+                        ),
+                    ): SAG_THRESHOLD_SELECTOR,
+                    vol.Required(
+                        CONF_PQ_SWELL_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_PQ_SWELL_THRESHOLD, DEFAULT_PQ_SWELL_THRESHOLD
+                        ),
+                    ): SWELL_THRESHOLD_SELECTOR,
+                    vol.Required(
+                        CONF_PQ_FREQUENCY_TOLERANCE,
+                        default=self.config_entry.options.get(
+                            CONF_PQ_FREQUENCY_TOLERANCE,
+                            DEFAULT_PQ_FREQUENCY_TOLERANCE,
+                        ),
+                    ): FREQUENCY_TOLERANCE_SELECTOR,
+                    vol.Required(
+                        CONF_CRITICAL_TOPICS,
+                        default=list(
+                            self.config_entry.options.get(
+                                CONF_CRITICAL_TOPICS, DEFAULT_CRITICAL_TOPICS
+                            )
+                        ),
+                    ): TOPIC_LIST_SELECTOR,
+                },
+            ),
+        )
+
+
 def _write_temp_cert(content: str) -> str:
     """Write a PEM string to a temporary file and return its path."""
     with tempfile.NamedTemporaryFile(delete=False) as f:
@@ -12,6 +12,17 @@ CONF_SERVER_CERT: Final = "server_cert"
 CONF_CLIENT_KEY: Final = "client_key"
 CONF_CLIENT_CERT: Final = "client_cert"
 
+CONF_INGEST_DIAGNOSTICS: Final = "ingest_diagnostics"
+CONF_CRITICAL_TOPICS: Final = "critical_topics"
+CONF_MEASUREMENT_HISTORY: Final = "measurement_history"
+CONF_STATISTICS_MODE: Final = "statistics_mode"
+CONF_METRICS_EXPORTER: Final = "metrics_exporter"
+CONF_FLEET: Final = "fleet"
+CONF_EXPERIMENTAL_COMMANDS: Final = "experimental_commands"
+CONF_PQ_SAG_THRESHOLD: Final = "pq_sag_threshold"
+CONF_PQ_SWELL_THRESHOLD: Final = "pq_swell_threshold"
+CONF_PQ_FREQUENCY_TOLERANCE: Final = "pq_frequency_tolerance"
+
 DEFAULT_PORT = 8883
 
 CERT_KEY_SIZE = 4096
@@ -46,3 +57,87 @@ MQTT_CONNECTION_ATTEMPTS = 10
 MQTT_PREFIX_V1 = "mbdetnrs/1.0/"
 MQTT_PREFIX_V2 = "mbdetnrs/2.0/"
 MQTT_SUPPORTED_PREFIXES = (MQTT_PREFIX_V1, MQTT_PREFIX_V2)
+
+# Bulk updates are coalesced into one coordinator update per window (seconds).
+# Critical topics bypass the window and are dispatched to the loop at once.
+MQTT_COALESCE_WINDOW = 0.5
+DEFAULT_CRITICAL_TOPICS = (
+    "powerDistributions/1/status",
+    "powerDistributions/1/backupSystem/powerBank/status",
+)
+
+# Publish cadence: the card republishes its whole topic tree every few
+# seconds, changed or not (the 5PX G2 capture in tests/fixtures holds 869
+# messages for 67 topics over 30 s, one full tree every 2-3 s). The client
+# drops unchanged payloads before dispatch, so everything downstream of it
+# only sees changes, while receive timestamps still advance on every copy.
+#
+# Topic staleness: max age in seconds keyed by the last topic path segment
+# ("topic class"). Because of the full-tree republish a topic's receive time
+# tracks feed liveness even when its value never changes; these leave
+# generous headroom before an entity is flagged unavailable.
+STALENESS_TICK = 5
+TOPIC_MAX_AGE_DEFAULT = 900
+TOPIC_MAX_AGE_BY_CLASS: Final = {
+    "measures": 60,
+    "status": 120,
+    "summary": 120,
+}
+
+# Ingest self-instrumentation: snapshot interval in seconds and the maximum
+# number of timing samples kept per snapshot window.
+INGEST_STATS_INTERVAL = 30
+INGEST_SAMPLE_SIZE = 1024
+
+# Measurement history: rolling window and publish interval in seconds, and the
+# ring buffer capacity per measurement (one sample per second fits the window)
+HISTORY_WINDOW = 300
+HISTORY_PUBLISH_INTERVAL = 30
+HISTORY_CAPACITY = 512
+
+# Statistics mode: aggregates are imported every few minutes (aligned to the
+# clock), and state writes of aggregated measurements are limited to one per
+# interval in seconds
+STATISTICS_PUBLISH_MINUTES = 5
+STATISTICS_STATE_INTERVAL = 60
+
+# Integrated energy: state update interval in seconds, and the longest gap in
+# seconds between power readings that is still integrated (the max age of
+# measures topics, so a stale topic is never integrated across)
+ENERGY_UPDATE_INTERVAL = 30
+ENERGY_MAX_GAP = 60
+
+# Battery analytics: samples per discharge curve, discharges kept, minimum
+# duration in seconds and state of charge drop in percent for a discharge to
+# count, snapshot interval and storage save delay in seconds
+BATTERY_CURVE_SIZE = 128
+BATTERY_MAX_DISCHARGES = 50
+BATTERY_MIN_DISCHARGE_DURATION = 60
+BATTERY_MIN_SOC_DROP = 2
+BATTERY_UPDATE_INTERVAL = 60
+BATTERY_SAVE_DELAY = 10
+
+# Power quality: sag and swell thresholds and the frequency tolerance in
+# percent of nominal, and the hysteresis in percent of nominal an excursion
+# must recover by before it ends (IEC 61000-4-30 uses 2 % for voltage)
+DEFAULT_PQ_SAG_THRESHOLD = 90
+DEFAULT_PQ_SWELL_THRESHOLD = 110
+DEFAULT_PQ_FREQUENCY_TOLERANCE = 1.0
+PQ_VOLTAGE_HYSTERESIS = 2.0
+PQ_FREQUENCY_HYSTERESIS = 0.2
+
+# OpenMetrics exporter: view URL and the metric name prefix
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+METRICS_PREFIX = "eaton_ups"
+
+# Snapshot view URL, keyed by config entry
+SNAPSHOT_URL = f"/api/{DOMAIN}/{{entry_id}}/snapshot"
+
+# Commands: seconds to wait for the confirming status topic; a battery test is
+# confirmed once the card reports it started, which takes longer
+COMMAND_TIMEOUT = 15
+COMMAND_BATTERY_TEST_TIMEOUT = 60
+
+# Power events fired on the bus on debounced power state transitions
+EVENT_POWER_EVENT: Final = f"{DOMAIN}_power_event"
+POWER_EVENT_DEBOUNCE = 1.0
@@ -11,13 +11,41 @@ from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .alarms import AlarmTracker
 from .api import (
     EatonUpsClientAuthenticationError,
     EatonUpsClientError,
 )
+from .battery import BatteryAnalytics
+from .commands import CommandDispatcher
+from .const import (
+    CONF_FLEET,
+    CONF_INGEST_DIAGNOSTICS,
+    CONF_MEASUREMENT_HISTORY,
+    CONF_METRICS_EXPORTER,
+    CONF_PQ_FREQUENCY_TOLERANCE,
+    CONF_PQ_SAG_THRESHOLD,
+    CONF_PQ_SWELL_THRESHOLD,
+    CONF_STATISTICS_MODE,
+    DEFAULT_PQ_FREQUENCY_TOLERANCE,
+    DEFAULT_PQ_SAG_THRESHOLD,
+    DEFAULT_PQ_SWELL_THRESHOLD,
+)
+from .devices import DeviceMetadata
+from .energy import EnergyMeters
+from .ingest import IngestStatsPublisher
+from .power_events import PowerEventMachine
+from .power_quality import PowerQualityMonitor
+from .staleness import StalenessTracker
+from .stream import TopicStream
 
 if TYPE_CHECKING:
     from .data import EatonUpsConfigEntry
+    from .fleet import FleetAggregator
+    from .history import MeasurementHistory
+    from .metrics import MetricsRenderer
+    from .profiler import HotPathProfiler
+    from .recorder_stats import StatisticsAggregator
 
 
 class EatonUPSDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -32,6 +60,49 @@ class EatonUPSDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         super().__init__(*args, **kwargs)
         self._unsubscribe_callback: Callable[[], None] | None = None
         self._setup_done = False
+        self.staleness = StalenessTracker(self.hass)
+        self.ingest_stats: IngestStatsPublisher | None = None
+        self.history: MeasurementHistory | None = None
+        # Optional helpers are only imported when their option is enabled
+        if self.config_entry.options.get(CONF_MEASUREMENT_HISTORY, False):
+            from .history import MeasurementHistory  # noqa: PLC0415
+
+            self.history = MeasurementHistory(self.hass)
+        self.profiler: HotPathProfiler | None = None
+        self.power_events = PowerEventMachine(self.hass, self.config_entry.entry_id)
+        self.alarms = AlarmTracker()
+        name = f"Eaton UPS ({self.config_entry.data.get('host')})"
+        self.devices = DeviceMetadata(self.hass, self.config_entry.entry_id, name)
+        self.energy = EnergyMeters(self.hass)
+        self.battery = BatteryAnalytics(self.hass, self.config_entry.entry_id)
+        options = self.config_entry.options
+        self.power_quality = PowerQualityMonitor(
+            self.hass,
+            sag=options.get(CONF_PQ_SAG_THRESHOLD, DEFAULT_PQ_SAG_THRESHOLD),
+            swell=options.get(CONF_PQ_SWELL_THRESHOLD, DEFAULT_PQ_SWELL_THRESHOLD),
+            frequency_tolerance=options.get(
+                CONF_PQ_FREQUENCY_TOLERANCE, DEFAULT_PQ_FREQUENCY_TOLERANCE
+            ),
+        )
+        self.metrics: MetricsRenderer | None = None
+        if self.config_entry.options.get(CONF_METRICS_EXPORTER, False):
+            from .metrics import MetricsRenderer  # noqa: PLC0415
+
+            self.metrics = MetricsRenderer(self.config_entry.data.get("host", ""))
+        self.stream = TopicStream()
+        self.commands = CommandDispatcher()
+        self.fleet: FleetAggregator | None = None
+        if self.config_entry.options.get(CONF_FLEET, False):
+            from .fleet import async_get_fleet  # noqa: PLC0415
+
+            self.fleet = async_get_fleet(self.hass)
+        self.statistics: StatisticsAggregator | None = None
+        if self.config_entry.options.get(CONF_STATISTICS_MODE, False):
+            from .recorder_stats import StatisticsAggregator  # noqa: PLC0415
+
+            self.statistics = StatisticsAggregator(
+                self.hass, self.config_entry.entry_id, name
+            )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Get data from API."""
@@ -48,6 +119,12 @@ class EatonUPSDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             client = self.config_entry.runtime_data.client
 
+            # Counters must exist before connecting to capture connect timings
+            if self.config_entry.options.get(CONF_INGEST_DIAGNOSTICS, False):
+                self.ingest_stats = IngestStatsPublisher(
+                    self.hass, client.enable_ingest_stats()
+                )
+
             # Set up MQTT connection
             await client.async_setup()
 
@@ -61,6 +138,24 @@ class EatonUPSDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             # Store the callback reference for later cleanup
             self._unsubscribe_callback = client.subscribe_to_updates(handle_mqtt_update)
+            self.staleness.async_start(client.topic_received_at)
+            data = await client.async_get_data()
+            self.power_events.async_start(client, data)
+            self.alarms.async_start(client, data)
+            self.devices.async_start(client, data)
+            self.energy.async_start(client)
+            await self.battery.async_start(client, data)
+            self.power_quality.async_start(client, data)
+            self.stream.async_start(client, data)
+            self.commands.async_start(client, data)
+            if self.fleet is not None:
+                self.fleet.async_join(self.config_entry.entry_id, client, data)
+            if self.history is not None:
+                self.history.async_start(client)
+            if self.statistics is not None:
+                self.statistics.async_start(client)
+            if self.ingest_stats is not None:
+                self.ingest_stats.async_start()
             self._setup_done = True
 
         except EatonUpsClientAuthenticationError as exception:
@@ -77,6 +172,24 @@ class EatonUPSDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._unsubscribe_callback()
             self._unsubscribe_callback = None
 
+        self.staleness.async_stop()
+        self.power_events.async_stop()
+        self.alarms.async_stop()
+        self.devices.async_stop()
+        self.energy.async_stop()
+        self.battery.async_stop()
+        self.power_quality.async_stop()
+        self.stream.async_stop()
+        self.commands.async_stop()
+        if self.fleet is not None:
+            self.fleet.async_leave(self.config_entry.entry_id)
+        if self.history is not None:
+            self.history.async_stop()
+        if self.statistics is not None:
+            self.statistics.async_stop()
+        if self.ingest_stats is not None:
+            self.ingest_stats.async_stop()
+
         # Disconnect MQTT client
         if self.config_entry.runtime_data.client:
             await self.config_entry.runtime_data.client.async_disconnect()
@@ -0,0 +1,195 @@
+"""Device info and device registry metadata for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import re
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+from .distributions import (
+    DEFAULT_DISTRIBUTION_ID,
+    DISTRIBUTION_TOPIC_PREFIX,
+    get_distribution_id,
+    index_distributions,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .api import EatonUpsMqttClient
+
+# Model reported before the card has published anything
+DEFAULT_MODEL = "Eaton UPS"
+
+# Topics of outlets, the powerBank and environmental probes, which are
+# exposed as sub-devices of their distribution or of the card
+SUB_DEVICE_TOPIC_PATTERN = re.compile(
+    r"^(?:powerDistributions/([^/]+)/(?:outlets/(\d+)|backupSystem/powerBank)"
+    r"|sensors/devices/([^/]+))(?:/|$)"
+)
+
+
+def identification_topic(distribution_id: str) -> str:
+    """Return the identification topic key of a powerDistribution."""
+    return f"{DISTRIBUTION_TOPIC_PREFIX}{distribution_id}/identification"
+
+
+def get_identification_metadata(payload: Any) -> tuple[str | None, str | None]:
+    """Return the model and firmware version of an identification payload."""
+    if not isinstance(payload, dict):
+        return None, None
+    model = payload.get("model")
+    firmware = payload.get("firmwareVersion")
+    return (
+        model if isinstance(model, str) and model else None,
+        firmware if isinstance(firmware, str) and firmware else None,
+    )
+
+
+class DeviceMetadata:
+    """
+    Shared device info per powerDistribution device and sub-device.
+
+    Every entity of a device receives the same DeviceInfo, built once from
+    the identification topic seen at startup. Outlets, the powerBank and
+    environmental probes are sub-devices linked through via_device, so each
+    device page only lists its own entities. Later identification payloads
+    only touch the device registry, and only when the model or firmware
+    version actually changed, so a firmware upgrade is reflected without
+    any per-entity work.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str) -> None:
+        """Initialize the device metadata."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._name = name
+        self._metadata: dict[str, tuple[str | None, str | None]] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
+        self._sub_device_info: dict[str, DeviceInfo] = {}
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    def identifier(self, distribution_id: str) -> str:
+        """Return the device identifier of a powerDistribution."""
+        # Distribution 1 keeps the original device; others get one each
+        if distribution_id == DEFAULT_DISTRIBUTION_ID:
+            return self._entry_id
+        return f"{self._entry_id}_{distribution_id}"
+
+    def device_info(self, distribution_id: str) -> DeviceInfo:
+        """Return the shared device info of a powerDistribution."""
+        if (info := self._device_info.get(distribution_id)) is not None:
+            return info
+        model, sw_version = self._metadata.get(distribution_id, (DEFAULT_MODEL, None))
+        name = self._name
+        if distribution_id != DEFAULT_DISTRIBUTION_ID:
+            name = f"{name} Distribution {distribution_id}"
+        info = self._device_info[distribution_id] = DeviceInfo(
+            identifiers={(DOMAIN, self.identifier(distribution_id))},
+            name=name,
+            manufacturer="Eaton",
+            model=model,
+            sw_version=sw_version,
+        )
+        return info
+
+    def entity_device_info(self, topic: str, data: Mapping[str, Any]) -> DeviceInfo:
+        """Return the shared device info of the device a topic belongs to."""
+        if not (match := SUB_DEVICE_TOPIC_PATTERN.match(topic)):
+            return self.device_info(
+                get_distribution_id(topic) or DEFAULT_DISTRIBUTION_ID
+            )
+        sub_device = match.group(0).removesuffix("/")
+        if (info := self._sub_device_info.get(sub_device)) is None:
+            info = self._sub_device_info[sub_device] = self._sub_device(match, data)
+        return info
+
+    def _sub_device(self, match: re.Match[str], data: Mapping[str, Any]) -> DeviceInfo:
+        """Build the device info of an outlet, powerBank or probe sub-device."""
+        distribution_id, outlet, probe_id = match.groups()
+        if probe_id is not None:
+            identification = data.get(f"sensors/devices/{probe_id}/identification")
+            if not isinstance(identification, dict):
+                identification = {}
+            return DeviceInfo(
+                identifiers={(DOMAIN, f"{self._entry_id}_sensor_{probe_id}")},
+                name=identification.get("name")
+                or identification.get("physicalName")
+                or probe_id,
+                manufacturer=identification.get("manufacturer") or "Eaton",
+                model=identification.get("model"),
+                sw_version=identification.get("version"),
+                via_device=(DOMAIN, self._entry_id),
+            )
+        parent = self.identifier(distribution_id)
+        suffix, label = (
+            (f"outlet_{outlet}", f"Outlet {outlet}")
+            if outlet
+            else ("battery", "Battery")
+        )
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{parent}_{suffix}")},
+            name=f"{self.device_info(distribution_id)['name']} {label}",
+            manufacturer="Eaton",
+            via_device=(DOMAIN, parent),
+        )
+
+    @callback
+    def async_register_devices(self, config_entry_id: str) -> None:
+        """
+        Register the distribution devices before any entity is added.
+
+        Sub-devices reference them through via_device, so they must exist
+        in the registry regardless of the order entities are added in.
+        """
+        registry = dr.async_get(self._hass)
+        for distribution_id in self._metadata:
+            registry.async_get_or_create(
+                config_entry_id=config_entry_id, **self.device_info(distribution_id)
+            )
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Read the current metadata and watch the identification topics."""
+        if self._unsubscribes:
+            return
+        for distribution_id in index_distributions(data):
+            topic = identification_topic(distribution_id)
+            self._metadata[distribution_id] = get_identification_metadata(
+                data.get(topic)
+            )
+            self._unsubscribes.append(
+                client.subscribe_to_topic(
+                    topic, partial(self._handle_identification, distribution_id)
+                )
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the identification topics."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    @callback
+    def _handle_identification(self, distribution_id: str, payload: Any) -> None:
+        """Update the device registry when the model or firmware changed."""
+        metadata = get_identification_metadata(payload)
+        if metadata == self._metadata.get(distribution_id):
+            return
+        self._metadata[distribution_id] = metadata
+        model, sw_version = metadata
+        if (info := self._device_info.get(distribution_id)) is not None:
+            info["model"] = model
+            info["sw_version"] = sw_version
+        registry = dr.async_get(self._hass)
+        device = registry.async_get_device(
+            identifiers={(DOMAIN, self.identifier(distribution_id))}
+        )
+        if device is not None:
+            registry.async_update_device(device.id, model=model, sw_version=sw_version)
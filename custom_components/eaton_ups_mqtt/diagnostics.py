@@ -24,9 +24,15 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: EatonUPSDataUpdateCoordinator = config_entry.runtime_data.coordinator
+    client = config_entry.runtime_data.client
 
     return {
         "config_entry": async_redact_data(config_entry.as_dict(), CONF_TO_REDACT),
-        "mqtt_prefix": config_entry.runtime_data.client.mqtt_prefix,
+        "mqtt_prefix": client.mqtt_prefix,
         "coordinator_data": async_redact_data(coordinator.data, DATA_TO_REDACT),
+        "stale_topics": sorted(coordinator.staleness.stale_topics),
+        "critical_topic_latency_ms": {
+            topic: round(latency * 1000, 3)
+            for topic, latency in client.critical_topic_latency.items()
+        },
     }
@@ -0,0 +1,107 @@
+"""powerDistribution discovery for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass, field, replace
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.helpers.entity import EntityDescription
+
+DEFAULT_DISTRIBUTION_ID = "1"
+DISTRIBUTION_TOPIC_PREFIX = "powerDistributions/"
+TEMPLATE_PREFIX = f"{DISTRIBUTION_TOPIC_PREFIX}{DEFAULT_DISTRIBUTION_ID}/"
+
+DISTRIBUTION_TOPIC_PATTERN = re.compile(
+    r"^powerDistributions/([^/]+)/"
+    r"(?:(inputs|outputs|outlets)/(\d+)/(?:phases/(\d+)/measures$)?)?"
+)
+
+
+@dataclass
+class DistributionLayout:
+    """Inputs, outputs, outlets and their phases seen for one distribution."""
+
+    members: dict[str, dict[int, set[int]]] = field(default_factory=dict)
+
+    def numbers(self, kind: str) -> list[int]:
+        """Return the sorted input, output or outlet numbers."""
+        return sorted(self.members.get(kind, ()))
+
+    def phases(self, kind: str, num: int) -> list[int]:
+        """Return the sorted phase numbers of an input or output."""
+        return sorted(self.members.get(kind, {}).get(num, ()))
+
+
+def index_distributions(keys: Iterable[str]) -> dict[str, DistributionLayout]:
+    """
+    Map every powerDistribution id to its layout in one pass over the keys.
+
+    Distribution 1 is always present, so its descriptions are created even
+    before the card has published anything.
+    """
+    layouts = {DEFAULT_DISTRIBUTION_ID: DistributionLayout()}
+    for key in keys:
+        if not (match := DISTRIBUTION_TOPIC_PATTERN.match(key)):
+            continue
+        distribution_id, kind, num, phase = match.groups()
+        layout = layouts.setdefault(distribution_id, DistributionLayout())
+        if kind is None:
+            continue
+        phases = layout.members.setdefault(kind, {}).setdefault(int(num), set())
+        if phase is not None:
+            phases.add(int(phase))
+    return layouts
+
+
+def get_distribution_id(topic: str) -> str | None:
+    """Return the powerDistribution id of a topic key, if it has one."""
+    if not topic.startswith(DISTRIBUTION_TOPIC_PREFIX):
+        return None
+    return topic.removeprefix(DISTRIBUTION_TOPIC_PREFIX).partition("/")[0]
+
+
+def for_distribution[DescriptionT: EntityDescription](
+    descriptions: Iterable[DescriptionT], distribution_id: str
+) -> list[DescriptionT]:
+    """
+    Rebase descriptions written for distribution 1 onto another distribution.
+
+    Descriptions of distribution 1 are returned as is, so their keys and the
+    unique ids derived from them stay unchanged.
+    """
+    if distribution_id == DEFAULT_DISTRIBUTION_ID:
+        return list(descriptions)
+    prefix = f"{DISTRIBUTION_TOPIC_PREFIX}{distribution_id}/"
+    return [
+        replace(description, key=prefix + description.key.removeprefix(TEMPLATE_PREFIX))
+        if description.key.startswith(TEMPLATE_PREFIX)
+        else description
+        for description in descriptions
+    ]
+
+
+@cache
+def get_descriptions[DescriptionT: EntityDescription](
+    generator: Callable[..., Iterable[DescriptionT]],
+    *args: Any,
+    distribution_id: str = DEFAULT_DISTRIBUTION_ID,
+) -> tuple[DescriptionT, ...]:
+    """
+    Return the shared descriptions of generator(*args) for a distribution.
+
+    Tuples are cached per generator, arguments and distribution, so config
+    entries with the same layout share one set of frozen descriptions and
+    setup only selects tuples. Keys are interned when a tuple is first built.
+    """
+    return tuple(
+        description
+        if (key := sys.intern(description.key)) is description.key
+        else replace(description, key=key)
+        for description in for_distribution(generator(*args), distribution_id)
+    )
@@ -0,0 +1,159 @@
+"""Energy integrated from active power for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import ENERGY_MAX_GAP, ENERGY_UPDATE_INTERVAL
+from .listeners import async_register_listener
+from .payload import get_number
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+# Watt-seconds per watt-hour
+SECONDS_PER_HOUR = 3600
+
+
+class EnergyIntegrator:
+    """
+    Trapezoidal integration of active power readings into watt-hours.
+
+    Readings further apart than the maximum gap are not integrated across,
+    so a lost connection or a restart never books energy for time that was
+    not observed. The client does not dispatch unchanged payloads, so hold()
+    extends an unchanged reading up to the last time the topic was received.
+    """
+
+    __slots__ = ("_max_gap", "_power", "_timestamp", "energy")
+
+    def __init__(self, energy: float = 0.0, max_gap: float = ENERGY_MAX_GAP) -> None:
+        """Initialize the integrator with the energy accumulated so far."""
+        self.energy = energy
+        self._max_gap = max_gap
+        self._power: float | None = None
+        self._timestamp = 0.0
+
+    def add(self, timestamp: float, power: float | None) -> None:
+        """Integrate up to a new power reading taken at timestamp."""
+        if self._power is not None and power is not None:
+            elapsed = timestamp - self._timestamp
+            if 0 < elapsed <= self._max_gap:
+                # Power is never negative, so the total only ever increases
+                self.energy += (
+                    max(self._power + power, 0.0) * elapsed / (2 * SECONDS_PER_HOUR)
+                )
+        self._power = power
+        self._timestamp = timestamp
+
+    def hold(self, received_at: float | None) -> None:
+        """Integrate the current reading up to a republish at received_at."""
+        if received_at is not None and received_at > self._timestamp:
+            self.add(received_at, self._power)
+
+
+class EnergyMeters:
+    """
+    Energy meters for outputs and outlets that only report active power.
+
+    Every meter integrates its topic's power readings as they arrive. A
+    single timer extends unchanged readings and then notifies listeners, so
+    the energy sensors write their state at a fixed rate regardless of how
+    often the power changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the meters."""
+        self._hass = hass
+        self._client: EatonUpsMqttClient | None = None
+        self._meters: dict[str, EnergyIntegrator] = {}
+        self._fields: dict[str, dict[str, str]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient) -> None:
+        """Start integrating readings from the client."""
+        self._client = client
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the timer and unsubscribe from the metered topics."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+        self._fields.clear()
+        self._meters.clear()
+        self._client = None
+
+    @callback
+    def async_track(
+        self, key: str, energy: float, data: Mapping[str, Any]
+    ) -> EnergyIntegrator:
+        """
+        Return the meter of a power description key, starting it if new.
+
+        A new meter continues from energy and is seeded with the current
+        reading from data.
+        """
+        if (meter := self._meters.get(key)) is not None:
+            return meter
+        meter = self._meters[key] = EnergyIntegrator(energy)
+        topic, field = key.split("$", 1)
+        if self._client is not None:
+            if topic not in self._fields:
+                self._unsubscribes.append(
+                    self._client.subscribe_to_topic(
+                        topic, partial(self._handle_payload, topic)
+                    )
+                )
+            if self._unsub_timer is None:
+                self._unsub_timer = async_track_time_interval(
+                    self._hass,
+                    self._async_update,
+                    timedelta(seconds=ENERGY_UPDATE_INTERVAL),
+                    cancel_on_shutdown=True,
+                )
+        self._fields.setdefault(topic, {})[key] = field
+        meter.add(time.monotonic(), get_number(data.get(topic), field))
+        return meter
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener after the meters are updated.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @callback
+    def _handle_payload(self, topic: str, payload: Any) -> None:
+        """Integrate the power readings of a changed topic."""
+        now = time.monotonic()
+        for key, field in self._fields.get(topic, {}).items():
+            self._meters[key].add(now, get_number(payload, field))
+
+    @callback
+    def _async_update(self, _now: Any = None) -> None:
+        """Extend unchanged readings that were republished and notify listeners."""
+        if self._client is None:
+            return
+        received_at = self._client.topic_received_at
+        for topic, fields in self._fields.items():
+            for key in fields:
+                self._meters[key].hold(received_at.get(topic))
+        for listener in list(self._listeners):
+            listener()
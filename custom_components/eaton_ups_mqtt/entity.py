@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
+from .const import ATTRIBUTION
 from .coordinator import EatonUPSDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import EntityDescription
+
 
 class EatonUpsEntity(CoordinatorEntity[EatonUPSDataUpdateCoordinator]):
     """EatonUpsEntity class."""
@@ -15,39 +19,33 @@ class EatonUpsEntity(CoordinatorEntity[EatonUPSDataUpdateCoordinator]):
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: EatonUPSDataUpdateCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: EntityDescription,
+    ) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name=f"Eaton UPS ({coordinator.config_entry.data.get('host')})",
-            manufacturer="Eaton",
-            model=self._get_model_info(),
-            sw_version=self._get_firmware_version(),
+        self.entity_description = entity_description
+        self._attr_device_info = coordinator.devices.entity_device_info(
+            self.topic, coordinator.data
         )
 
-    def _get_model_info(self) -> str | None:
-        """Get model information from the coordinator data."""
-        if not self.coordinator.data:
-            return "Eaton UPS"
-
-        # Try to find model information in the data
-        model = self.coordinator.data.get(
-            "powerDistributions/1/identification", {}
-        ).get("model")
-        if isinstance(model, str) and model:
-            return model
-        return None
-
-    def _get_firmware_version(self) -> str | None:
-        """Get firmware version from the coordinator data."""
-        if not self.coordinator.data:
-            return None
-
-        # Try to find firmware information in the data
-        firmware = self.coordinator.data.get(
-            "powerDistributions/1/identification", {}
-        ).get("firmwareVersion")
-        if isinstance(firmware, str) and firmware:
-            return firmware
-        return None
+    @property
+    def topic(self) -> str:
+        """Return the flat MQTT topic key this entity reads from."""
+        return self.entity_description.key.partition("$")[0]
+
+    @property
+    def available(self) -> bool:
+        """Return False when the source topic has gone stale."""
+        return super().available and not self.coordinator.staleness.is_stale(self.topic)
+
+    async def async_added_to_hass(self) -> None:
+        """Track staleness of the source topic when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.staleness.async_track(
+                self.topic, self.async_write_ha_state
+            )
+        )
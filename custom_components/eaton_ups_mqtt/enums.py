@@ -0,0 +1,117 @@
+"""Enum tables for status fields of eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+# M2 cards publish some status fields as integer codes where M3 cards publish
+# strings. Operating codes follow the CIM OperatingStatus values, which the
+# OpenAPI spec's examples use: 16 for an in-service environment service and
+# 5 for a stopped NTP client. The M2 card's empty sensors/status reads 7,
+# dormant. Health codes follow the CIM HealthState values, where M2 reports
+# 5 for "ok".
+OPERATING_OPTIONS = [
+    "in_service",
+    "stopped",
+    "dormant",
+    "not_available",
+    "servicing",
+    "starting",
+    "stopping",
+    "aborted",
+    "completed",
+    "migrating",
+    "emigrating",
+    "immigrating",
+    "snapshotting",
+    "shutting_down",
+    "in_test",
+    "transitioning",
+    "unknown",
+]
+OPERATING_CODES = {
+    0: "unknown",
+    1: "not_available",
+    2: "servicing",
+    3: "starting",
+    4: "stopping",
+    5: "stopped",
+    6: "aborted",
+    7: "dormant",
+    8: "completed",
+    9: "migrating",
+    10: "emigrating",
+    11: "immigrating",
+    12: "snapshotting",
+    13: "shutting_down",
+    14: "in_test",
+    15: "transitioning",
+    16: "in_service",
+}
+
+HEALTH_OPTIONS = [
+    "ok",
+    "degraded",
+    "minor_failure",
+    "major_failure",
+    "critical_failure",
+    "non_recoverable_error",
+    "unknown",
+]
+HEALTH_CODES = {
+    0: "unknown",
+    5: "ok",
+    10: "degraded",
+    15: "minor_failure",
+    20: "major_failure",
+    25: "critical_failure",
+    30: "non_recoverable_error",
+}
+
+CHARGER_STATUS_OPTIONS = ["on_charging", "on_not_charging", "off", "unknown"]
+
+
+def _build_index(
+    options: list[str], codes: Mapping[int, str] | None = None
+) -> dict[Any, str]:
+    """Index raw strings, snake-cased options and integer codes onto options."""
+    index: dict[Any, str] = {}
+    for option in options:
+        index[option] = option
+        index[option.replace("_", " ")] = option
+    index.update(codes or {})
+    return index
+
+
+# Indexes keyed by the status field name at the end of a description key
+ENUM_INDEXES: dict[str, dict[Any, str]] = {
+    "operating": _build_index(OPERATING_OPTIONS, OPERATING_CODES),
+    "health": _build_index(HEALTH_OPTIONS, HEALTH_CODES),
+    "chargerStatus": _build_index(CHARGER_STATUS_OPTIONS),
+}
+
+
+def get_enum_converter(key: str) -> Callable[[Any], str | None] | None:
+    """
+    Return the converter of an enum description key, if its field has a table.
+
+    Raw values outside the table convert to None and are logged, so the
+    entity reports unknown instead of an option Home Assistant rejects.
+    """
+    field = key.rpartition("$")[2].rpartition("/")[2]
+    if (index := ENUM_INDEXES.get(field)) is None:
+        return None
+
+    def convert(value: Any) -> str | None:
+        """Map a raw status value onto its option."""
+        option = index.get(value) if isinstance(value, str | int) else None
+        if option is None and value is not None:
+            LOGGER.warning("Unknown %s value %r for %s", field, value, key)
+        return option
+
+    return convert
@@ -0,0 +1,152 @@
+"""Event platform for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.event import EventEntity, EventEntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .alarms import get_alarm_id
+from .const import DOMAIN
+from .power_quality import INPUT_MEASURES_TOPIC, PowerQualityEventType
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import EatonUPSDataUpdateCoordinator
+    from .data import EatonUpsConfigEntry
+    from .power_quality import PowerQualityEvent
+
+EVENT_TYPE_RAISED = "raised"
+EVENT_TYPE_CLEARED = "cleared"
+
+ALARM_EVENT_DESCRIPTION = EventEntityDescription(
+    key="alarm",
+    name="Alarm",
+    translation_key="alarm",
+    event_types=[EVENT_TYPE_RAISED, EVENT_TYPE_CLEARED],
+)
+
+
+def _generate_power_quality_description(input_num: int) -> EventEntityDescription:
+    """Generate the power quality event description of an input."""
+    return EventEntityDescription(
+        key=f"input_{input_num}_power_quality",
+        name=f"Input {input_num} Power Quality",
+        translation_key="power_quality",
+        event_types=list(PowerQualityEventType),
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: EatonUpsConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event platform."""
+    coordinator = entry.runtime_data.coordinator
+    async_add_entities([EatonUpsAlarmEvent(coordinator=coordinator)])
+    async_add_entities(
+        EatonUpsPowerQualityEvent(coordinator=coordinator, input_num=input_num)
+        for input_num in coordinator.power_quality.inputs
+    )
+
+
+def _event_attributes(member: dict[str, Any]) -> dict[str, Any]:
+    """Return the event attributes of an alarm member."""
+    attributes = {
+        key: value for key, value in member.items() if not key.startswith("@")
+    }
+    attributes["alarm_id"] = get_alarm_id(member)
+    return attributes
+
+
+class EatonUpsAlarmEvent(EventEntity):
+    """
+    Alarm raised and cleared events.
+
+    Not a coordinator entity: it is fed by the alarm tracker and triggers
+    once per raised or cleared alarm.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: EatonUPSDataUpdateCoordinator) -> None:
+        """Initialize the alarm event entity."""
+        self.coordinator = coordinator
+        self.entity_description = ALARM_EVENT_DESCRIPTION
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{self.entity_description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for alarm changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.alarms.async_add_listener(self._handle_alarms)
+        )
+
+    @callback
+    def _handle_alarms(
+        self, raised: list[dict[str, Any]], cleared: list[dict[str, Any]]
+    ) -> None:
+        """Trigger one event per raised or cleared alarm."""
+        for event_type, members in (
+            (EVENT_TYPE_CLEARED, cleared),
+            (EVENT_TYPE_RAISED, raised),
+        ):
+            for member in members:
+                self._trigger_event(event_type, _event_attributes(member))
+                self.async_write_ha_state()
+
+
+class EatonUpsPowerQualityEvent(EventEntity):
+    """
+    Input power quality events.
+
+    Not a coordinator entity: it is fed by the power quality monitor and
+    triggers once per finished sag, swell or frequency excursion.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, coordinator: EatonUPSDataUpdateCoordinator, input_num: int
+    ) -> None:
+        """Initialize the power quality event entity."""
+        self.coordinator = coordinator
+        self.entity_description = _generate_power_quality_description(input_num)
+        self._input_num = input_num
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{self.entity_description.key}"
+        self._attr_device_info = coordinator.devices.entity_device_info(
+            INPUT_MEASURES_TOPIC.format(input_num=input_num), coordinator.data
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for power quality events."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.power_quality.async_add_event_listener(self._handle_event)
+        )
+
+    @callback
+    def _handle_event(self, event: PowerQualityEvent) -> None:
+        """Trigger an event for a finished excursion on this input."""
+        if event.input_num != self._input_num:
+            return
+        self._trigger_event(
+            event.event_type,
+            {
+                "started": event.started.isoformat(),
+                "duration": event.duration,
+                "extreme": event.extreme,
+                "nominal": event.nominal,
+            },
+        )
+        self.async_write_ha_state()
@@ -0,0 +1,292 @@
+"""Fleet aggregates across all Eaton UPS entries for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from functools import partial
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .battery import (
+    OUTPUT_MEASURES_TOPIC,
+    POWER_BANK_MEASURES_TOPIC,
+    POWER_BANK_STATUS_TOPIC,
+)
+from .const import DOMAIN
+from .enums import ENUM_INDEXES, HEALTH_OPTIONS
+from .listeners import async_register_listener
+from .payload import get_number
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+FLEET_DATA: HassKey[FleetAggregator] = HassKey(f"{DOMAIN}_fleet")
+
+DISTRIBUTION_STATUS_TOPIC = "powerDistributions/1/status"
+
+# Known health states from best to worst; unknown only wins when nothing is known
+HEALTH_UNKNOWN = "unknown"
+HEALTH_SEVERITY = [option for option in HEALTH_OPTIONS if option != HEALTH_UNKNOWN]
+
+# Stale runtime heap entries tolerated per member before the heap is rebuilt
+RUNTIME_HEAP_SLACK = 4
+
+# Aggregate keys, also the keys of the fleet sensor descriptions
+TOTAL_LOAD = "total_load"
+TOTAL_ENERGY = "total_energy"
+ON_BATTERY = "on_battery"
+MINIMUM_RUNTIME = "minimum_runtime"
+WORST_HEALTH = "worst_health"
+MEMBERS = "members"
+
+
+class _Member:
+    """Contributions of one UPS to the fleet aggregates."""
+
+    __slots__ = (
+        "energy",
+        "entry_id",
+        "health",
+        "load",
+        "on_battery",
+        "runtime",
+        "runtime_seq",
+        "unsubscribes",
+    )
+
+    def __init__(self, entry_id: str) -> None:
+        """Initialize a member that contributes nothing yet."""
+        self.entry_id = entry_id
+        self.load = 0.0
+        self.energy: float | None = None
+        self.on_battery = False
+        self.runtime: float | None = None
+        self.runtime_seq = -1
+        self.health: str | None = None
+        self.unsubscribes: list[CALLBACK_TYPE] = []
+
+
+class FleetAggregator:
+    """
+    Running totals across every UPS that joined the fleet.
+
+    Each member's topic handlers apply the difference between its old and
+    new contribution, so a change on one UPS never re-aggregates the fleet.
+    Load, the on-battery count and the health counts are O(1) per update.
+    The minimum runtime is kept in a lazily pruned heap, O(log n) per
+    update. The energy total only adds each member's counter increments, so
+    members joining or leaving never make it jump.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty fleet."""
+        self._members: dict[str, _Member] = {}
+        self._load = 0.0
+        self._energy = 0.0
+        self._energy_restored = False
+        self._on_battery = 0
+        self._runtimes: list[tuple[float, int, str]] = []
+        self._runtime_seq = count()
+        self._health: Counter[str] = Counter()
+        self._owner: str | None = None
+        self._providers: dict[str, Callable[[], None]] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self.values: dict[str, Any] = {}
+
+    @callback
+    def async_join(
+        self, entry_id: str, client: EatonUpsMqttClient, data: Mapping[str, Any]
+    ) -> None:
+        """Add a UPS to the fleet, seeding its contributions from data."""
+        if entry_id in self._members:
+            return
+        member = self._members[entry_id] = _Member(entry_id)
+        handlers: dict[str, Callable[[_Member, Any], None]] = {
+            OUTPUT_MEASURES_TOPIC: self._handle_output,
+            POWER_BANK_MEASURES_TOPIC: self._handle_power_bank,
+            POWER_BANK_STATUS_TOPIC: self._handle_power_bank_status,
+            DISTRIBUTION_STATUS_TOPIC: self._handle_status,
+        }
+        for topic, handler in handlers.items():
+            bound = partial(self._handle, handler, member)
+            member.unsubscribes.append(client.subscribe_to_topic(topic, bound))
+            handler(member, data.get(topic))
+        self._async_publish()
+
+    @callback
+    def async_leave(self, entry_id: str) -> None:
+        """Remove a UPS and its contributions from the fleet."""
+        if (member := self._members.pop(entry_id, None)) is None:
+            return
+        for unsubscribe in member.unsubscribes:
+            unsubscribe()
+        self._set_load(member, None)
+        self._set_on_battery(member, on_battery=False)
+        self._set_runtime(member, None)
+        self._set_health(member, None)
+        self._providers.pop(entry_id, None)
+        if self._owner == entry_id:
+            self._owner = next(iter(self._providers), None)
+            if self._owner is not None:
+                self._providers[self._owner]()
+        if not self._members:
+            # Drop the rounding error accumulated by the running sum
+            self._load = 0.0
+        self._async_publish()
+
+    @callback
+    def async_add_provider(self, entry_id: str, create: Callable[[], None]) -> None:
+        """
+        Offer a member entry's platform to provide the fleet entities.
+
+        Only one member provides them: create is called for the first
+        provider, and for the next one when the providing entry leaves.
+        """
+        if entry_id not in self._members:
+            return
+        self._providers[entry_id] = create
+        if self._owner is None:
+            self._owner = entry_id
+            create()
+
+    @callback
+    def async_restore_energy(self, energy: float) -> None:
+        """Continue the energy total from a restored state, once."""
+        if self._energy_restored:
+            return
+        self._energy_restored = True
+        self._energy += energy
+        self._async_publish()
+
+    @callback
+    def async_add_listener(
+        self, key: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Call listener when the aggregate value of key changes.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners.setdefault(key, []), listener)
+
+    @callback
+    def _handle(
+        self, handler: Callable[[_Member, Any], None], member: _Member, payload: Any
+    ) -> None:
+        """Apply a member's topic change and publish the aggregates."""
+        handler(member, payload)
+        self._async_publish()
+
+    def _handle_output(self, member: _Member, payload: Any) -> None:
+        """Apply a member's output load and energy counter."""
+        self._set_load(member, get_number(payload, "activePower"))
+        energy = get_number(payload, "cumulatedEnergy")
+        if energy is None:
+            return
+        # A counter that went backwards was reset; it becomes the new base
+        if member.energy is not None and energy > member.energy:
+            self._energy += energy - member.energy
+        member.energy = energy
+
+    def _handle_power_bank(self, member: _Member, payload: Any) -> None:
+        """Apply a member's remaining runtime."""
+        self._set_runtime(member, get_number(payload, "remainingTime"))
+
+    def _handle_power_bank_status(self, member: _Member, payload: Any) -> None:
+        """Apply whether a member runs on battery."""
+        if isinstance(payload, dict):
+            self._set_on_battery(member, on_battery=payload.get("supply") is True)
+
+    def _handle_status(self, member: _Member, payload: Any) -> None:
+        """Apply a member's health."""
+        raw = payload.get("health") if isinstance(payload, dict) else None
+        health = ENUM_INDEXES["health"].get(raw) if isinstance(raw, str | int) else None
+        self._set_health(member, health)
+
+    def _set_load(self, member: _Member, load: float | None) -> None:
+        """Replace a member's load in the running total."""
+        load = load or 0.0
+        self._load += load - member.load
+        member.load = load
+
+    def _set_on_battery(self, member: _Member, *, on_battery: bool) -> None:
+        """Replace a member's on-battery flag in the running count."""
+        self._on_battery += int(on_battery) - int(member.on_battery)
+        member.on_battery = on_battery
+
+    def _set_runtime(self, member: _Member, runtime: float | None) -> None:
+        """Replace a member's runtime, leaving its old heap entry stale."""
+        if runtime == member.runtime:
+            return
+        member.runtime = runtime
+        member.runtime_seq = -1
+        if runtime is None:
+            return
+        member.runtime_seq = next(self._runtime_seq)
+        heapq.heappush(self._runtimes, (runtime, member.runtime_seq, member.entry_id))
+        if len(self._runtimes) > RUNTIME_HEAP_SLACK * (len(self._members) + 1):
+            # Rare compared to updates, so pruning stays amortized O(log n)
+            self._runtimes = [
+                (value.runtime, value.runtime_seq, value.entry_id)
+                for value in self._members.values()
+                if value.runtime is not None
+            ]
+            heapq.heapify(self._runtimes)
+
+    def _minimum_runtime(self) -> float | None:
+        """Return the lowest current runtime, popping stale heap entries."""
+        while self._runtimes:
+            _, seq, entry_id = self._runtimes[0]
+            member = self._members.get(entry_id)
+            if member is not None and member.runtime_seq == seq:
+                return self._runtimes[0][0]
+            heapq.heappop(self._runtimes)
+        return None
+
+    def _set_health(self, member: _Member, health: str | None) -> None:
+        """Replace a member's health in the per-state counts."""
+        if member.health is not None:
+            self._health[member.health] -= 1
+        if health is not None:
+            self._health[health] += 1
+        member.health = health
+
+    def _worst_health(self) -> str | None:
+        """Return the worst known health across the fleet."""
+        for health in reversed(HEALTH_SEVERITY):
+            if self._health[health] > 0:
+                return health
+        return HEALTH_UNKNOWN if self._health[HEALTH_UNKNOWN] > 0 else None
+
+    @callback
+    def _async_publish(self) -> None:
+        """Publish the aggregates and notify the listeners of changed ones."""
+        values = {
+            TOTAL_LOAD: round(self._load, 1),
+            TOTAL_ENERGY: round(self._energy, 1),
+            ON_BATTERY: self._on_battery,
+            MINIMUM_RUNTIME: self._minimum_runtime(),
+            WORST_HEALTH: self._worst_health(),
+            MEMBERS: len(self._members),
+        }
+        changed = [
+            key for key, value in values.items() if self.values.get(key) != value
+        ]
+        self.values = values
+        for key in changed:
+            for listener in list(self._listeners.get(key, ())):
+                listener()
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FleetAggregator:
+    """Return the fleet shared by all entries, creating it on first use."""
+    if (fleet := hass.data.get(FLEET_DATA)) is None:
+        fleet = hass.data[FLEET_DATA] = FleetAggregator()
+    return fleet
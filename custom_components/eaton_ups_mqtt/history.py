@@ -0,0 +1,260 @@
+"""In-memory measurement history for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections import deque
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import HISTORY_CAPACITY, HISTORY_PUBLISH_INTERVAL, HISTORY_WINDOW
+from .listeners import async_register_listener
+from .payload import get_number
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+
+class RollingWindow:
+    """
+    Fixed-capacity ring buffer of timestamped samples with rolling aggregates.
+
+    Values and timestamps live in parallel array('d') buffers indexed by a
+    running sequence number. Values are only dispatched on change, so the
+    mean is weighted by how long each sample stayed in effect: the integral
+    between the buffered samples is kept as a running sum, and the open
+    ends at the window start and the latest timestamp are added when read.
+    Minimum and maximum are monotonic deques of sequence numbers, so
+    appending and expiring samples is amortized O(1) and reading an
+    aggregate never rescans the window.
+    """
+
+    def __init__(self, capacity: int, window: float) -> None:
+        """Initialize the ring buffer."""
+        self._capacity = capacity
+        self._window = window
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+        self._integral = 0.0
+        self._now = 0.0
+        self._minima: deque[int] = deque()
+        self._maxima: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest sample in the window."""
+        if not self._count:
+            return None
+        return self._values[self._minima[0] % self._capacity]
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest sample in the window."""
+        if not self._count:
+            return None
+        return self._values[self._maxima[0] % self._capacity]
+
+    @property
+    def mean(self) -> float | None:
+        """Return the time-weighted mean up to the latest timestamp seen."""
+        if not self._count:
+            return None
+        first = (self._next - self._count) % self._capacity
+        last = (self._next - 1) % self._capacity
+        # The oldest sample may predate the window; weight it from its start
+        start = max(self._times[first], self._now - self._window)
+        duration = self._now - start
+        if duration <= 0:
+            return self._values[last]
+        integral = (
+            self._integral
+            - self._values[first] * (start - self._times[first])
+            + self._values[last] * (self._now - self._times[last])
+        )
+        return integral / duration
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting expired samples and the oldest when full."""
+        self.expire(timestamp)
+        if self._count == self._capacity:
+            self._evict_oldest()
+        seq = self._next
+        if self._count:
+            previous = (seq - 1) % self._capacity
+            self._integral += self._values[previous] * (
+                timestamp - self._times[previous]
+            )
+        position = seq % self._capacity
+        self._values[position] = value
+        self._times[position] = timestamp
+        self._next += 1
+        self._count += 1
+        values = self._values
+        while self._minima and values[self._minima[-1] % self._capacity] >= value:
+            self._minima.pop()
+        self._minima.append(seq)
+        while self._maxima and values[self._maxima[-1] % self._capacity] <= value:
+            self._maxima.pop()
+        self._maxima.append(seq)
+
+    def expire(self, now: float) -> None:
+        """
+        Evict samples that were superseded before the window started.
+
+        Unchanged values are not dispatched, so the newest sample before
+        the window is still in effect at its start and is kept.
+        """
+        self._now = max(self._now, now)
+        cutoff = now - self._window
+        while (
+            self._count > 1
+            and self._times[(self._next - self._count + 1) % self._capacity] <= cutoff
+        ):
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Remove the oldest sample from the aggregates."""
+        seq = self._next - self._count
+        self._count -= 1
+        position = seq % self._capacity
+        following = (seq + 1) % self._capacity
+        # Restart the integral when a single sample is left so rounding
+        # errors cannot accumulate
+        self._integral = (
+            self._integral
+            - self._values[position] * (self._times[following] - self._times[position])
+            if self._count > 1
+            else 0.0
+        )
+        if self._minima[0] == seq:
+            self._minima.popleft()
+        if self._maxima[0] == seq:
+            self._maxima.popleft()
+
+
+class MeasurementHistory:
+    """
+    Recent history of selected measurements, kept in memory.
+
+    Tracked description keys get a rolling window fed straight from their
+    topic's payloads, so the recorder database is never queried. Listeners
+    are notified on a fixed interval rather than per sample, which bounds
+    the state writes of the derived sensors.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float = HISTORY_WINDOW,
+        capacity: int = HISTORY_CAPACITY,
+    ) -> None:
+        """Initialize the history."""
+        self._hass = hass
+        self._window = window
+        self._capacity = capacity
+        self._client: EatonUpsMqttClient | None = None
+        self._windows: dict[str, RollingWindow] = {}
+        self._fields: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient) -> None:
+        """Start publishing the rolling aggregates on a fixed interval."""
+        if self._unsub_timer is not None:
+            return
+        self._client = client
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_publish,
+            timedelta(seconds=HISTORY_PUBLISH_INTERVAL),
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop publishing and unsubscribe from the tracked topics."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+        self._fields.clear()
+        self._client = None
+
+    @callback
+    def async_track(self, key: str, data: Mapping[str, Any]) -> RollingWindow:
+        """
+        Return the rolling window of a description key, tracking it if new.
+
+        A new window is seeded with the current value from data.
+        """
+        if (rolling := self._windows.get(key)) is not None:
+            return rolling
+        rolling = self._windows[key] = RollingWindow(self._capacity, self._window)
+        topic, lookup = key.split("$", 1)
+        if topic not in self._fields and self._client is not None:
+            self._unsubscribes.append(
+                self._client.subscribe_to_topic(
+                    topic, partial(self._handle_payload, topic)
+                )
+            )
+        lookup_parts = tuple(lookup.split("/"))
+        self._fields.setdefault(topic, {})[key] = lookup_parts
+        self._append(rolling, lookup_parts, data.get(topic), time.monotonic())
+        return rolling
+
+    def window(self, key: str) -> RollingWindow | None:
+        """Return the rolling window of a tracked description key."""
+        return self._windows.get(key)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener after the aggregates are published.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @callback
+    def _handle_payload(self, topic: str, payload: Any) -> None:
+        """Append the tracked numeric fields of a changed topic."""
+        now = time.monotonic()
+        for key, lookup_parts in self._fields.get(topic, {}).items():
+            self._append(self._windows[key], lookup_parts, payload, now)
+
+    @staticmethod
+    def _append(
+        rolling: RollingWindow,
+        lookup_parts: tuple[str, ...],
+        payload: Any,
+        now: float,
+    ) -> None:
+        """Append the numeric value at the lookup path of a payload."""
+        if (value := get_number(payload, *lookup_parts)) is not None:
+            rolling.append(now, value)
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Expire old samples and notify listeners."""
+        now = time.monotonic()
+        for rolling in self._windows.values():
+            rolling.expire(now)
+        for listener in list(self._listeners):
+            listener()
@@ -0,0 +1,144 @@
+"""Ingest pipeline self-instrumentation for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import INGEST_SAMPLE_SIZE, INGEST_STATS_INTERVAL
+from .listeners import async_register_listener
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _percentile(samples: list[float], percentile: float) -> float | None:
+    """Return the nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return None
+    index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+    return samples[index]
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+class IngestCounters:
+    """
+    Counters for the MQTT ingest pipeline.
+
+    All writers run on the paho network thread and every update is a single
+    attribute store or deque append, so no locking is needed. Timing samples
+    are kept in bounded deques that are swapped out on every snapshot.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.messages = 0
+        self.bytes = 0
+        self.duplicates = 0
+        self.reconnects = 0
+        self.connack_latency: float | None = None
+        self.tls_handshake: float | None = None
+        self.decode_samples: deque[float] = deque(maxlen=INGEST_SAMPLE_SIZE)
+        self.dispatch_lag_samples: deque[float] = deque(maxlen=INGEST_SAMPLE_SIZE)
+
+    def record_message(self, size: int) -> None:
+        """Count a received message and its payload size."""
+        self.messages += 1
+        self.bytes += size
+
+    def take_samples(self) -> tuple[list[float], list[float]]:
+        """Return sorted decode and dispatch lag samples and start new windows."""
+        decode = self.decode_samples
+        dispatch_lag = self.dispatch_lag_samples
+        self.decode_samples = deque(maxlen=INGEST_SAMPLE_SIZE)
+        self.dispatch_lag_samples = deque(maxlen=INGEST_SAMPLE_SIZE)
+        return sorted(decode), sorted(dispatch_lag)
+
+
+class IngestStatsPublisher:
+    """Periodically turn ingest counters into a snapshot for diagnostic sensors."""
+
+    def __init__(self, hass: HomeAssistant, counters: IngestCounters) -> None:
+        """Initialize the publisher."""
+        self._hass = hass
+        self._counters = counters
+        self._listeners: list[Callable[[], None]] = []
+        self._last_time = time.monotonic()
+        self._last_messages = 0
+        self._last_bytes = 0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.snapshot: dict[str, Any] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start publishing snapshots on a fixed interval."""
+        if self._unsub_timer is not None:
+            return
+        self._last_time = time.monotonic()
+        self._last_messages = self._counters.messages
+        self._last_bytes = self._counters.bytes
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_publish,
+            timedelta(seconds=INGEST_STATS_INTERVAL),
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop publishing snapshots."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener after every published snapshot.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Compute a new snapshot from the counters and notify listeners."""
+        counters = self._counters
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        messages = counters.messages
+        size = counters.bytes
+        decode, dispatch_lag = counters.take_samples()
+
+        self.snapshot = {
+            "messages_per_second": (
+                round((messages - self._last_messages) / elapsed, 2)
+                if elapsed > 0
+                else None
+            ),
+            "bytes_per_second": (
+                round((size - self._last_bytes) / elapsed) if elapsed > 0 else None
+            ),
+            "decode_time_p50": _ms(_percentile(decode, 50)),
+            "decode_time_p99": _ms(_percentile(decode, 99)),
+            "dispatch_lag_p99": _ms(_percentile(dispatch_lag, 99)),
+            "suppressed_duplicates": counters.duplicates,
+            "reconnects": counters.reconnects,
+            "connack_latency": _ms(counters.connack_latency),
+            "tls_handshake_time": _ms(counters.tls_handshake),
+        }
+        self._last_time = now
+        self._last_messages = messages
+        self._last_bytes = size
+
+        for listener in list(self._listeners):
+            listener()
@@ -0,0 +1,39 @@
+"""Listener registration shared by the eaton_ups_mqtt helpers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ListenerSource(Protocol):
+    """A helper that calls its listeners when it has new values."""
+
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call listener on new values and return a function that removes it."""
+        ...
+
+
+@callback
+def async_register_listener[ListenerT](
+    listeners: list[ListenerT], listener: ListenerT
+) -> CALLBACK_TYPE:
+    """
+    Append listener to listeners.
+
+    Returns a function that removes the listener, which may be called more
+    than once.
+    """
+    listeners.append(listener)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the listener."""
+        if listener in listeners:
+            listeners.remove(listener)
+
+    return remove_listener
@@ -0,0 +1,228 @@
+"""OpenMetrics exporter for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import defaultdict
+from functools import cache
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .const import CONF_METRICS_EXPORTER, DOMAIN, METRICS_PREFIX, METRICS_URL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .data import EatonUpsConfigEntry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+# Collections indexed by opaque ids, and the label their ids go into
+OPAQUE_ID_LABELS = {
+    "devices": "device",
+    "temperatures": "channel",
+    "humidities": "channel",
+    "digitalInputs": "channel",
+    "suppliers": "supplier",
+}
+
+# Segment suffixes of card-to-card request and response topics, such as
+# "timeSync??" and "timeSync?=", which carry exchanges rather than state
+EXCHANGE_SUFFIXES = ("??", "?=")
+
+
+@cache
+def _snake(segment: str) -> str:
+    """Return a topic segment or payload field as a snake_case name part."""
+    return INVALID_NAME_CHARS.sub("_", CAMEL_CASE_BOUNDARY.sub("_", segment)).lower()
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_value(value: Any) -> str | None:
+    """Return a numeric payload value as a sample value."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    return None
+
+
+def is_exchange_topic(topic: str) -> bool:
+    """Return whether a topic is a request or response exchange."""
+    return any(segment.endswith(EXCHANGE_SUFFIXES) for segment in topic.split("/"))
+
+
+def topic_template(topic: str, labels: str) -> tuple[str, str]:
+    """
+    Return the metric name prefix and label set of a topic.
+
+    Numeric segments become labels named after the collection they index,
+    so "powerDistributions/1/outlets/2/measures" is the
+    eaton_ups_power_distributions_outlets_measures family with
+    power_distribution="1" and outlet="2" labels. Opaque sensor and
+    supplier ids become device, channel and supplier labels the same way,
+    so they never end up in family names.
+    """
+    parts = [METRICS_PREFIX]
+    label_parts = [labels] if labels else []
+    collection = "index"
+    previous = ""
+    for segment in topic.split("/"):
+        if segment.isdigit():
+            label_parts.append(f'{collection.removesuffix("s")}="{segment}"')
+        elif (label := OPAQUE_ID_LABELS.get(previous)) is not None:
+            label_parts.append(f'{label}="{_escape(segment)}"')
+        else:
+            collection = _snake(segment)
+            parts.append(collection)
+        previous = segment
+    return "_".join(parts), ",".join(label_parts)
+
+
+class MetricsRenderer:
+    """
+    Incrementally rendered OpenMetrics samples of one UPS.
+
+    Rendering is pull based: nothing runs per MQTT message. On a scrape the
+    topic store is walked and only topics whose payload object was replaced
+    since the previous scrape are re-rendered from precomputed name and
+    label templates. Samples are cached per metric family, and a family's
+    text block is only rebuilt when one of its samples changed. Request
+    and response exchange topics and their $-prefixed bookkeeping fields
+    are not state, so they are never rendered.
+    """
+
+    def __init__(self, host: str) -> None:
+        """Initialize the renderer with the label identifying the UPS."""
+        self._labels = f'host="{_escape(host)}"'
+        self._templates: dict[str, tuple[str, str] | None] = {}
+        self._payloads: dict[str, Any] = {}
+        self._topic_families: dict[str, set[str]] = {}
+        self._samples: dict[str, dict[str, str]] = {}
+        self._blocks: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self.version = 0
+
+    def families(self, data: Mapping[str, Any]) -> dict[str, str]:
+        """Bring the samples up to date with data and return the family blocks."""
+        # The client adds topics from its network thread; copy atomically
+        for topic, payload in list(data.items()):
+            if self._payloads.get(topic) is not payload:
+                self._payloads[topic] = payload
+                self._render_topic(topic, payload)
+        if self._dirty:
+            for family in self._dirty:
+                if samples := self._samples.get(family):
+                    self._blocks[family] = "".join(samples.values())
+                else:
+                    self._samples.pop(family, None)
+                    self._blocks.pop(family, None)
+            self._dirty.clear()
+            self.version += 1
+        return self._blocks
+
+    def _render_topic(self, topic: str, payload: Any) -> None:
+        """Render the samples of one topic into their families."""
+        if topic not in self._templates:
+            self._templates[topic] = (
+                None
+                if is_exchange_topic(topic)
+                else topic_template(topic, self._labels)
+            )
+        if (template := self._templates[topic]) is None:
+            return
+        prefix, labels = template
+        samples: dict[str, str] = {}
+        if isinstance(payload, dict):
+            self._collect(prefix, labels, payload, samples)
+        previous = self._topic_families.get(topic, set())
+        for family in previous.difference(samples):
+            del self._samples[family][topic]
+            self._dirty.add(family)
+        for family, line in samples.items():
+            family_samples = self._samples.setdefault(family, {})
+            if family_samples.get(topic) != line:
+                family_samples[topic] = line
+                self._dirty.add(family)
+        self._topic_families[topic] = set(samples)
+
+    def _collect(
+        self, prefix: str, labels: str, payload: dict[str, Any], samples: dict[str, str]
+    ) -> None:
+        """Collect the numeric fields of a payload, flattening nested objects."""
+        for field, value in payload.items():
+            if field.startswith(("@", "$")):
+                continue
+            family = f"{prefix}_{_snake(field)}"
+            if isinstance(value, dict):
+                self._collect(family, labels, value, samples)
+            elif (formatted := _format_value(value)) is not None:
+                samples[family] = f"{family}{{{labels}}} {formatted}\n"
+
+
+def render_metrics(families: Iterable[Mapping[str, str]]) -> str:
+    """Merge the family blocks of every UPS into one OpenMetrics exposition."""
+    blocks: defaultdict[str, list[str]] = defaultdict(list)
+    for ups_families in families:
+        for family, block in ups_families.items():
+            blocks[family].append(block)
+    parts = [
+        f"# TYPE {family} gauge\n{''.join(family_blocks)}"
+        for family, family_blocks in blocks.items()
+    ]
+    parts.append("# EOF\n")
+    return "".join(parts)
+
+
+class EatonUpsMetricsView(HomeAssistantView):
+    """
+    OpenMetrics view of every UPS with the metrics exporter enabled.
+
+    Requires a Home Assistant access token, sent as a bearer token by the
+    scraper. The merged exposition is cached and reused as long as no
+    renderer produced a new version.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._cache_key: tuple[tuple[int, int], ...] = ()
+        self._cache = b""
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Render the metrics of all loaded UPS entries."""
+        hass = request.app[KEY_HASS]
+        entries: list[EatonUpsConfigEntry] = [
+            entry
+            for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+            if entry.options.get(CONF_METRICS_EXPORTER, False)
+        ]
+        if not entries:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        renderers = [
+            (coordinator.metrics, coordinator.data or {})
+            for entry in entries
+            if (coordinator := entry.runtime_data.coordinator).metrics is not None
+        ]
+        families = [renderer.families(data) for renderer, data in renderers]
+        key = tuple((id(renderer), renderer.version) for renderer, _ in renderers)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._cache = render_metrics(families).encode()
+        return web.Response(body=self._cache, headers={"Content-Type": CONTENT_TYPE})
@@ -0,0 +1,23 @@
+"""Payload field helpers for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def get_number(payload: Any, *path: str) -> float | None:
+    """
+    Return the numeric value at a field path of a payload as a float.
+
+    Each path element indexes one level of nested objects, so no path returns
+    the payload itself. Returns None when a level is missing or the value is
+    not a number; booleans do not count as numbers.
+    """
+    value = payload
+    for part in path:
+        if not (isinstance(value, dict) and part in value):
+            return None
+        value = value[part]
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return None
@@ -0,0 +1,205 @@
+"""Power event state machine for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import EVENT_POWER_EVENT, LOGGER, POWER_EVENT_DEBOUNCE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from datetime import datetime
+
+    from .api import EatonUpsMqttClient
+
+STATUS_TOPIC = "powerDistributions/1/status"
+POWER_BANK_STATUS_TOPIC = "powerDistributions/1/backupSystem/powerBank/status"
+INPUT_STATUS_TOPIC = "powerDistributions/1/inputs/{input_num}/status"
+MAX_INPUTS = 9
+
+
+class PowerState(StrEnum):
+    """Power states of the UPS."""
+
+    ON_MAINS = "on_mains"
+    MAINS_LOST = "mains_lost"
+    ON_BATTERY = "on_battery"
+    SHUTDOWN_IMMINENT = "shutdown_imminent"
+
+
+class PowerEventType(StrEnum):
+    """Power event types fired on the bus."""
+
+    MAINS_RESTORED = "mains_restored"
+    MAINS_LOST = "mains_lost"
+    ON_BATTERY = "on_battery"
+    SHUTDOWN_IMMINENT = "shutdown_imminent"
+
+
+EVENT_TYPE_BY_STATE = {
+    PowerState.ON_MAINS: PowerEventType.MAINS_RESTORED,
+    PowerState.MAINS_LOST: PowerEventType.MAINS_LOST,
+    PowerState.ON_BATTERY: PowerEventType.ON_BATTERY,
+    PowerState.SHUTDOWN_IMMINENT: PowerEventType.SHUTDOWN_IMMINENT,
+}
+
+
+class PowerEventMachine:
+    """
+    Derive the UPS power state from status topic deltas and fire HA events.
+
+    The machine subscribes to the distribution, input and power bank status
+    topics directly on the client, so it sees each change as it arrives
+    instead of re-evaluating on every coordinator update. A new state must
+    hold for the debounce period before its event fires; flaps back to the
+    committed state within that window fire nothing. Shutdown imminent is
+    committed immediately.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the state machine."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._status: dict[str, Any] = {}
+        self._power_bank: dict[str, Any] = {}
+        self._inputs: dict[str, dict[str, Any]] = {}
+        self._state: PowerState | None = None
+        self._pending: PowerState | None = None
+        self._unsub_debounce: CALLBACK_TYPE | None = None
+        self._debounce_job = HassJob(
+            self._async_debounce_elapsed, cancel_on_shutdown=True
+        )
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    @property
+    def state(self) -> PowerState | None:
+        """Return the committed power state."""
+        return self._state
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Subscribe to the status topics, seeding from the current data."""
+        if self._unsubscribes:
+            return
+        handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            STATUS_TOPIC: self._handle_status,
+            POWER_BANK_STATUS_TOPIC: self._handle_power_bank,
+        }
+        for input_num in range(1, MAX_INPUTS + 1):
+            topic = INPUT_STATUS_TOPIC.format(input_num=input_num)
+            handlers[topic] = partial(self._handle_input, topic)
+
+        for topic, handler in handlers.items():
+            self._unsubscribes.append(client.subscribe_to_topic(topic, handler))
+            if isinstance(current := data.get(topic), dict):
+                handler(current)
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe and cancel any pending transition."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+        self._cancel_pending()
+
+    @callback
+    def _handle_status(self, data: dict[str, Any]) -> None:
+        """Handle a distribution status delta."""
+        self._status = data
+        self._evaluate()
+
+    @callback
+    def _handle_power_bank(self, data: dict[str, Any]) -> None:
+        """Handle a power bank status delta."""
+        self._power_bank = data
+        self._evaluate()
+
+    @callback
+    def _handle_input(self, topic: str, data: dict[str, Any]) -> None:
+        """Handle an input status delta."""
+        self._inputs[topic] = data
+        self._evaluate()
+
+    def _derive_state(self) -> PowerState | None:
+        """Return the power state implied by the latest status payloads."""
+        if not self._status:
+            return None
+        if self._status.get("shutdownImminent"):
+            return PowerState.SHUTDOWN_IMMINENT
+        if self._power_bank.get("supply"):
+            return PowerState.ON_BATTERY
+        if self._inputs and not any(
+            status.get("supply") for status in self._inputs.values()
+        ):
+            return PowerState.MAINS_LOST
+        return PowerState.ON_MAINS
+
+    @callback
+    def _evaluate(self) -> None:
+        """Move towards the derived state, debouncing transitions."""
+        candidate = self._derive_state()
+        if candidate is None:
+            return
+
+        if self._state is None:
+            # Let the initial republish burst settle, then adopt silently
+            if self._unsub_debounce is None:
+                self._arm(candidate)
+            return
+
+        if candidate == self._state:
+            self._cancel_pending()
+            return
+
+        if candidate == PowerState.SHUTDOWN_IMMINENT:
+            self._cancel_pending()
+            self._commit(candidate)
+            return
+
+        if candidate != self._pending:
+            self._cancel_pending()
+            self._arm(candidate)
+
+    @callback
+    def _async_debounce_elapsed(self, _now: datetime) -> None:
+        """Commit the pending state once it held for the debounce period."""
+        self._unsub_debounce = None
+        pending, self._pending = self._pending, None
+        if self._state is None:
+            self._state = self._derive_state()
+        elif pending is not None and pending != self._state:
+            self._commit(pending)
+
+    def _arm(self, state: PowerState) -> None:
+        """Start the debounce timer for a pending state."""
+        self._pending = state
+        self._unsub_debounce = async_call_later(
+            self._hass, POWER_EVENT_DEBOUNCE, self._debounce_job
+        )
+
+    def _cancel_pending(self) -> None:
+        """Drop any pending transition."""
+        if self._unsub_debounce is not None:
+            self._unsub_debounce()
+            self._unsub_debounce = None
+        self._pending = None
+
+    def _commit(self, state: PowerState) -> None:
+        """Commit a new state and fire its event."""
+        previous, self._state = self._state, state
+        event_type = EVENT_TYPE_BY_STATE[state]
+        LOGGER.debug("Power event %s (%s -> %s)", event_type, previous, state)
+        self._hass.bus.async_fire(
+            EVENT_POWER_EVENT,
+            {
+                "config_entry_id": self._entry_id,
+                "type": event_type.value,
+                "state": state.value,
+                "previous_state": previous.value if previous else None,
+            },
+        )
@@ -0,0 +1,363 @@
+"""Power quality event detection for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_PQ_FREQUENCY_TOLERANCE,
+    DEFAULT_PQ_SAG_THRESHOLD,
+    DEFAULT_PQ_SWELL_THRESHOLD,
+    PQ_FREQUENCY_HYSTERESIS,
+    PQ_VOLTAGE_HYSTERESIS,
+)
+from .distributions import DEFAULT_DISTRIBUTION_ID, index_distributions
+from .listeners import async_register_listener
+from .payload import get_number
+from .suppliers import supplier_topic
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from datetime import datetime
+
+    from .api import EatonUpsMqttClient
+
+INPUT_MEASURES_TOPIC = "powerDistributions/1/inputs/{input_num}/measures"
+INPUT_SPECIFICATIONS_TOPIC = "powerDistributions/1/inputs/{input_num}/specifications"
+SETTINGS_TOPIC = "powerDistributions/1/settings"
+
+# Nominal values the first sample is snapped to when the card publishes none
+NOMINAL_VOLTAGES = (100, 110, 115, 120, 127, 200, 208, 220, 230, 240)
+NOMINAL_FREQUENCIES = (50, 60)
+
+
+class PowerQualityEventType(StrEnum):
+    """Power quality event types."""
+
+    SAG = "sag"
+    SWELL = "swell"
+    FREQUENCY_EXCURSION = "frequency_excursion"
+
+
+@dataclass(frozen=True, slots=True)
+class PowerQualityEvent:
+    """A finished power quality event on one input."""
+
+    input_num: int
+    event_type: PowerQualityEventType
+    started: datetime
+    duration: float
+    extreme: float
+    nominal: float
+
+
+class ExcursionDetector:
+    """
+    Hysteresis detector for a measurement leaving its band.
+
+    Each sample is scored by how far it deviates from nominal. An event
+    starts when the score exceeds the enter threshold and ends once it falls
+    back below the lower exit threshold, so a value hovering at the limit
+    does not produce a burst of events. Every sample is O(1).
+    """
+
+    __slots__ = ("_enter", "_exit", "extreme", "peak", "start", "started")
+
+    def __init__(self, enter: float, exit_: float) -> None:
+        """Initialize the detector with its enter and exit scores."""
+        self._enter = enter
+        self._exit = exit_
+        self.start: float | None = None
+        self.started: datetime | None = None
+        self.peak = 0.0
+        self.extreme = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Return whether an event is in progress."""
+        return self.start is not None
+
+    def update(
+        self, timestamp: float, value: float, score: float
+    ) -> tuple[datetime, float, float] | None:
+        """
+        Feed a sample and its score.
+
+        Returns the start, duration and extreme value of an event that
+        ended with this sample.
+        """
+        if self.start is None:
+            if score > self._enter:
+                self.start = timestamp
+                self.started = dt_util.utcnow()
+                self.peak = score
+                self.extreme = value
+            return None
+        if score > self.peak:
+            self.peak = score
+            self.extreme = value
+        if score >= self._exit:
+            return None
+        started = self.started or dt_util.utcnow()
+        duration = timestamp - self.start
+        self.start = self.started = None
+        return started, duration, self.extreme
+
+
+class InputMonitor:
+    """Sag, swell and frequency excursion detectors of one input."""
+
+    def __init__(self, sag: float, swell: float, frequency_tolerance: float) -> None:
+        """Initialize the monitor with thresholds in percent of nominal."""
+        self._thresholds = (sag, swell, frequency_tolerance)
+        self.nominal_voltage: float | None = None
+        self.nominal_frequency: float | None = None
+        self._detectors: dict[PowerQualityEventType, ExcursionDetector] = {}
+
+    def update(
+        self, timestamp: float, payload: Any
+    ) -> list[tuple[PowerQualityEventType, datetime, float, float]]:
+        """Feed an input measures payload and return the events it ended."""
+        if not isinstance(payload, dict):
+            return []
+        ended = []
+        voltage = get_number(payload, "voltage")
+        if voltage is not None and voltage > 0:
+            if self.nominal_voltage is None:
+                self.set_nominal_voltage(_snap(NOMINAL_VOLTAGES, voltage))
+            nominal = self.nominal_voltage or voltage
+            for event_type, score in (
+                (PowerQualityEventType.SAG, nominal - voltage),
+                (PowerQualityEventType.SWELL, voltage - nominal),
+            ):
+                if result := self._detectors[event_type].update(
+                    timestamp, voltage, score
+                ):
+                    ended.append((event_type, *result))
+        frequency = get_number(payload, "frequency")
+        if frequency is not None and frequency > 0:
+            if self.nominal_frequency is None:
+                self.set_nominal_frequency(_snap(NOMINAL_FREQUENCIES, frequency))
+            nominal = self.nominal_frequency or frequency
+            detector = self._detectors[PowerQualityEventType.FREQUENCY_EXCURSION]
+            if result := detector.update(
+                timestamp, frequency, abs(frequency - nominal)
+            ):
+                ended.append((PowerQualityEventType.FREQUENCY_EXCURSION, *result))
+        return ended
+
+    def nominal(self, event_type: PowerQualityEventType) -> float | None:
+        """Return the nominal value an event type is measured against."""
+        if event_type == PowerQualityEventType.FREQUENCY_EXCURSION:
+            return self.nominal_frequency
+        return self.nominal_voltage
+
+    def set_nominal_voltage(self, nominal: float) -> None:
+        """Measure the voltage against nominal, resetting its detectors."""
+        if nominal == self.nominal_voltage:
+            return
+        sag, swell, _ = self._thresholds
+        self.nominal_voltage = nominal
+        hysteresis = nominal * PQ_VOLTAGE_HYSTERESIS / 100
+        sag_score = nominal * (100 - sag) / 100
+        swell_score = nominal * (swell - 100) / 100
+        self._detectors[PowerQualityEventType.SAG] = ExcursionDetector(
+            sag_score, sag_score - hysteresis
+        )
+        self._detectors[PowerQualityEventType.SWELL] = ExcursionDetector(
+            swell_score, swell_score - hysteresis
+        )
+
+    def set_nominal_frequency(self, nominal: float) -> None:
+        """Measure the frequency against nominal, resetting its detector."""
+        if nominal == self.nominal_frequency:
+            return
+        _, _, tolerance = self._thresholds
+        self.nominal_frequency = nominal
+        score = nominal * tolerance / 100
+        self._detectors[PowerQualityEventType.FREQUENCY_EXCURSION] = ExcursionDetector(
+            score, score - nominal * PQ_FREQUENCY_HYSTERESIS / 100
+        )
+
+
+class PowerQualityMonitor:
+    """
+    Detect sags, swells and frequency excursions on the UPS inputs.
+
+    Every changed input measures payload is fed straight from the client
+    through per-input detectors, so no template or statistics helper
+    re-evaluates on state changes. The card republishes the inputs every
+    few seconds, so excursions shorter than that are not observed. Nominal
+    values come from the card's settings and input or supplier nominals, and
+    are only snapped from the first sample when it publishes none. Finished
+    events go to event listeners, and per-day counters reset at local
+    midnight.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        sag: float = DEFAULT_PQ_SAG_THRESHOLD,
+        swell: float = DEFAULT_PQ_SWELL_THRESHOLD,
+        frequency_tolerance: float = DEFAULT_PQ_FREQUENCY_TOLERANCE,
+    ) -> None:
+        """Initialize the monitor with thresholds in percent of nominal."""
+        self._hass = hass
+        self._thresholds = (sag, swell, frequency_tolerance)
+        self._inputs: dict[int, InputMonitor] = {}
+        self._counts: dict[int, dict[PowerQualityEventType, int]] = {}
+        self._event_listeners: list[Callable[[PowerQualityEvent], None]] = []
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+
+    @property
+    def inputs(self) -> list[int]:
+        """Return the monitored input numbers."""
+        return list(self._inputs)
+
+    def count(self, input_num: int, event_type: PowerQualityEventType) -> int:
+        """Return today's number of events of a type on an input."""
+        return self._counts.get(input_num, {}).get(event_type, 0)
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Follow the measures of every input, seeding from the current data."""
+        if self._unsubscribes:
+            return
+        layout = index_distributions(data)[DEFAULT_DISTRIBUTION_ID]
+        supplier_frequency = _supplier_frequency(client, data)
+        for input_num in layout.numbers("inputs"):
+            monitor = self._inputs[input_num] = InputMonitor(*self._thresholds)
+            self._counts[input_num] = dict.fromkeys(PowerQualityEventType, 0)
+            frequency = (
+                _input_frequency(
+                    data.get(INPUT_SPECIFICATIONS_TOPIC.format(input_num=input_num))
+                )
+                or supplier_frequency
+            )
+            if frequency is not None:
+                monitor.set_nominal_frequency(frequency)
+        # Seed the nominal voltage before the first measures are fed
+        self._unsubscribes.append(
+            client.subscribe_to_topic(SETTINGS_TOPIC, self._handle_settings)
+        )
+        self._handle_settings(data.get(SETTINGS_TOPIC))
+        for input_num in self._inputs:
+            topic = INPUT_MEASURES_TOPIC.format(input_num=input_num)
+            handler = partial(self._handle_measures, input_num)
+            self._unsubscribes.append(client.subscribe_to_topic(topic, handler))
+            handler(data.get(topic))
+        self._unsub_midnight = async_track_time_change(
+            self._hass, self._async_reset_counts, hour=0, minute=0, second=0
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the input measures."""
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    @callback
+    def async_add_event_listener(
+        self, listener: Callable[[PowerQualityEvent], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Call listener with every finished event.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._event_listeners, listener)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener after the daily counters changed.
+
+        Returns a function that removes the listener.
+        """
+        return async_register_listener(self._listeners, listener)
+
+    @callback
+    def _handle_settings(self, payload: Any) -> None:
+        """Re-seed the nominal voltage of every input from the settings."""
+        if not isinstance(payload, dict):
+            return
+        nominal = get_number(payload, "nominalVoltage")
+        if nominal is None or nominal <= 0:
+            return
+        for monitor in self._inputs.values():
+            monitor.set_nominal_voltage(nominal)
+
+    @callback
+    def _handle_measures(self, input_num: int, payload: Any) -> None:
+        """Feed an input measures payload to its detectors."""
+        monitor = self._inputs[input_num]
+        ended = monitor.update(time.monotonic(), payload)
+        if not ended:
+            return
+        for event_type, started, duration, extreme in ended:
+            self._counts[input_num][event_type] += 1
+            event = PowerQualityEvent(
+                input_num=input_num,
+                event_type=event_type,
+                started=started,
+                duration=round(duration, 1),
+                extreme=extreme,
+                nominal=monitor.nominal(event_type) or extreme,
+            )
+            for listener in list(self._event_listeners):
+                listener(event)
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def _async_reset_counts(self, _now: datetime) -> None:
+        """Start new daily counters."""
+        for counts in self._counts.values():
+            counts.update(dict.fromkeys(counts, 0))
+        for listener in list(self._listeners):
+            listener()
+
+
+def _snap(nominals: tuple[int, ...], value: float) -> float:
+    """Return the nominal value closest to a measured one."""
+    return min(nominals, key=lambda nominal: abs(nominal - value))
+
+
+def _input_frequency(payload: Any) -> float | None:
+    """Return the nominal frequency of an input specifications payload."""
+    if not isinstance(payload, dict):
+        return None
+    nominal = (
+        get_number(payload, "frequency", "nominal")
+        if isinstance(payload.get("frequency"), dict)
+        else get_number(payload, "nominalFrequency")
+    )
+    return nominal if nominal is not None and nominal > 0 else None
+
+
+def _supplier_frequency(
+    client: EatonUpsMqttClient, data: Mapping[str, Any]
+) -> float | None:
+    """Return the nominal frequency the suppliers agree on, if any."""
+    frequencies = set()
+    for supplier_id in client.suppliers.supplier_ids:
+        configuration = data.get(supplier_topic(supplier_id, "configuration"))
+        if isinstance(configuration, dict):
+            nominal = get_number(configuration, "nominalFrequency")
+            if nominal is not None and nominal > 0:
+                frequencies.add(nominal)
+    return frequencies.pop() if len(frequencies) == 1 else None
@@ -0,0 +1,190 @@
+"""On-demand hot path profiling for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.helpers.entity import Entity
+
+    from .data import EatonUpsConfigEntry
+
+
+def _summarize(samples: list[float]) -> dict[str, Any]:
+    """Summarize timing samples in milliseconds."""
+    total = sum(samples)
+    return {
+        "count": len(samples),
+        "total_ms": round(total * 1000, 3),
+        "mean_ms": round(total / len(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def _summarize_all(samples: dict[str, list[float]]) -> dict[str, dict[str, Any]]:
+    """Summarize samples per key, most expensive first."""
+    summaries = {key: _summarize(values) for key, values in samples.items() if values}
+    return dict(
+        sorted(summaries.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    )
+
+
+class HotPathProfiler:
+    """
+    Time the MQTT message hot path for one config entry.
+
+    Probes are installed by overriding instance attributes (the paho message
+    callback, the coordinator update method and each entity's state writer)
+    and removed again on stop, so nothing is measured or wrapped while no
+    profiling session is running.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: EatonUpsConfigEntry,
+        *,
+        with_cprofile: bool = False,
+    ) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self._entry = entry
+        self._cprofile = cProfile.Profile() if with_cprofile else None
+        self._topic_samples: dict[str, list[float]] = defaultdict(list)
+        self._entity_samples: dict[str, list[float]] = defaultdict(list)
+        self._coordinator_samples: list[float] = []
+        self._wrapped_entities: list[Entity] = []
+        self._started = 0.0
+        self._stopped = 0.0
+
+    @callback
+    def async_start(self) -> None:
+        """Install the timing probes."""
+        runtime_data = self._entry.runtime_data
+        coordinator = runtime_data.coordinator
+        if coordinator.profiler is not None:
+            msg = f"Profiling already running for {self._entry.title}"
+            raise HomeAssistantError(msg)
+        coordinator.profiler = self
+
+        runtime_data.client.set_message_probe(self._record_message)
+        coordinator.async_set_updated_data = self._wrap(
+            coordinator.async_set_updated_data, self._coordinator_samples
+        )
+        for platform in async_get_platforms(self._hass, DOMAIN):
+            if platform.config_entry is not self._entry:
+                continue
+            for entity in platform.entities.values():
+                entity.async_write_ha_state = self._wrap(
+                    entity.async_write_ha_state,
+                    self._entity_samples[entity.entity_id],
+                )
+                self._wrapped_entities.append(entity)
+
+        self._started = time.monotonic()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    @callback
+    def async_stop(self) -> None:
+        """Remove the timing probes, restoring the original methods."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._stopped = time.monotonic()
+
+        runtime_data = self._entry.runtime_data
+        coordinator = runtime_data.coordinator
+        runtime_data.client.set_message_probe(None)
+        # Deleting the instance attributes exposes the class methods again
+        del coordinator.async_set_updated_data
+        for entity in self._wrapped_entities:
+            del entity.async_write_ha_state
+        self._wrapped_entities.clear()
+        coordinator.profiler = None
+
+    def report(self) -> dict[str, Any]:
+        """Return the profiling report."""
+        topics = _summarize_all(self._topic_samples)
+        return {
+            "config_entry_id": self._entry.entry_id,
+            "duration_s": round(self._stopped - self._started, 3),
+            "dispatch_counts": {
+                "messages": sum(topic["count"] for topic in topics.values()),
+                "coordinator_updates": len(self._coordinator_samples),
+                "entity_state_writes": sum(
+                    len(samples) for samples in self._entity_samples.values()
+                ),
+            },
+            "coordinator_update": (
+                _summarize(self._coordinator_samples)
+                if self._coordinator_samples
+                else None
+            ),
+            "topics": topics,
+            "entities": _summarize_all(self._entity_samples),
+        }
+
+    def write_reports(self, config_dir: str) -> dict[str, str]:
+        """Write the JSON report and optional cProfile dump (runs in executor)."""
+        stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
+        base = Path(config_dir) / f"{DOMAIN}_profile_{self._entry.entry_id}_{stamp}"
+        paths = {"report": str(base.with_suffix(".json"))}
+        Path(paths["report"]).write_text(json.dumps(self.report(), indent=2))
+        if self._cprofile is not None:
+            paths["cprofile"] = str(base.with_suffix(".prof"))
+            self._cprofile.dump_stats(paths["cprofile"])
+        return paths
+
+    def _record_message(self, topic: str, seconds: float) -> None:
+        """Record message handling time for a topic (runs in the paho thread)."""
+        self._topic_samples[topic].append(seconds)
+
+    @staticmethod
+    def _wrap(method: Callable[..., Any], samples: list[float]) -> Callable[..., Any]:
+        """Wrap a method to append its wall time to samples."""
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+
+        return timed
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    entry: EatonUpsConfigEntry,
+    duration: float,
+    *,
+    with_cprofile: bool = False,
+) -> dict[str, str]:
+    """Profile the hot path for duration seconds and write the reports."""
+    profiler = HotPathProfiler(hass, entry, with_cprofile=with_cprofile)
+    profiler.async_start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.async_stop()
+
+    paths = await hass.async_add_executor_job(
+        profiler.write_reports, hass.config.config_dir
+    )
+    LOGGER.info("Profiling report for %s written to %s", entry.title, paths)
+    return paths
@@ -0,0 +1,245 @@
+"""Pre-aggregated recorder statistics for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_PUBLISH_MINUTES
+from .payload import get_number
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.components.sensor import SensorEntityDescription
+
+    from .api import EatonUpsMqttClient
+
+# Long-term statistics rows cover one hour each
+STATISTICS_PERIOD = 3600
+
+
+class HourlyAggregate:
+    """
+    Time-weighted mean, minimum and maximum of a measurement per hour.
+
+    Values are only dispatched on change, so each one is weighted by how long
+    it stayed in effect. The value in effect when an hour ends carries over
+    into the next one.
+    """
+
+    __slots__ = (
+        "completed",
+        "duration",
+        "integral",
+        "maximum",
+        "minimum",
+        "since",
+        "start",
+        "value",
+    )
+
+    def __init__(self, timestamp: float, value: float | None) -> None:
+        """Initialize the aggregate with the value in effect at timestamp."""
+        self.value = value
+        self.completed: list[tuple[float, float, float, float]] = []
+        self._reset(timestamp - timestamp % STATISTICS_PERIOD)
+        self.since = timestamp
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Record a new value taking effect at timestamp."""
+        self.roll(timestamp)
+        self.value = value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def roll(self, timestamp: float) -> None:
+        """Account for the time up to timestamp, completing a finished hour."""
+        end = self.start + STATISTICS_PERIOD
+        if timestamp >= end:
+            self._advance(end)
+            if (row := self.row()) is not None:
+                self.completed.append(row)
+            self._reset(timestamp - timestamp % STATISTICS_PERIOD)
+        self._advance(timestamp)
+
+    def row(self) -> tuple[float, float, float, float] | None:
+        """Return start, mean, minimum and maximum of the hour so far."""
+        if self.duration <= 0 or self.minimum is None or self.maximum is None:
+            return None
+        return (
+            self.start,
+            self.integral / self.duration,
+            self.minimum,
+            self.maximum,
+        )
+
+    def _advance(self, timestamp: float) -> None:
+        """Weight the value in effect by the time elapsed until timestamp."""
+        if timestamp <= self.since:
+            return
+        if self.value is not None:
+            self.integral += self.value * (timestamp - self.since)
+            self.duration += timestamp - self.since
+        self.since = timestamp
+
+    def _reset(self, start: float) -> None:
+        """Start a new hour with the value currently in effect."""
+        self.start = start
+        self.since = start
+        self.integral = 0.0
+        self.duration = 0.0
+        self.minimum = self.maximum = self.value
+
+
+class StatisticsAggregator:
+    """
+    Aggregate measurements in memory and import them as recorder statistics.
+
+    Tracked measurements are accumulated per hour straight from their topic's
+    payloads and imported as external statistics, so minimum and maximum
+    include every value rather than only the rate-limited states the
+    recorder compiles the entity's statistics from. The current hour is
+    re-imported every few minutes, which updates its row in place, and the
+    finished hour once more when it rolls over.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._name = name
+        self._client: EatonUpsMqttClient | None = None
+        self._aggregates: dict[str, HourlyAggregate] = {}
+        self._descriptions: dict[str, SensorEntityDescription] = {}
+        self._fields: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._metadata: dict[str, Any] = {}
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic id of a description key."""
+        return f"{DOMAIN}:{slugify(f'{self._entry_id}_{key}')}"
+
+    def tracks(self, key: str) -> bool:
+        """Return whether a description key is aggregated."""
+        return key in self._aggregates
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient) -> None:
+        """Start importing the aggregates on aligned intervals."""
+        if self._unsub_timer is not None:
+            return
+        self._client = client
+        self._unsub_timer = async_track_utc_time_change(
+            self._hass,
+            self._async_publish,
+            minute=f"/{STATISTICS_PUBLISH_MINUTES}",
+            second=0,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Import what was aggregated so far and stop tracking."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+            self._async_publish()
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+        self._fields.clear()
+        self._client = None
+
+    @callback
+    def async_track(
+        self, description: SensorEntityDescription, data: Mapping[str, Any]
+    ) -> None:
+        """Aggregate the measurement of a description, seeded from data."""
+        key = description.key
+        if key in self._aggregates:
+            return
+        topic, lookup = key.split("$", 1)
+        if topic not in self._fields and self._client is not None:
+            self._unsubscribes.append(
+                self._client.subscribe_to_topic(
+                    topic, partial(self._handle_payload, topic)
+                )
+            )
+        lookup_parts = tuple(lookup.split("/"))
+        self._fields.setdefault(topic, {})[key] = lookup_parts
+        self._descriptions[key] = description
+        self._aggregates[key] = HourlyAggregate(
+            time.time(), get_number(data.get(topic), *lookup_parts)
+        )
+
+    @callback
+    def _handle_payload(self, topic: str, payload: Any) -> None:
+        """Add the tracked numeric fields of a changed topic."""
+        now = time.time()
+        for key, lookup_parts in self._fields.get(topic, {}).items():
+            if (value := get_number(payload, *lookup_parts)) is not None:
+                self._aggregates[key].add(now, value)
+
+    @callback
+    def _async_publish(self, _now: datetime | None = None) -> None:
+        """Import the finished and current hour of every aggregate."""
+        if "recorder" not in self._hass.config.components:
+            return
+        now = time.time()
+        for key, aggregate in self._aggregates.items():
+            aggregate.roll(now)
+            rows = aggregate.completed
+            aggregate.completed = []
+            if (current := aggregate.row()) is not None:
+                rows.append(current)
+            if rows:
+                self._async_import(key, rows)
+
+    @callback
+    def _async_import(
+        self, key: str, rows: list[tuple[float, float, float, float]]
+    ) -> None:
+        """Import hourly rows of a measurement as external statistics."""
+        # The recorder is only loaded with statistics mode enabled
+        from homeassistant.components.recorder.models import (  # noqa: PLC0415
+            StatisticMeanType,
+        )
+        from homeassistant.components.recorder.statistics import (  # noqa: PLC0415
+            async_add_external_statistics,
+        )
+        from homeassistant.components.sensor.const import (  # noqa: PLC0415
+            UNIT_CONVERTERS,
+        )
+
+        if (metadata := self._metadata.get(key)) is None:
+            description = self._descriptions[key]
+            converter = UNIT_CONVERTERS.get(description.device_class)
+            metadata = self._metadata[key] = {
+                "has_sum": False,
+                "mean_type": StatisticMeanType.ARITHMETIC,
+                "name": f"{self._name} {description.name}",
+                "source": DOMAIN,
+                "statistic_id": self.statistic_id(key),
+                "unit_class": converter.UNIT_CLASS if converter else None,
+                "unit_of_measurement": description.native_unit_of_measurement,
+            }
+        async_add_external_statistics(
+            self._hass,
+            metadata,
+            [
+                {
+                    "start": datetime.fromtimestamp(start, UTC),
+                    "mean": mean,
+                    "min": minimum,
+                    "max": maximum,
+                }
+                for start, mean, minimum, maximum in rows
+            ],
+        )
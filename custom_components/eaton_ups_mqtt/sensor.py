@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import re
+import time
 from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -14,6 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    UnitOfDataRate,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfEnergy,
@@ -22,376 +25,485 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
-from .const import MQTT_PREFIX_V1
+from .battery import POWER_BANK_MEASURES_TOPIC
+from .const import DOMAIN, MQTT_PREFIX_V1, STATISTICS_STATE_INTERVAL
+from .distributions import (
+    TEMPLATE_PREFIX,
+    DistributionLayout,
+    get_descriptions,
+    index_distributions,
+)
 from .entity import EatonUpsEntity
+from .enums import (
+    CHARGER_STATUS_OPTIONS,
+    HEALTH_OPTIONS,
+    OPERATING_OPTIONS,
+    get_enum_converter,
+)
+from .fleet import (
+    MEMBERS,
+    MINIMUM_RUNTIME,
+    ON_BATTERY,
+    TOTAL_ENERGY,
+    TOTAL_LOAD,
+    WORST_HEALTH,
+)
+from .power_quality import INPUT_MEASURES_TOPIC, PowerQualityEventType
+from .suppliers import supplier_topic
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import EatonUPSDataUpdateCoordinator
     from .data import EatonUpsConfigEntry
+    from .energy import EnergyIntegrator
+    from .fleet import FleetAggregator
+    from .history import RollingWindow
+    from .listeners import ListenerSource
 
-# Define base entity descriptions for non-dynamic entities
-BASE_ENTITY_DESCRIPTIONS = (
-    # Manager Identification
-    SensorEntityDescription(
-        key="managers/1/identification$firmwareVersion",
-        name="Manager Firmware Version",
-        translation_key="manager_firmware_version",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$physicalName",
-        name="Manager Physical Name",
-        translation_key="manager_physical_name",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$uuid",
-        name="Manager UUID",
-        translation_key="manager_uuid",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$vendor",
-        name="Manager Vendor",
-        translation_key="manager_vendor",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$product",
-        name="Manager Product",
-        translation_key="manager_product",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$serialNumber",
-        name="Manager Serial Number",
-        translation_key="manager_serial_number",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$type",
-        name="Manager Type",
-        translation_key="manager_type",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$partNumber",
-        name="Manager Part Number",
-        translation_key="manager_part_number",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$hwVersion",
-        name="Manager Hardware Version",
-        translation_key="manager_hardware_version",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$contact",
-        name="Manager Contact",
-        translation_key="manager_contact",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$location",
-        name="Manager Location",
-        translation_key="manager_location",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$firmwareInstallationDate",
-        name="Manager Firmware Installation Date",
-        translation_key="manager_firmware_installation_date",
-        device_class=SensorDeviceClass.TIMESTAMP,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$firmwareActivationDate",
-        name="Manager Firmware Activation Date",
-        translation_key="manager_firmware_activation_date",
-        device_class=SensorDeviceClass.TIMESTAMP,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$firmwareDate",
-        name="Manager Firmware Date",
-        translation_key="manager_firmware_date",
-        device_class=SensorDeviceClass.TIMESTAMP,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$firmwareSha",
-        name="Manager Firmware SHA",
-        translation_key="manager_firmware_sha",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$bootloaderVersion",
-        name="Manager Bootloader Version",
-        translation_key="manager_bootloader_version",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="managers/1/identification$macAddress",
-        name="Manager MAC Address",
-        translation_key="manager_mac_address",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    # Power Distribution Identification
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$uuid",
-        name="UPS UUID",
-        translation_key="ups_uuid",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$physicalName",
-        name="UPS Physical Name",
-        translation_key="ups_physical_name",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$friendlyName",
-        name="UPS Friendly Name",
-        translation_key="ups_friendly_name",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$partNumber",
-        name="UPS Part Number",
-        translation_key="ups_part_number",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$referenceNumber",
-        name="UPS Reference Number",
-        translation_key="ups_reference_number",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$vendor",
-        name="UPS Vendor",
-        translation_key="ups_vendor",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$model",
-        name="UPS Model",
-        translation_key="ups_model",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$serialNumber",
-        name="UPS Serial Number",
-        translation_key="ups_serial_number",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$type",
-        name="UPS Type",
-        translation_key="ups_type",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$productName",
-        name="UPS Product Name",
-        translation_key="ups_product_name",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$firmwareVersion",
-        name="UPS Firmware Version",
-        translation_key="ups_firmware_version",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/identification$name",
-        name="UPS Name",
-        translation_key="ups_name",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    # Power Distribution Status
-    SensorEntityDescription(
-        key="powerDistributions/1/status$operating",
-        name="UPS Operating Status",
-        translation_key="ups_operating_status",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/status$health",
-        name="UPS Health",
-        translation_key="ups_health",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/status$mode",
-        name="UPS Mode",
-        translation_key="ups_mode",
-    ),
-    # Backup System - Power Bank Measures
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/measures$remainingTime",
-        name="Backup Remaining Time",
-        translation_key="backup_remaining_time",
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        device_class=SensorDeviceClass.DURATION,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/measures$stateOfCharge",
-        name="Backup State of Charge",
-        translation_key="backup_state_of_charge",
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/measures$voltage",
-        name="Backup Voltage",
-        translation_key="backup_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    # Backup System - Power Bank Settings
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/settings$lowRuntimeThreshold",
-        name="Backup Low Runtime Threshold",
-        translation_key="backup_low_runtime_threshold",
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        device_class=SensorDeviceClass.DURATION,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/settings$lowStateOfChargeThreshold",
-        name="Backup Low Charge Threshold",
-        translation_key="backup_low_charge_threshold",
-        native_unit_of_measurement=PERCENTAGE,
-    ),
-    # Backup System - Power Bank Specifications
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/specifications$externalCount",
-        name="Backup External Count",
-        translation_key="backup_external_count",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/specifications$technology",
-        name="Backup Technology",
-        translation_key="backup_technology",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/specifications$capacityAh/nominal",
-        name="Backup Nominal Capacity",
-        translation_key="backup_nominal_capacity",
-        native_unit_of_measurement="Ah",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/specifications$voltage/nominal",
-        name="Backup Nominal Voltage",
-        translation_key="backup_nominal_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    # Backup System - Power Bank Status
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$operating",
-        name="Backup Operating Status",
-        translation_key="backup_operating_status",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$health",
-        name="Backup Health",
-        translation_key="backup_health",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lastTestResult",
-        name="Backup Last Test Result",
-        translation_key="backup_last_test_result",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lastTestResultDate",
-        name="Backup Last Test Date",
-        translation_key="backup_last_test_date",
-        device_class=SensorDeviceClass.TIMESTAMP,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lcmInstallationDate",
-        name="Backup Installation Date",
-        translation_key="backup_installation_date",
-        device_class=SensorDeviceClass.DATE,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/status$lcmReplacementDate",
-        name="Backup Replacement Date",
-        translation_key="backup_replacement_date",
-        device_class=SensorDeviceClass.DATE,
-    ),
-    # Backup System - Charger Status
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$operating",
-        name="Charger Operating Status",
-        translation_key="charger_operating_status",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$health",
-        name="Charger Health",
-        translation_key="charger_health",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$chargerStatus",
-        name="Charger Status",
-        translation_key="charger_status",
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$mode",
-        name="Charger Mode",
-        translation_key="charger_mode",
-    ),
-    # Power Distribution Settings
-    SensorEntityDescription(
-        key="powerDistributions/1/settings$audibleAlarm",
-        name="Audible Alarm",
-        translation_key="audible_alarm",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/settings$nominalVoltage",
-        name="Nominal Voltage",
-        translation_key="nominal_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/settings$sensitivityMode",
-        name="Sensitivity Mode",
-        translation_key="sensitivity_mode",
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/settings$voltageHighDetection",
-        name="Voltage High Detection",
-        translation_key="voltage_high_detection",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    SensorEntityDescription(
-        key="powerDistributions/1/settings$voltageLowDetection",
-        name="Voltage Low Detection",
-        translation_key="voltage_low_detection",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-)
+
+def _generate_base_descriptions() -> tuple[SensorEntityDescription, ...]:
+    """Return the descriptions of entities that are not discovered dynamically."""
+    return (
+        # Manager Identification
+        SensorEntityDescription(
+            key="managers/1/identification$firmwareVersion",
+            name="Manager Firmware Version",
+            translation_key="manager_firmware_version",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$physicalName",
+            name="Manager Physical Name",
+            translation_key="manager_physical_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$uuid",
+            name="Manager UUID",
+            translation_key="manager_uuid",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$vendor",
+            name="Manager Vendor",
+            translation_key="manager_vendor",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$product",
+            name="Manager Product",
+            translation_key="manager_product",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$serialNumber",
+            name="Manager Serial Number",
+            translation_key="manager_serial_number",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$type",
+            name="Manager Type",
+            translation_key="manager_type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$partNumber",
+            name="Manager Part Number",
+            translation_key="manager_part_number",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$hwVersion",
+            name="Manager Hardware Version",
+            translation_key="manager_hardware_version",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$contact",
+            name="Manager Contact",
+            translation_key="manager_contact",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$location",
+            name="Manager Location",
+            translation_key="manager_location",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$firmwareInstallationDate",
+            name="Manager Firmware Installation Date",
+            translation_key="manager_firmware_installation_date",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$firmwareActivationDate",
+            name="Manager Firmware Activation Date",
+            translation_key="manager_firmware_activation_date",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$firmwareDate",
+            name="Manager Firmware Date",
+            translation_key="manager_firmware_date",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$firmwareSha",
+            name="Manager Firmware SHA",
+            translation_key="manager_firmware_sha",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$bootloaderVersion",
+            name="Manager Bootloader Version",
+            translation_key="manager_bootloader_version",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$macAddress",
+            name="Manager MAC Address",
+            translation_key="manager_mac_address",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # Power Distribution Identification
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$uuid",
+            name="UPS UUID",
+            translation_key="ups_uuid",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$physicalName",
+            name="UPS Physical Name",
+            translation_key="ups_physical_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$friendlyName",
+            name="UPS Friendly Name",
+            translation_key="ups_friendly_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$partNumber",
+            name="UPS Part Number",
+            translation_key="ups_part_number",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$referenceNumber",
+            name="UPS Reference Number",
+            translation_key="ups_reference_number",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$vendor",
+            name="UPS Vendor",
+            translation_key="ups_vendor",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$model",
+            name="UPS Model",
+            translation_key="ups_model",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$serialNumber",
+            name="UPS Serial Number",
+            translation_key="ups_serial_number",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$type",
+            name="UPS Type",
+            translation_key="ups_type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$productName",
+            name="UPS Product Name",
+            translation_key="ups_product_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$firmwareVersion",
+            name="UPS Firmware Version",
+            translation_key="ups_firmware_version",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/identification$name",
+            name="UPS Name",
+            translation_key="ups_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # Power Distribution Status
+        SensorEntityDescription(
+            key="powerDistributions/1/status$operating",
+            name="UPS Operating Status",
+            translation_key="ups_operating_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=OPERATING_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/status$health",
+            name="UPS Health",
+            translation_key="ups_health",
+            device_class=SensorDeviceClass.ENUM,
+            options=HEALTH_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/status$mode",
+            name="UPS Mode",
+            translation_key="ups_mode",
+        ),
+        # Backup System - Power Bank Measures
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/measures$remainingTime",
+            name="Backup Remaining Time",
+            translation_key="backup_remaining_time",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/measures$stateOfCharge",
+            name="Backup State of Charge",
+            translation_key="backup_state_of_charge",
+            native_unit_of_measurement=PERCENTAGE,
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/measures$voltage",
+            name="Backup Voltage",
+            translation_key="backup_voltage",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            suggested_display_precision=1,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        # Backup System - Power Bank Settings
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/settings$lowRuntimeThreshold",
+            name="Backup Low Runtime Threshold",
+            translation_key="backup_low_runtime_threshold",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/settings$lowStateOfChargeThreshold",
+            name="Backup Low Charge Threshold",
+            translation_key="backup_low_charge_threshold",
+            native_unit_of_measurement=PERCENTAGE,
+        ),
+        # Backup System - Power Bank Specifications
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/specifications$externalCount",
+            name="Backup External Count",
+            translation_key="backup_external_count",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/specifications$technology",
+            name="Backup Technology",
+            translation_key="backup_technology",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/specifications$capacityAh/nominal",
+            name="Backup Nominal Capacity",
+            translation_key="backup_nominal_capacity",
+            native_unit_of_measurement="Ah",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/specifications$voltage/nominal",
+            name="Backup Nominal Voltage",
+            translation_key="backup_nominal_voltage",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # Backup System - Power Bank Status
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$operating",
+            name="Backup Operating Status",
+            translation_key="backup_operating_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=OPERATING_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$health",
+            name="Backup Health",
+            translation_key="backup_health",
+            device_class=SensorDeviceClass.ENUM,
+            options=HEALTH_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lastTestResult",
+            name="Backup Last Test Result",
+            translation_key="backup_last_test_result",
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lastTestResultDate",
+            name="Backup Last Test Date",
+            translation_key="backup_last_test_date",
+            device_class=SensorDeviceClass.TIMESTAMP,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lcmInstallationDate",
+            name="Backup Installation Date",
+            translation_key="backup_installation_date",
+            device_class=SensorDeviceClass.DATE,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/status$lcmReplacementDate",
+            name="Backup Replacement Date",
+            translation_key="backup_replacement_date",
+            device_class=SensorDeviceClass.DATE,
+        ),
+        # Backup System - Charger Status
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$operating",
+            name="Charger Operating Status",
+            translation_key="charger_operating_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=OPERATING_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$health",
+            name="Charger Health",
+            translation_key="charger_health",
+            device_class=SensorDeviceClass.ENUM,
+            options=HEALTH_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$chargerStatus",
+            name="Charger Status",
+            translation_key="charger_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=CHARGER_STATUS_OPTIONS,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/backupSystem/powerBank/chargers/1/status$mode",
+            name="Charger Mode",
+            translation_key="charger_mode",
+        ),
+        # Power Distribution Settings
+        SensorEntityDescription(
+            key="powerDistributions/1/settings$audibleAlarm",
+            name="Audible Alarm",
+            translation_key="audible_alarm",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/settings$nominalVoltage",
+            name="Nominal Voltage",
+            translation_key="nominal_voltage",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/settings$sensitivityMode",
+            name="Sensitivity Mode",
+            translation_key="sensitivity_mode",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/settings$voltageHighDetection",
+            name="Voltage High Detection",
+            translation_key="voltage_high_detection",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="powerDistributions/1/settings$voltageLowDetection",
+            name="Voltage Low Detection",
+            translation_key="voltage_low_detection",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # Environmental sensor service status
+        SensorEntityDescription(
+            key="sensors/status$operating",
+            name="Sensors Operating Status",
+            translation_key="sensors_operating_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=OPERATING_OPTIONS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="sensors/status$health",
+            name="Sensors Health",
+            translation_key="sensors_health",
+            device_class=SensorDeviceClass.ENUM,
+            options=HEALTH_OPTIONS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    )
+
+
+def _generate_card_descriptions() -> tuple[SensorEntityDescription, ...]:
+    """Return the card-level base descriptions."""
+    return tuple(
+        description
+        for description in _generate_base_descriptions()
+        if not description.key.startswith(TEMPLATE_PREFIX)
+    )
+
+
+def _generate_manager_v1_descriptions() -> tuple[SensorEntityDescription, ...]:
+    """Return the M2 manager identification, with separate name and manufacturer."""
+    return (
+        SensorEntityDescription(
+            key="managers/1/identification$name",
+            name="Manager Name",
+            translation_key="manager_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        SensorEntityDescription(
+            key="managers/1/identification$manufacturer",
+            name="Manager Manufacturer",
+            translation_key="manager_manufacturer",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    )
+
+
+def _generate_manager_v2_descriptions() -> tuple[SensorEntityDescription, ...]:
+    """
+    Return the M3 manager identification descriptions.
+
+    M3 uses friendlyName instead of name; manufacturer is absent and vendor
+    from the base descriptions covers that role.
+    """
+    return (
+        SensorEntityDescription(
+            key="managers/1/identification$friendlyName",
+            name="Manager Friendly Name",
+            translation_key="manager_friendly_name",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    )
 
 
 def _generate_input_descriptions(input_num: int) -> tuple[SensorEntityDescription, ...]:
@@ -606,11 +718,15 @@ def _generate_outlet_descriptions(
             key=f"powerDistributions/1/outlets/{outlet_num}/status$operating",
             name=f"Outlet {outlet_num} Operating Status",
             translation_key="outlet_operating_status",
+            device_class=SensorDeviceClass.ENUM,
+            options=OPERATING_OPTIONS,
         ),
         SensorEntityDescription(
             key=f"powerDistributions/1/outlets/{outlet_num}/status$health",
             name=f"Outlet {outlet_num} Health",
             translation_key="outlet_health",
+            device_class=SensorDeviceClass.ENUM,
+            options=HEALTH_OPTIONS,
         ),
         SensorEntityDescription(
             key=f"powerDistributions/1/outlets/{outlet_num}/status$supplierPowerQuality",
@@ -620,6 +736,143 @@ def _generate_outlet_descriptions(
     )
 
 
+def _generate_phase_descriptions(
+    kind: str, num: int, phase: int
+) -> tuple[SensorEntityDescription, ...]:
+    """Generate sensor descriptions for one phase of an input or output."""
+    name = f"{kind[:-1].capitalize()} {num} Phase {phase}"
+    key = f"powerDistributions/1/{kind}/{num}/phases/{phase}/measures"
+    descriptions = [
+        SensorEntityDescription(
+            key=f"{key}$voltage",
+            name=f"{name} Voltage",
+            translation_key=f"{kind[:-1]}_phase_voltage",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            suggested_display_precision=1,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key=f"{key}$current",
+            name=f"{name} Current",
+            translation_key=f"{kind[:-1]}_phase_current",
+            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            suggested_display_precision=1,
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+    ]
+    if kind == "outputs":
+        descriptions.extend(
+            (
+                SensorEntityDescription(
+                    key=f"{key}$activePower",
+                    name=f"{name} Active Power",
+                    translation_key="output_phase_active_power",
+                    native_unit_of_measurement=UnitOfPower.WATT,
+                    device_class=SensorDeviceClass.POWER,
+                    state_class=SensorStateClass.MEASUREMENT,
+                ),
+                SensorEntityDescription(
+                    key=f"{key}$apparentPower",
+                    name=f"{name} Apparent Power",
+                    translation_key="output_phase_apparent_power",
+                    native_unit_of_measurement="VA",
+                    state_class=SensorStateClass.MEASUREMENT,
+                ),
+                SensorEntityDescription(
+                    key=f"{key}$percentLoad",
+                    name=f"{name} Load",
+                    translation_key="output_phase_load",
+                    native_unit_of_measurement=PERCENTAGE,
+                    state_class=SensorStateClass.MEASUREMENT,
+                ),
+                SensorEntityDescription(
+                    key=f"{key}$powerFactor",
+                    name=f"{name} Power Factor",
+                    translation_key="output_phase_power_factor",
+                    suggested_display_precision=2,
+                    state_class=SensorStateClass.MEASUREMENT,
+                ),
+            )
+        )
+    return tuple(descriptions)
+
+
+def _get_phase_descriptions(
+    layout: DistributionLayout, distribution_id: str
+) -> list[SensorEntityDescription]:
+    """
+    Generate per-phase descriptions for multi-phase inputs and outputs.
+
+    Single-phase units publish phase 1 with the same values as the input or
+    output itself, so phases are only exposed when there are at least two.
+    """
+    descriptions: list[SensorEntityDescription] = []
+    for kind in ("inputs", "outputs"):
+        for num in layout.numbers(kind):
+            phases = layout.phases(kind, num)
+            if len(phases) == 1:
+                continue
+            for phase in phases:
+                descriptions.extend(
+                    get_descriptions(
+                        _generate_phase_descriptions,
+                        kind,
+                        num,
+                        phase,
+                        distribution_id=distribution_id,
+                    )
+                )
+    return descriptions
+
+
+def _generate_distribution_descriptions() -> tuple[SensorEntityDescription, ...]:
+    """Return the base descriptions rebased onto every powerDistribution."""
+    return tuple(
+        description
+        for description in _generate_base_descriptions()
+        if description.key.startswith(TEMPLATE_PREFIX)
+    )
+
+
+def _get_distribution_descriptions(
+    layout: DistributionLayout, distribution_id: str
+) -> list[SensorEntityDescription]:
+    """Select the shared descriptions that apply to one distribution."""
+    descriptions = list(
+        get_descriptions(
+            _generate_distribution_descriptions, distribution_id=distribution_id
+        )
+    )
+    for input_num in layout.numbers("inputs"):
+        descriptions.extend(
+            get_descriptions(
+                _generate_input_descriptions,
+                input_num,
+                distribution_id=distribution_id,
+            )
+        )
+    for output_num in layout.numbers("outputs"):
+        descriptions.extend(
+            get_descriptions(
+                _generate_output_descriptions,
+                output_num,
+                distribution_id=distribution_id,
+            )
+        )
+    descriptions.extend(_get_phase_descriptions(layout, distribution_id))
+    for outlet_num in layout.numbers("outlets"):
+        descriptions.extend(
+            get_descriptions(
+                _generate_outlet_descriptions,
+                outlet_num,
+                distribution_id=distribution_id,
+            )
+        )
+    return descriptions
+
+
 SENSOR_TEMP_PATTERN = re.compile(
     r"^sensors/devices/([^/]+)/channels/temperatures/([^/]+)/measures$"
 )
@@ -673,96 +926,405 @@ def _generate_sensor_humidity_description(
     )
 
 
+def _generate_supplier_descriptions(
+    supplier_id: str, supplier_name: str, topics: frozenset[str]
+) -> tuple[SensorEntityDescription, ...]:
+    """Generate sensor descriptions for the topics a power supplier publishes."""
+    summary = supplier_topic(supplier_id, "summary")
+    schedule = supplier_topic(supplier_id, "schedule")
+    shutdown = supplier_topic(supplier_id, "shutdownDurations")
+    powerdown = supplier_topic(supplier_id, "estimatedPowerdownCommand")
+    candidates = (
+        SensorEntityDescription(
+            key=f"{summary}$protectionCapacityRuntime",
+            name=f"{supplier_name} Runtime",
+            translation_key="supplier_runtime",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key=f"{summary}$protectionCapacityPercent",
+            name=f"{supplier_name} Capacity",
+            translation_key="supplier_capacity",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key=f"{schedule}$delayBeforePowerDown",
+            name=f"{supplier_name} Delay Before Power Down",
+            translation_key="supplier_delay_before_power_down",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+        SensorEntityDescription(
+            key=f"{shutdown}$normal",
+            name=f"{supplier_name} Shutdown Duration",
+            translation_key="supplier_shutdown_duration",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+        SensorEntityDescription(
+            key=f"{shutdown}$critical",
+            name=f"{supplier_name} Critical Shutdown Duration",
+            translation_key="supplier_critical_shutdown_duration",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+        SensorEntityDescription(
+            key=f"{powerdown}$delay",
+            name=f"{supplier_name} Estimated Power Down Delay",
+            translation_key="supplier_estimated_power_down_delay",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+    )
+    return tuple(
+        description
+        for description in candidates
+        if description.key.partition("$")[0] in topics
+    )
+
+
 def get_entity_descriptions(
     coordinator: EatonUPSDataUpdateCoordinator,
 ) -> tuple[SensorEntityDescription, ...]:
     """Get entity descriptions based on available MQTT topics."""
-    descriptions = list(BASE_ENTITY_DESCRIPTIONS)
+    descriptions = list(get_descriptions(_generate_card_descriptions))
 
     # Version-dependent manager identification fields
     prefix = coordinator.config_entry.runtime_data.client.mqtt_prefix
     if prefix == MQTT_PREFIX_V1:
-        # M2 has name and manufacturer as separate fields
+        descriptions.extend(get_descriptions(_generate_manager_v1_descriptions))
+    else:
+        descriptions.extend(get_descriptions(_generate_manager_v2_descriptions))
+
+    # Detect distributions with their inputs, outputs, phases and outlets
+    for distribution_id, layout in index_distributions(coordinator.data).items():
+        descriptions.extend(_get_distribution_descriptions(layout, distribution_id))
+
+    # Detect environmental sensor probe channels
+    for key in coordinator.data:
+        match = SENSOR_TEMP_PATTERN.match(key)
+        if match:
+            device_id, channel_id = match.groups()
+            channel_name = _get_sensor_channel_name(
+                coordinator.data, "temperatures", device_id, channel_id
+            )
+            descriptions.append(
+                _generate_sensor_temperature_description(
+                    device_id, channel_id, channel_name
+                )
+            )
+            continue
+
+        match = SENSOR_HUMIDITY_PATTERN.match(key)
+        if match:
+            device_id, channel_id = match.groups()
+            channel_name = _get_sensor_channel_name(
+                coordinator.data, "humidities", device_id, channel_id
+            )
+            descriptions.append(
+                _generate_sensor_humidity_description(
+                    device_id, channel_id, channel_name
+                )
+            )
+
+    # Detect powerService suppliers from the client's incremental index
+    suppliers = coordinator.config_entry.runtime_data.client.suppliers
+    for supplier_id in suppliers.supplier_ids:
         descriptions.extend(
-            [
-                SensorEntityDescription(
-                    key="managers/1/identification$name",
-                    name="Manager Name",
-                    translation_key="manager_name",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                ),
-                SensorEntityDescription(
-                    key="managers/1/identification$manufacturer",
-                    name="Manager Manufacturer",
-                    translation_key="manager_manufacturer",
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                ),
-            ]
+            _generate_supplier_descriptions(
+                supplier_id,
+                suppliers.name(supplier_id, coordinator.data),
+                suppliers.topics(supplier_id),
+            )
         )
-    else:
-        # M3 uses friendlyName instead of name; manufacturer is absent
-        # and vendor from the base descriptions covers that role
-        descriptions.append(
-            SensorEntityDescription(
-                key="managers/1/identification$friendlyName",
-                name="Manager Friendly Name",
-                translation_key="manager_friendly_name",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ),
+
+    return tuple(descriptions)
+
+
+CRITICAL_LATENCY_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="critical_topic_latency",
+    name="Critical Topic Latency",
+    translation_key="critical_topic_latency",
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    state_class=SensorStateClass.MEASUREMENT,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+
+ACTIVE_ALARMS_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="active_alarms",
+    name="Active Alarms",
+    translation_key="active_alarms",
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
+# Measurements that get rolling aggregate sensors with measurement history
+HISTORY_TRANSLATION_KEYS = frozenset(
+    {"output_load", "input_voltage", "backup_remaining_time", "sensor_temperature"}
+)
+HISTORY_AGGREGATES = {
+    "minimum": "5 min Minimum",
+    "maximum": "5 min Maximum",
+    "mean": "5 min Average",
+}
+
+
+def _generate_history_descriptions(
+    source: SensorEntityDescription,
+) -> tuple[SensorEntityDescription, ...]:
+    """Generate rolling aggregate sensor descriptions for a measurement."""
+    return tuple(
+        SensorEntityDescription(
+            key=f"{source.key}@{aggregate}",
+            name=f"{source.name} {label}",
+            translation_key=f"measurement_{aggregate}",
+            native_unit_of_measurement=source.native_unit_of_measurement,
+            suggested_unit_of_measurement=source.suggested_unit_of_measurement,
+            suggested_display_precision=source.suggested_display_precision,
+            device_class=source.device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
         )
+        for aggregate, label in HISTORY_AGGREGATES.items()
+    )
+
+
+# Output and outlet power readings that get an integrated energy sensor when
+# their measures lack a cumulatedEnergy counter
+DERIVED_ENERGY_PATTERN = re.compile(
+    r"^powerDistributions/[^/]+/(?:outputs|outlets)/\d+/measures\$activePower$"
+)
+
+
+def _needs_derived_energy(
+    description: SensorEntityDescription, data: dict[str, Any]
+) -> bool:
+    """Return whether a power reading has no energy counter next to it."""
+    if not DERIVED_ENERGY_PATTERN.match(description.key):
+        return False
+    measures = data.get(description.key.partition("$")[0])
+    return (
+        isinstance(measures, dict)
+        and "activePower" in measures
+        and "cumulatedEnergy" not in measures
+    )
+
+
+def _generate_energy_description(
+    source: SensorEntityDescription,
+) -> SensorEntityDescription:
+    """Generate the integrated energy sensor description for a power reading."""
+    name = str(source.name).removesuffix(" Active Power")
+    return SensorEntityDescription(
+        key=f"{source.key}@energy",
+        name=f"{name} Integrated Energy",
+        translation_key="integrated_energy",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        suggested_display_precision=3,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    )
+
 
-    # Detect inputs
-    for input_num in range(1, 10):  # Check reasonable range
-        if any(
-            key.startswith(f"powerDistributions/1/inputs/{input_num}/")
-            for key in coordinator.data
-        ):
-            descriptions.extend(_generate_input_descriptions(input_num))
-
-    # Detect outputs
-    for output_num in range(1, 10):
-        if any(
-            key.startswith(f"powerDistributions/1/outputs/{output_num}/")
-            for key in coordinator.data
-        ):
-            descriptions.extend(_generate_output_descriptions(output_num))
-
-    # Detect outlets
-    for outlet_num in range(1, 10):
-        if any(
-            key.startswith(f"powerDistributions/1/outlets/{outlet_num}/")
-            for key in coordinator.data
-        ):
-            descriptions.extend(_generate_outlet_descriptions(outlet_num))
+# Battery analytics sensors, keyed by BatteryAnalytics snapshot keys
+BATTERY_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="capacity",
+        name="Battery Capacity Estimate",
+        translation_key="battery_capacity_estimate",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        suggested_display_precision=0,
+        device_class=SensorDeviceClass.ENERGY_STORAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="capacity_fade",
+        name="Battery Capacity Fade",
+        translation_key="battery_capacity_fade",
+        native_unit_of_measurement="%/yr",
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="estimated_runtime",
+        name="Battery Estimated Runtime",
+        translation_key="battery_estimated_runtime",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="discharges",
+        name="Battery Discharges Recorded",
+        translation_key="battery_discharges",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+# Daily power quality event counters: name suffix and translation key by type
+POWER_QUALITY_COUNTERS = {
+    PowerQualityEventType.SAG: ("Sags Today", "input_sags_today"),
+    PowerQualityEventType.SWELL: ("Swells Today", "input_swells_today"),
+    PowerQualityEventType.FREQUENCY_EXCURSION: (
+        "Frequency Excursions Today",
+        "input_frequency_excursions_today",
+    ),
+}
+
+
+def _generate_power_quality_description(
+    input_num: int, event_type: PowerQualityEventType
+) -> SensorEntityDescription:
+    """Generate the daily counter description of an input's event type."""
+    name, translation_key = POWER_QUALITY_COUNTERS[event_type]
+    return SensorEntityDescription(
+        key=f"input_{input_num}_{event_type}_today",
+        name=f"Input {input_num} {name}",
+        translation_key=translation_key,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    )
+
+
+# Fleet aggregate sensors, keyed by FleetAggregator value keys
+FLEET_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key=TOTAL_LOAD,
+        name="Total Load",
+        translation_key="fleet_total_load",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=TOTAL_ENERGY,
+        name="Total Energy",
+        translation_key="fleet_total_energy",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=ON_BATTERY,
+        name="UPS On Battery",
+        translation_key="fleet_on_battery",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=MINIMUM_RUNTIME,
+        name="Minimum Runtime",
+        translation_key="fleet_minimum_runtime",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=WORST_HEALTH,
+        name="Worst Health",
+        translation_key="fleet_worst_health",
+        device_class=SensorDeviceClass.ENUM,
+        options=HEALTH_OPTIONS,
+    ),
+    SensorEntityDescription(
+        key=MEMBERS,
+        name="UPS Count",
+        translation_key="fleet_members",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
 
-    # Detect environmental sensor probe channels
-    for key in coordinator.data:
-        match = SENSOR_TEMP_PATTERN.match(key)
-        if match:
-            device_id, channel_id = match.groups()
-            channel_name = _get_sensor_channel_name(
-                coordinator.data, "temperatures", device_id, channel_id
-            )
-            descriptions.append(
-                _generate_sensor_temperature_description(
-                    device_id, channel_id, channel_name
-                )
-            )
-            continue
+FLEET_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, "fleet")},
+    name="Eaton UPS Fleet",
+    manufacturer="Eaton",
+    model="UPS fleet",
+)
 
-        match = SENSOR_HUMIDITY_PATTERN.match(key)
-        if match:
-            device_id, channel_id = match.groups()
-            channel_name = _get_sensor_channel_name(
-                coordinator.data, "humidities", device_id, channel_id
-            )
-            descriptions.append(
-                _generate_sensor_humidity_description(
-                    device_id, channel_id, channel_name
-                )
-            )
 
-    return tuple(descriptions)
+# Ingest self-instrumentation sensors, keyed by IngestStatsPublisher snapshot keys
+INGEST_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="messages_per_second",
+        name="Ingest Messages Per Second",
+        translation_key="ingest_messages_per_second",
+        native_unit_of_measurement="msg/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="bytes_per_second",
+        name="Ingest Data Rate",
+        translation_key="ingest_bytes_per_second",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="decode_time_p50",
+        name="Ingest Decode Time p50",
+        translation_key="ingest_decode_time_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="decode_time_p99",
+        name="Ingest Decode Time p99",
+        translation_key="ingest_decode_time_p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="dispatch_lag_p99",
+        name="Ingest Dispatch Lag p99",
+        translation_key="ingest_dispatch_lag_p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="suppressed_duplicates",
+        name="Ingest Suppressed Duplicates",
+        translation_key="ingest_suppressed_duplicates",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="reconnects",
+        name="MQTT Reconnects",
+        translation_key="ingest_reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="connack_latency",
+        name="MQTT CONNACK Latency",
+        translation_key="ingest_connack_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="tls_handshake_time",
+        name="MQTT TLS Handshake Time",
+        translation_key="ingest_tls_handshake_time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -779,6 +1341,13 @@ async def async_setup_entry(
     # Generate descriptions based on available data
     entity_descriptions = get_entity_descriptions(coordinator)
 
+    # Measurements are aggregated before their entities are created, so the
+    # entities know to rate-limit their state writes
+    if coordinator.statistics is not None:
+        for entity_description in entity_descriptions:
+            if entity_description.state_class == SensorStateClass.MEASUREMENT:
+                coordinator.statistics.async_track(entity_description, coordinator.data)
+
     async_add_entities(
         EatonUpsSensor(
             coordinator=coordinator,
@@ -787,6 +1356,75 @@ async def async_setup_entry(
         for entity_description in entity_descriptions
     )
 
+    async_add_entities(
+        [
+            EatonUpsCriticalLatencySensor(coordinator=coordinator),
+            EatonUpsActiveAlarmsSensor(coordinator=coordinator),
+        ]
+    )
+
+    async_add_entities(
+        EatonUpsEnergySensor(
+            coordinator=coordinator,
+            entity_description=_generate_energy_description(source),
+        )
+        for source in entity_descriptions
+        if _needs_derived_energy(source, coordinator.data)
+    )
+
+    async_add_entities(
+        EatonUpsBatterySensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in BATTERY_ENTITY_DESCRIPTIONS
+    )
+
+    async_add_entities(
+        EatonUpsPowerQualitySensor(
+            coordinator=coordinator, input_num=input_num, event_type=event_type
+        )
+        for input_num in coordinator.power_quality.inputs
+        for event_type in POWER_QUALITY_COUNTERS
+    )
+
+    if (fleet := coordinator.fleet) is not None:
+
+        @callback
+        def add_fleet_entities() -> None:
+            """Provide the fleet entities from this entry."""
+            async_add_entities(
+                (
+                    EatonUpsFleetEnergySensor(fleet=fleet, entity_description=desc)
+                    if desc.key == TOTAL_ENERGY
+                    else EatonUpsFleetSensor(fleet=fleet, entity_description=desc)
+                )
+                for desc in FLEET_ENTITY_DESCRIPTIONS
+            )
+
+        fleet.async_add_provider(entry.entry_id, add_fleet_entities)
+
+    if coordinator.history is not None:
+        async_add_entities(
+            EatonUpsHistorySensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+                window=coordinator.history.async_track(source.key, coordinator.data),
+            )
+            for source in entity_descriptions
+            if source.translation_key in HISTORY_TRANSLATION_KEYS
+            for entity_description in _generate_history_descriptions(source)
+        )
+
+    if coordinator.ingest_stats is not None:
+        async_add_entities(
+            EatonUpsIngestSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in INGEST_ENTITY_DESCRIPTIONS
+        )
+
 
 class EatonUpsSensor(EatonUpsEntity, SensorEntity):
     """eaton_ups_mqtt sensor class."""
@@ -797,38 +1435,93 @@ class EatonUpsSensor(EatonUpsEntity, SensorEntity):
         entity_description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
-        self.entity_description = entity_description
+        super().__init__(coordinator, entity_description)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
 
+        # Parse the key once into the topic and lookup path within its data
+        self._topic, lookup = entity_description.key.split("$", 1)
+        self._lookup_parts = tuple(lookup.split("/"))
+
+        # Resolve the value converter once instead of on every read
+        self._converter: Callable[[Any], Any] | None = None
+        if entity_description.device_class == SensorDeviceClass.DATE:
+            self._converter = self._convert_date
+        elif entity_description.device_class == SensorDeviceClass.TIMESTAMP:
+            self._converter = self._convert_timestamp
+        elif entity_description.device_class == SensorDeviceClass.ENUM:
+            self._converter = get_enum_converter(entity_description.key)
+
+        # Converters map None to None, so the cache starts out consistent
+        self._last_raw: Any = None
+        self._last_converted: Any = None
+
+        # Aggregated measurements keep their state class, so the entity's own
+        # statistics continue from the rate-limited states
+        self._write_interval: float | None = None
+        self._last_write = float("-inf")
+        self._unsub_deferred_write: Callable[[], None] | None = None
+        statistics = coordinator.statistics
+        if statistics is not None and statistics.tracks(entity_description.key):
+            self._write_interval = STATISTICS_STATE_INTERVAL
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending deferred state write."""
+        if self._unsub_deferred_write is not None:
+            self._unsub_deferred_write()
+            self._unsub_deferred_write = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, at most once per interval for aggregated values."""
+        if self._write_interval is None:
+            super()._handle_coordinator_update()
+            return
+        if self._unsub_deferred_write is not None:
+            return
+        delay = self._last_write + self._write_interval - time.monotonic()
+        if delay > 0:
+            # Defer rather than drop, so the latest value is always written
+            self._unsub_deferred_write = async_call_later(
+                self.hass, delay, self._async_deferred_write
+            )
+            return
+        self._last_write = time.monotonic()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_deferred_write(self, _now: datetime) -> None:
+        """Write the state held back by the rate limit."""
+        self._unsub_deferred_write = None
+        self._last_write = time.monotonic()
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> Any:
         """Return the native value of the sensor."""
         if not self.coordinator.data:
             return None
 
-        # Parse the key to extract topic and lookup path within the topic's data
-        topic, lookup = self.entity_description.key.split("$", 1)
-        lookup_parts = lookup.split("/")
-
         # Navigate through the data structure
-        value = self.coordinator.data.get(topic, {})
-        for part in lookup_parts:
+        value = self.coordinator.data.get(self._topic, {})
+        for part in self._lookup_parts:
             if not (isinstance(value, dict) and part in value):
                 return None
             value = value[part]
 
-        # Handle date and timestamp conversions if needed
-        if self.entity_description.device_class == SensorDeviceClass.DATE:
-            return self._convert_date(value)
-        if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
-            return self._convert_timestamp(value)
+        if self._converter is None:
+            return value
 
-        return value
+        # Dates and states rarely change, so only convert when the raw value did
+        if value != self._last_raw:
+            self._last_raw = value
+            self._last_converted = self._converter(value)
+        return self._last_converted
 
-    def _convert_date(self, value: Any) -> date | None:
+    @staticmethod
+    def _convert_date(value: Any) -> date | None:
         """Convert value to date if possible."""
         if isinstance(value, int):
             try:
@@ -844,7 +1537,8 @@ class EatonUpsSensor(EatonUpsEntity, SensorEntity):
 
         return None
 
-    def _convert_timestamp(self, value: Any) -> datetime | None:
+    @staticmethod
+    def _convert_timestamp(value: Any) -> datetime | None:
         """Convert value to timestamp if possible."""
         if isinstance(value, int):
             try:
@@ -859,3 +1553,378 @@ class EatonUpsSensor(EatonUpsEntity, SensorEntity):
                 pass
 
         return None
+
+
+class EatonUpsListenerSensor(SensorEntity):
+    """
+    Sensor fed by one of the coordinator's helpers.
+
+    Not a coordinator entity: it only refreshes when its listener source
+    calls its listeners, never per MQTT message.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+        unique_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_description = entity_description
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+
+    @property
+    def listener_source(self) -> ListenerSource | None:
+        """Return the helper that refreshes this sensor, None when disabled."""
+        raise NotImplementedError
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh whenever the listener source calls its listeners."""
+        await super().async_added_to_hass()
+        if (source := self.listener_source) is not None:
+            self.async_on_remove(source.async_add_listener(self.async_write_ha_state))
+
+
+class EatonUpsIngestSensor(EatonUpsListenerSensor):
+    """Ingest pipeline diagnostic sensor, refreshed per ingest snapshot."""
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the ingest sensor."""
+        entry_id = coordinator.config_entry.entry_id
+        super().__init__(
+            coordinator,
+            entity_description,
+            f"{entry_id}_ingest_{entity_description.key}",
+            DeviceInfo(identifiers={(DOMAIN, entry_id)}),
+        )
+
+    @property
+    def listener_source(self) -> ListenerSource | None:
+        """Return the ingest stats publisher."""
+        return self.coordinator.ingest_stats
+
+    @property
+    def native_value(self) -> Any:
+        """Return the latest snapshot value."""
+        if self.coordinator.ingest_stats is None:
+            return None
+        return self.coordinator.ingest_stats.snapshot.get(self.entity_description.key)
+
+
+class EatonUpsEnergySensor(EatonUpsListenerSensor, RestoreSensor):
+    """
+    Energy integrated from the active power of an output or outlet.
+
+    The power is integrated as it arrives, and the state is only written when
+    the energy meters update on their interval. The total is restored across
+    restarts.
+    """
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the energy sensor."""
+        self._source_key = entity_description.key.rpartition("@")[0]
+        self._meter: EnergyIntegrator | None = None
+        super().__init__(
+            coordinator,
+            entity_description,
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}",
+            coordinator.devices.entity_device_info(
+                self._source_key.partition("$")[0], coordinator.data
+            ),
+        )
+
+    @property
+    def listener_source(self) -> ListenerSource:
+        """Return the energy meters."""
+        return self.coordinator.energy
+
+    async def async_added_to_hass(self) -> None:
+        """Continue from the restored total, then follow the energy meters."""
+        energy = 0.0
+        if (last := await self.async_get_last_sensor_data()) is not None:
+            try:
+                energy = float(last.native_value)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                energy = 0.0
+        self._meter = self.coordinator.energy.async_track(
+            self._source_key, energy, self.coordinator.data
+        )
+        await super().async_added_to_hass()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the integrated energy."""
+        if self._meter is None:
+            return None
+        return round(self._meter.energy, 3)
+
+
+class EatonUpsBatterySensor(EatonUpsListenerSensor):
+    """Battery analytics sensor, refreshed per battery analytics snapshot."""
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the battery analytics sensor."""
+        super().__init__(
+            coordinator,
+            entity_description,
+            f"{coordinator.config_entry.entry_id}_battery_{entity_description.key}",
+            coordinator.devices.entity_device_info(
+                POWER_BANK_MEASURES_TOPIC, coordinator.data
+            ),
+        )
+
+    @property
+    def listener_source(self) -> ListenerSource:
+        """Return the battery analytics."""
+        return self.coordinator.battery
+
+    @property
+    def native_value(self) -> Any:
+        """Return the latest snapshot value."""
+        return self.coordinator.battery.snapshot.get(self.entity_description.key)
+
+
+class EatonUpsPowerQualitySensor(EatonUpsListenerSensor):
+    """
+    Daily power quality event counter of an input.
+
+    Refreshes when the power quality monitor counts an event or starts a new
+    day.
+    """
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        input_num: int,
+        event_type: PowerQualityEventType,
+    ) -> None:
+        """Initialize the power quality counter sensor."""
+        self._input_num = input_num
+        self._event_type = event_type
+        entity_description = _generate_power_quality_description(input_num, event_type)
+        super().__init__(
+            coordinator,
+            entity_description,
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}",
+            coordinator.devices.entity_device_info(
+                INPUT_MEASURES_TOPIC.format(input_num=input_num), coordinator.data
+            ),
+        )
+
+    @property
+    def listener_source(self) -> ListenerSource:
+        """Return the power quality monitor."""
+        return self.coordinator.power_quality
+
+    @property
+    def native_value(self) -> int:
+        """Return today's number of events."""
+        return self.coordinator.power_quality.count(self._input_num, self._event_type)
+
+
+class EatonUpsFleetSensor(SensorEntity):
+    """
+    Aggregate across every UPS entry that joined the fleet.
+
+    Lives on the shared fleet device rather than a UPS, and only refreshes
+    when its own aggregate changes.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        fleet: FleetAggregator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the fleet sensor."""
+        self.fleet = fleet
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{DOMAIN}_fleet_{entity_description.key}"
+        self._attr_device_info = FLEET_DEVICE_INFO
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh when the aggregate changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.fleet.async_add_listener(
+                self.entity_description.key, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the aggregate value."""
+        return self.fleet.values.get(self.entity_description.key)
+
+
+class EatonUpsFleetEnergySensor(EatonUpsFleetSensor, RestoreSensor):
+    """Fleet energy total, restored across restarts."""
+
+    async def async_added_to_hass(self) -> None:
+        """Continue the fleet energy total from the restored state."""
+        await super().async_added_to_hass()
+        if (last := await self.async_get_last_sensor_data()) is None:
+            return
+        try:
+            energy = float(last.native_value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return
+        self.fleet.async_restore_energy(energy)
+
+
+class EatonUpsHistorySensor(EatonUpsListenerSensor):
+    """
+    Rolling aggregate of a measurement over its in-memory history.
+
+    Refreshes whenever the measurement history publishes its aggregates.
+    """
+
+    def __init__(
+        self,
+        coordinator: EatonUPSDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+        window: RollingWindow,
+    ) -> None:
+        """Initialize the history sensor."""
+        source_key, _, self._aggregate = entity_description.key.rpartition("@")
+        self._window = window
+        super().__init__(
+            coordinator,
+            entity_description,
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}",
+            coordinator.devices.entity_device_info(
+                source_key.partition("$")[0], coordinator.data
+            ),
+        )
+
+    @property
+    def listener_source(self) -> ListenerSource | None:
+        """Return the measurement history."""
+        return self.coordinator.history
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the rolling aggregate."""
+        return getattr(self._window, self._aggregate)
+
+
+class EatonUpsCriticalLatencySensor(SensorEntity):
+    """
+    End-to-end latency of the last critical topic update.
+
+    Measured from receipt in the MQTT thread until every coordinator listener
+    has written its state, and refreshed only when a critical topic changes.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: EatonUPSDataUpdateCoordinator) -> None:
+        """Initialize the latency sensor."""
+        self.coordinator = coordinator
+        self.entity_description = CRITICAL_LATENCY_ENTITY_DESCRIPTION
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{self.entity_description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
+        self._last_topic: str | None = None
+        self._last_latency: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh on every critical topic latency measurement."""
+        await super().async_added_to_hass()
+        client = self.coordinator.config_entry.runtime_data.client
+        self.async_on_remove(client.subscribe_to_critical_latency(self._handle_latency))
+
+    @callback
+    def _handle_latency(self, topic: str, latency: float) -> None:
+        """Store the measurement and write state."""
+        self._last_topic = topic
+        self._last_latency = latency
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last critical topic latency in milliseconds."""
+        if self._last_latency is None:
+            return None
+        return round(self._last_latency * 1000, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the last latency of every critical topic."""
+        client = self.coordinator.config_entry.runtime_data.client
+        return {
+            "topic": self._last_topic,
+            "latency_ms_by_topic": {
+                topic: round(latency * 1000, 3)
+                for topic, latency in client.critical_topic_latency.items()
+            },
+        }
+
+
+class EatonUpsActiveAlarmsSensor(SensorEntity):
+    """
+    Number of active alarms.
+
+    Fed by the alarm tracker, so it only refreshes when the active alarms or
+    the most critical alarm change.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: EatonUPSDataUpdateCoordinator) -> None:
+        """Initialize the active alarms sensor."""
+        self.coordinator = coordinator
+        self.entity_description = ACTIVE_ALARMS_ENTITY_DESCRIPTION
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{self.entity_description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh on every alarm change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.alarms.async_add_listener(self._handle_alarms)
+        )
+
+    @callback
+    def _handle_alarms(
+        self, _raised: list[dict[str, Any]], _cleared: list[dict[str, Any]]
+    ) -> None:
+        """Write state after an alarm change."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of active alarms."""
+        return len(self.coordinator.alarms.active)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the most critical alarm and the active alarm ids."""
+        alarms = self.coordinator.alarms
+        return {
+            "most_critical": alarms.most_critical,
+            "alarm_ids": list(alarms.active),
+        }
@@ -0,0 +1,188 @@
+"""Services for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .api import EatonUpsClientError
+from .commands import (
+    OUTLET_SPECIFICATIONS_TOPIC,
+    Command,
+    alarm_acknowledge_command,
+    alarm_topic,
+    battery_test_command,
+    outlet_switch_command,
+)
+from .const import CONF_EXPERIMENTAL_COMMANDS, DOMAIN
+from .profiler import async_profile
+
+if TYPE_CHECKING:
+    from .data import EatonUpsConfigEntry
+
+SERVICE_PROFILE = "profile"
+SERVICE_BATTERY_TEST = "battery_test"
+SERVICE_SWITCH_OUTLET = "switch_outlet"
+SERVICE_ACKNOWLEDGE_ALARM = "acknowledge_alarm"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+ATTR_CPROFILE = "cprofile"
+ATTR_OUTLET = "outlet"
+ATTR_SWITCHED_ON = "switched_on"
+ATTR_ALARM_ID = "alarm_id"
+
+PROFILE_DURATION_DEFAULT = 30
+PROFILE_DURATION_MAX = 600
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=PROFILE_DURATION_DEFAULT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_DURATION_MAX)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+BATTERY_TEST_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+SWITCH_OUTLET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_OUTLET): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(ATTR_SWITCHED_ON): cv.boolean,
+    }
+)
+
+ACKNOWLEDGE_ALARM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ALARM_ID): cv.string,
+    }
+)
+
+
+def _get_loaded_entry(hass: HomeAssistant, entry_id: str) -> EatonUpsConfigEntry:
+    """Return a loaded config entry of this integration."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        msg = f"Config entry {entry_id} is not an Eaton UPS entry"
+        raise ServiceValidationError(msg)
+    if entry.state is not ConfigEntryState.LOADED:
+        msg = f"Config entry {entry.title} is not loaded"
+        raise ServiceValidationError(msg)
+    return entry
+
+
+def _get_command_entry(hass: HomeAssistant, entry_id: str) -> EatonUpsConfigEntry:
+    """
+    Return a loaded config entry that has the experimental commands enabled.
+
+    The card documents its actions only as REST requests, so whether it acts
+    on them over MQTT is unconfirmed and they stay opt-in.
+    """
+    entry = _get_loaded_entry(hass, entry_id)
+    if not entry.options.get(CONF_EXPERIMENTAL_COMMANDS, False):
+        msg = (
+            f"UPS commands are experimental and disabled for {entry.title};"
+            " enable them in the integration options"
+        )
+        raise ServiceValidationError(msg)
+    return entry
+
+
+async def _async_send(entry: EatonUpsConfigEntry, command: Command) -> ServiceResponse:
+    """Send a command and return the status topic payload that confirmed it."""
+    try:
+        status = await entry.runtime_data.coordinator.commands.async_send(command)
+    except EatonUpsClientError as err:
+        raise HomeAssistantError(str(err)) from err
+    return {"topic": command.confirm_topic, "status": status}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_handle_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the message hot path of a config entry."""
+        entry = _get_loaded_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        return await async_profile(
+            hass,
+            entry,
+            call.data[ATTR_DURATION],
+            with_cprofile=call.data[ATTR_CPROFILE],
+        )
+
+    async def async_handle_battery_test(call: ServiceCall) -> ServiceResponse:
+        """Start a deep battery test."""
+        entry = _get_command_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        return await _async_send(entry, battery_test_command())
+
+    async def async_handle_switch_outlet(call: ServiceCall) -> ServiceResponse:
+        """Switch a switchable outlet on or off."""
+        entry = _get_command_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        outlet_num = call.data[ATTR_OUTLET]
+        specifications = (entry.runtime_data.coordinator.data or {}).get(
+            OUTLET_SPECIFICATIONS_TOPIC.format(outlet_num=outlet_num)
+        )
+        if not isinstance(specifications, dict) or not specifications.get("switchable"):
+            msg = f"Outlet {outlet_num} of {entry.title} is not switchable"
+            raise ServiceValidationError(msg)
+        return await _async_send(
+            entry,
+            outlet_switch_command(outlet_num, switched_on=call.data[ATTR_SWITCHED_ON]),
+        )
+
+    async def async_handle_acknowledge_alarm(call: ServiceCall) -> ServiceResponse:
+        """Acknowledge an active alarm."""
+        entry = _get_command_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        alarm_id = call.data[ATTR_ALARM_ID]
+        if alarm_id not in entry.runtime_data.coordinator.alarms.active:
+            msg = f"Alarm {alarm_id} is not active on {entry.title}"
+            raise ServiceValidationError(msg)
+        if alarm_topic(alarm_id) is None:
+            msg = f"Alarm {alarm_id} on {entry.title} cannot be acknowledged"
+            raise ServiceValidationError(msg)
+        return await _async_send(entry, alarm_acknowledge_command(alarm_id))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATTERY_TEST,
+        async_handle_battery_test,
+        schema=BATTERY_TEST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SWITCH_OUTLET,
+        async_handle_switch_outlet,
+        schema=SWITCH_OUTLET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ACKNOWLEDGE_ALARM,
+        async_handle_acknowledge_alarm,
+        schema=ACKNOWLEDGE_ALARM_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,148 @@
+"""Topic store snapshot view for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN, SNAPSHOT_URL
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CONTENT_TYPE_JSON = "application/json"
+
+
+def _token(epoch: str, version: int) -> str:
+    """Return the version token of a store version."""
+    return f"{epoch}-{version}"
+
+
+def _parse_token(value: str) -> tuple[str, int]:
+    """
+    Return the store epoch and version of a version token.
+
+    Raises ValueError when value is not a version token.
+    """
+    epoch, separator, version = value.rpartition("-")
+    if not separator or not epoch:
+        msg = f"Invalid version token: {value}"
+        raise ValueError(msg)
+    return epoch, int(version)
+
+
+def _etag(token: str, since: int | None) -> str:
+    """Return the entity tag of a full or partial snapshot."""
+    if since is None:
+        return f'"{token}"'
+    return f'"{token}-{since}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an If-None-Match header matches an entity tag."""
+    if if_none_match is None:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
+
+
+def changed_topics(
+    data: Mapping[str, Any], topic_versions: Mapping[str, int], since: int
+) -> dict[str, Any]:
+    """Return the topics that changed after store version since."""
+    return {
+        topic: data.get(topic)
+        for topic, version in list(topic_versions.items())
+        if version > since
+    }
+
+
+class EatonUpsSnapshotView(HomeAssistantView):
+    """
+    Flat topic store of one UPS as JSON, for lightweight pollers.
+
+    The entity tag is the store version token "<epoch>-<version>", so a
+    poll without changes gets a 304 without touching the store. The epoch
+    is new for every client, whose version starts over at 0. Serialized
+    bodies are cached per version, so repeated polls between changes do no
+    JSON encoding. With ?since=<token> only the topics changed after that
+    version are sent; a token of another epoch gets the full store.
+    """
+
+    url = SNAPSHOT_URL
+    name = f"api:{DOMAIN}:snapshot"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._bodies: dict[str, tuple[str, dict[int | None, bytes]]] = {}
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the snapshot of a loaded UPS entry."""
+        hass = request.app[KEY_HASS]
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            return self.json_message("Config entry not found", HTTPStatus.NOT_FOUND)
+        since_epoch: str | None = None
+        since: int | None = None
+        if (value := request.query.get("since")) is not None:
+            try:
+                since_epoch, since = _parse_token(value)
+            except ValueError:
+                return self.json_message("Invalid since", HTTPStatus.BAD_REQUEST)
+
+        client = entry.runtime_data.client
+        # Read the version before the payloads: a payload newer than the
+        # version is sent again on the next poll rather than missed
+        version = client.version
+        token = _token(client.epoch, version)
+        # A version of an earlier client counts from another 0: send it all
+        if since is not None and (since_epoch != client.epoch or since > version):
+            since = None
+        etag = _etag(token, since)
+        if since == version or _matches(request.headers.get(hdrs.IF_NONE_MATCH), etag):
+            return web.Response(
+                status=HTTPStatus.NOT_MODIFIED, headers={hdrs.ETAG: etag}
+            )
+        body = self._body(
+            entry_id,
+            token,
+            entry.runtime_data.coordinator.data or {},
+            client.topic_versions,
+            since,
+        )
+        return web.Response(
+            body=body, content_type=CONTENT_TYPE_JSON, headers={hdrs.ETAG: etag}
+        )
+
+    def _body(
+        self,
+        entry_id: str,
+        token: str,
+        data: Mapping[str, Any],
+        topic_versions: Mapping[str, int],
+        since: int | None,
+    ) -> bytes:
+        """Return the cached or freshly serialized body of a snapshot."""
+        cached = self._bodies.get(entry_id)
+        if cached is None or cached[0] != token:
+            cached = self._bodies[entry_id] = (token, {})
+        if (body := cached[1].get(since)) is None:
+            if since is None:
+                # The client adds topics from its network thread; copy atomically
+                topics = dict(data)
+            else:
+                topics = changed_topics(data, topic_versions, since)
+            body = cached[1][since] = json_bytes({"version": token, "topics": topics})
+        return body
@@ -0,0 +1,160 @@
+"""Topic staleness tracking for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import STALENESS_TICK, TOPIC_MAX_AGE_BY_CLASS, TOPIC_MAX_AGE_DEFAULT
+from .listeners import async_register_listener
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def get_topic_max_age(topic: str) -> int:
+    """Return the max age in seconds before a topic is considered stale."""
+    return TOPIC_MAX_AGE_BY_CLASS.get(topic.rpartition("/")[2], TOPIC_MAX_AGE_DEFAULT)
+
+
+class StalenessTracker:
+    """
+    Track topic freshness using a single shared timer wheel.
+
+    Every tracked topic sits in one wheel slot, keyed by the tick at which it
+    would expire. Incoming messages only bump the client's receive timestamp;
+    a slot is re-evaluated lazily when its tick comes up, so the cost is O(1)
+    per message and O(expired topics) per tick, independent of entity count.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._received_at: Mapping[str, float] = {}
+        self._wheel: dict[int, set[str]] = {}
+        self._slots: dict[str, int] = {}
+        self._stale: dict[str, float | None] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self._last_tick: int | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def stale_topics(self) -> set[str]:
+        """Return the set of topics currently considered stale."""
+        return set(self._stale)
+
+    def is_stale(self, topic: str) -> bool:
+        """Return True if the topic has not been received within its max age."""
+        return topic in self._stale
+
+    @callback
+    def async_start(self, received_at: Mapping[str, float]) -> None:
+        """Start the shared timer, reading receive timestamps from the client."""
+        self._received_at = received_at
+        if self._unsub_timer is not None:
+            return
+        now = time.monotonic()
+        self._last_tick = self._tick_for(now)
+        for topic in self._listeners:
+            self._schedule(topic, now)
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_tick,
+            timedelta(seconds=STALENESS_TICK),
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the shared timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_track(self, topic: str, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call listener whenever the topic flips between fresh and stale.
+
+        Returns a function that stops tracking.
+        """
+        listeners = self._listeners.setdefault(topic, [])
+        remove = async_register_listener(listeners, listener)
+        if len(listeners) == 1:
+            self._schedule(topic, time.monotonic())
+
+        @callback
+        def remove_listener() -> None:
+            """Stop tracking the topic for this listener."""
+            remove()
+            if not listeners and self._listeners.get(topic) is listeners:
+                del self._listeners[topic]
+                self._unschedule(topic)
+                self._stale.pop(topic, None)
+
+        return remove_listener
+
+    @staticmethod
+    def _tick_for(timestamp: float) -> int:
+        """Return the wheel tick a monotonic timestamp falls into."""
+        return int(timestamp // STALENESS_TICK)
+
+    def _schedule(self, topic: str, now: float) -> None:
+        """Place a topic into the wheel slot of its expiry tick."""
+        received = self._received_at.get(topic)
+        # Topics not seen yet get a full max age of grace from now
+        deadline = (received if received is not None else now) + get_topic_max_age(
+            topic
+        )
+        slot = self._tick_for(deadline) + 1
+        if self._last_tick is not None:
+            # Never schedule into a slot the wheel has already passed
+            slot = max(slot, self._last_tick + 1)
+        self._unschedule(topic)
+        self._slots[topic] = slot
+        self._wheel.setdefault(slot, set()).add(topic)
+
+    def _unschedule(self, topic: str) -> None:
+        """Remove a topic from its wheel slot, if any."""
+        slot = self._slots.pop(topic, None)
+        if slot is not None and (topics := self._wheel.get(slot)) is not None:
+            topics.discard(topic)
+            if not topics:
+                del self._wheel[slot]
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        """Expire due wheel slots and recover stale topics that came back."""
+        now = time.monotonic()
+        current = self._tick_for(now)
+        last = self._last_tick if self._last_tick is not None else current - 1
+        self._last_tick = current
+
+        changed: list[str] = []
+
+        # Recover topics received again since they went stale
+        for topic, stale_mark in list(self._stale.items()):
+            received = self._received_at.get(topic)
+            if received is not None and (stale_mark is None or received > stale_mark):
+                del self._stale[topic]
+                self._schedule(topic, now)
+                changed.append(topic)
+
+        # Expire due slots; topics refreshed meanwhile are simply rescheduled
+        for tick in range(last + 1, current + 1):
+            for topic in self._wheel.pop(tick, ()):
+                self._slots.pop(topic, None)
+                received = self._received_at.get(topic)
+                if received is not None and received + get_topic_max_age(topic) > now:
+                    self._schedule(topic, now)
+                else:
+                    self._stale[topic] = received
+                    changed.append(topic)
+
+        for topic in changed:
+            for listener in list(self._listeners.get(topic, ())):
+                listener()
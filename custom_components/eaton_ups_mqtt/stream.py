@@ -0,0 +1,193 @@
+"""Raw topic delta streams for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from .api import EatonUpsMqttClient
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+def is_valid_filter(topic_filter: str) -> bool:
+    """Return whether a string is a valid MQTT topic filter."""
+    if not topic_filter:
+        return False
+    segments = topic_filter.split("/")
+    for index, segment in enumerate(segments):
+        if segment == MULTI_LEVEL_WILDCARD:
+            if index != len(segments) - 1:
+                return False
+        elif MULTI_LEVEL_WILDCARD in segment or (
+            SINGLE_LEVEL_WILDCARD in segment and segment != SINGLE_LEVEL_WILDCARD
+        ):
+            return False
+    return True
+
+
+class _FilterNode:
+    """A topic filter trie node."""
+
+    __slots__ = ("children", "tokens")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _FilterNode] = {}
+        self.tokens: set[int] = set()
+
+
+class TopicMatcher:
+    """
+    Match topic keys against the MQTT topic filters of many subscribers.
+
+    Filters are compiled into a segment trie shared by all subscribers, so
+    matching walks the trie once no matter how many filters there are. The
+    card publishes a fixed set of topics, so each topic's set of matching
+    subscribers is cached until the subscriptions change, and matching a
+    message is a dictionary lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty matcher."""
+        self._root = _FilterNode()
+        self._filters: dict[int, tuple[str, ...]] = {}
+        self._cache: dict[str, frozenset[int]] = {}
+
+    def add(self, token: int, filters: Iterable[str]) -> None:
+        """Add the topic filters of a subscriber."""
+        self._filters[token] = tuple(filters)
+        for topic_filter in self._filters[token]:
+            node = self._root
+            for segment in topic_filter.split("/"):
+                node = node.children.setdefault(segment, _FilterNode())
+            node.tokens.add(token)
+        self._cache.clear()
+
+    def remove(self, token: int) -> None:
+        """Remove the topic filters of a subscriber."""
+        for topic_filter in self._filters.pop(token, ()):
+            self._remove(self._root, topic_filter.split("/"), 0, token)
+        self._cache.clear()
+
+    def match(self, topic: str) -> frozenset[int]:
+        """Return the subscribers with a filter matching a topic key."""
+        if (tokens := self._cache.get(topic)) is None:
+            matched: set[int] = set()
+            self._match(self._root, topic.split("/"), 0, matched)
+            tokens = self._cache[topic] = frozenset(matched)
+        return tokens
+
+    def _match(
+        self, node: _FilterNode, segments: list[str], index: int, matched: set[int]
+    ) -> None:
+        """Collect the subscribers of the filters below node matching segments."""
+        if (multi := node.children.get(MULTI_LEVEL_WILDCARD)) is not None:
+            # "a/#" also matches "a" itself
+            matched.update(multi.tokens)
+        if index == len(segments):
+            matched.update(node.tokens)
+            return
+        for segment in (segments[index], SINGLE_LEVEL_WILDCARD):
+            if (child := node.children.get(segment)) is not None:
+                self._match(child, segments, index + 1, matched)
+
+    def _remove(
+        self, node: _FilterNode, segments: list[str], index: int, token: int
+    ) -> bool:
+        """Remove a filter below node and return whether node became empty."""
+        if index == len(segments):
+            node.tokens.discard(token)
+        elif (child := node.children.get(segments[index])) is not None and (
+            self._remove(child, segments, index + 1, token)
+        ):
+            del node.children[segments[index]]
+        return not node.tokens and not node.children
+
+
+class TopicStream:
+    """
+    Stream raw topic payloads of one UPS to external subscribers.
+
+    A subscriber gets a snapshot of the topics matching its filters, then
+    one batch of changed topics per client flush. The stream only follows
+    the client's change batches while it has subscribers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        self._client: EatonUpsMqttClient | None = None
+        self._data: Mapping[str, Any] = {}
+        self._matcher = TopicMatcher()
+        self._subscribers: dict[int, Callable[[dict[str, Any]], None]] = {}
+        self._tokens = count()
+        self._unsub_changes: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self, client: EatonUpsMqttClient, data: Mapping[str, Any]) -> None:
+        """Start streaming from the client's topic store."""
+        self._client = client
+        self._data = data
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop streaming and drop all subscribers."""
+        if self._unsub_changes is not None:
+            self._unsub_changes()
+            self._unsub_changes = None
+        for token in list(self._subscribers):
+            self._matcher.remove(token)
+        self._subscribers.clear()
+        self._client = None
+
+    @callback
+    def async_subscribe(
+        self, filters: Iterable[str], listener: Callable[[dict[str, Any]], None]
+    ) -> tuple[dict[str, Any], CALLBACK_TYPE]:
+        """
+        Subscribe listener to the topics matching filters.
+
+        Returns the current snapshot of the matching topics and a function
+        that removes the subscription.
+        """
+        token = next(self._tokens)
+        self._matcher.add(token, filters)
+        self._subscribers[token] = listener
+        if self._unsub_changes is None and self._client is not None:
+            self._unsub_changes = self._client.subscribe_to_changes(
+                self._handle_changes
+            )
+        snapshot = {
+            topic: payload
+            for topic, payload in list(self._data.items())
+            if token in self._matcher.match(topic)
+        }
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the subscription."""
+            if self._subscribers.pop(token, None) is None:
+                return
+            self._matcher.remove(token)
+            if not self._subscribers and self._unsub_changes is not None:
+                self._unsub_changes()
+                self._unsub_changes = None
+
+        return snapshot, unsubscribe
+
+    @callback
+    def _handle_changes(self, keys: set[str]) -> None:
+        """Send every subscriber the changed topics matching its filters."""
+        batches: dict[int, dict[str, Any]] = {}
+        for key in keys:
+            for token in self._matcher.match(key):
+                batches.setdefault(token, {})[key] = self._data.get(key)
+        for token, batch in batches.items():
+            if (listener := self._subscribers.get(token)) is not None:
+                listener(batch)
@@ -0,0 +1,81 @@
+"""powerService supplier discovery for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+SUPPLIERS_TOPIC = "powerService/suppliers"
+SUPPLIER_TOPIC_PREFIX = f"{SUPPLIERS_TOPIC}/"
+
+
+def supplier_topic(supplier_id: str, subtopic: str) -> str:
+    """Return the flat topic key of a supplier subtopic."""
+    return f"{SUPPLIER_TOPIC_PREFIX}{supplier_id}/{subtopic}"
+
+
+class SupplierIndex:
+    """
+    Index of powerService suppliers keyed by their opaque ids.
+
+    The client feeds every changed topic through observe(): a supplier
+    subtopic seen for the first time is added to its supplier, and a new
+    suppliers member list drops suppliers that are no longer listed. Only
+    the changed topic is looked at, so discovery never rescans all keys.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._topics: dict[str, set[str]] = {}
+        self._names: dict[str, str] = {}
+
+    @property
+    def supplier_ids(self) -> list[str]:
+        """Return the known supplier ids."""
+        return list(self._topics)
+
+    def topics(self, supplier_id: str) -> frozenset[str]:
+        """Return the known topic keys of a supplier."""
+        return frozenset(self._topics.get(supplier_id, ()))
+
+    def observe(self, key: str, data: Any) -> None:
+        """Update the index with a changed topic."""
+        if key == SUPPLIERS_TOPIC:
+            if isinstance(data, dict):
+                self._sync_members(data)
+            return
+        if not key.startswith(SUPPLIER_TOPIC_PREFIX):
+            return
+        supplier_id, _, subtopic = key.removeprefix(SUPPLIER_TOPIC_PREFIX).partition(
+            "/"
+        )
+        if subtopic:
+            self._topics.setdefault(supplier_id, set()).add(key)
+
+    def name(self, supplier_id: str, data: Mapping[str, Any]) -> str:
+        """Return the supplier name, resolved once from its identification."""
+        if (name := self._names.get(supplier_id)) is not None:
+            return name
+        identification = data.get(supplier_topic(supplier_id, "identification"))
+        if not isinstance(identification, dict):
+            return supplier_id
+        name = (
+            identification.get("name")
+            or identification.get("physicalName")
+            or supplier_id
+        )
+        self._names[supplier_id] = name
+        return name
+
+    def _sync_members(self, data: dict[str, Any]) -> None:
+        """Drop suppliers missing from the suppliers member list."""
+        listed = {
+            member["@id"].rpartition("/")[2]
+            for member in data.get("members") or ()
+            if isinstance(member, dict) and isinstance(member.get("@id"), str)
+        }
+        for supplier_id in self._topics.keys() - listed:
+            del self._topics[supplier_id]
+            self._names.pop(supplier_id, None)
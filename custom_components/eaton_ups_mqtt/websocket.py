@@ -0,0 +1,102 @@
+"""WebSocket API for eaton_ups_mqtt."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .stream import is_valid_filter
+
+if TYPE_CHECKING:
+    from homeassistant.components.websocket_api import ActiveConnection
+
+    from .data import EatonUpsConfigEntry
+
+COMMAND_SUBSCRIBE = f"{DOMAIN}/subscribe"
+
+ATTR_ENTRY_IDS = "entry_ids"
+ATTR_TOPICS = "topics"
+
+
+def _topic_filter(value: Any) -> str:
+    """Validate an MQTT topic filter."""
+    value = cv.string(value)
+    if not is_valid_filter(value):
+        msg = f"Invalid topic filter: {value}"
+        raise vol.Invalid(msg)
+    return value
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the integration websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@callback
+def _send_event(
+    connection: ActiveConnection, msg_id: int, entry_id: str, key: str, value: Any
+) -> None:
+    """Send a snapshot or delta event of a config entry."""
+    connection.send_message(
+        websocket_api.event_message(msg_id, {"entry_id": entry_id, key: value})
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): COMMAND_SUBSCRIBE,
+        vol.Optional(ATTR_ENTRY_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TOPICS, default=["#"]): vol.All(
+            cv.ensure_list, [_topic_filter]
+        ),
+    }
+)
+@websocket_api.require_admin
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """
+    Stream raw topic payloads of loaded UPS entries.
+
+    Each entry first gets a snapshot event of the topics matching the
+    filters, then delta events with the topics that changed per flush.
+    """
+    entries: list[EatonUpsConfigEntry] = hass.config_entries.async_loaded_entries(
+        DOMAIN
+    )
+    if ATTR_ENTRY_IDS in msg:
+        by_id = {entry.entry_id: entry for entry in entries}
+        if missing := [i for i in msg[ATTR_ENTRY_IDS] if i not in by_id]:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_NOT_FOUND,
+                f"Config entries not loaded: {', '.join(missing)}",
+            )
+            return
+        entries = [by_id[entry_id] for entry_id in msg[ATTR_ENTRY_IDS]]
+
+    connection.send_result(msg["id"])
+    unsubscribes = []
+    for entry in entries:
+        snapshot, unsubscribe = entry.runtime_data.coordinator.stream.async_subscribe(
+            msg[ATTR_TOPICS],
+            partial(_send_event, connection, msg["id"], entry.entry_id, "deltas"),
+        )
+        unsubscribes.append(unsubscribe)
+        _send_event(connection, msg["id"], entry.entry_id, "snapshot", snapshot)
+
+    @callback
+    def unsubscribe_all() -> None:
+        """Remove the subscriptions of all entries."""
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    connection.subscriptions[msg["id"]] = unsubscribe_all
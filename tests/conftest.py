@@ -10,9 +10,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.eaton_ups_mqtt.const import DOMAIN
+from custom_components.eaton_ups_mqtt.suppliers import SupplierIndex
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
 # Register pytest-homeassistant-custom-component plugin
 pytest_plugins = "pytest_homeassistant_custom_component"
@@ -52,6 +53,42 @@ def ups_5px_2200_g2_m3_data() -> dict[str, Any]:
         return json.load(f)
 
 
+class FakeClient:
+    """Client stand-in that records publishes and per-topic subscriptions."""
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        self.data = data if data is not None else {}
+        self.callbacks: dict[str, Callable[[Any], None]] = {}
+        self.topic_received_at: dict[str, float] = {}
+        self.suppliers = SupplierIndex()
+        for key, payload in self.data.items():
+            self.suppliers.observe(key, payload)
+        self.async_publish_command = AsyncMock()
+
+    def subscribe_to_topic(
+        self, key: str, callback: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        self.callbacks[key] = callback
+        return lambda: self.callbacks.pop(key, None)
+
+    def publish(self, key: str, payload: Any) -> None:
+        """Hold a changed payload and dispatch it to the topic's subscriber."""
+        self.data[key] = payload
+        self.callbacks[key](payload)
+
+
+@pytest.fixture
+def fake_client() -> type[FakeClient]:
+    """Return the fake client class, for tests that need several or seed data."""
+    return FakeClient
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    """Return a fake client holding no data."""
+    return FakeClient()
+
+
 @pytest.fixture
 def mock_mqtt_client() -> Generator[MagicMock]:
     """Mock paho MQTT client."""
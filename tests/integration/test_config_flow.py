@@ -20,7 +20,21 @@ from custom_components.eaton_ups_mqtt.config_flow import ConnectionResult
 from custom_components.eaton_ups_mqtt.const import (
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_CRITICAL_TOPICS,
+    CONF_EXPERIMENTAL_COMMANDS,
+    CONF_FLEET,
+    CONF_INGEST_DIAGNOSTICS,
+    CONF_MEASUREMENT_HISTORY,
+    CONF_METRICS_EXPORTER,
+    CONF_PQ_FREQUENCY_TOLERANCE,
+    CONF_PQ_SAG_THRESHOLD,
+    CONF_PQ_SWELL_THRESHOLD,
     CONF_SERVER_CERT,
+    CONF_STATISTICS_MODE,
+    DEFAULT_CRITICAL_TOPICS,
+    DEFAULT_PQ_FREQUENCY_TOLERANCE,
+    DEFAULT_PQ_SAG_THRESHOLD,
+    DEFAULT_PQ_SWELL_THRESHOLD,
     DOMAIN,
 )
 
@@ -431,3 +445,77 @@ class TestReconfigureFlow:
 
         assert result["type"] == FlowResultType.FORM
         assert result["errors"]["base"] == "cert_fetch_failed"
+
+
+class TestOptionsFlow:
+    """Tests for options flow."""
+
+    async def test_options_form_defaults_to_disabled(
+        self, hass: HomeAssistant, full_entry_data
+    ):
+        """Test options form shows ingest diagnostics disabled by default."""
+        entry = MockConfigEntry(domain=DOMAIN, title="Test UPS", data=full_entry_data)
+        entry.add_to_hass(hass)
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+        schema = result["data_schema"]({})
+        assert schema[CONF_INGEST_DIAGNOSTICS] is False
+        assert schema[CONF_MEASUREMENT_HISTORY] is False
+        assert schema[CONF_STATISTICS_MODE] is False
+        assert schema[CONF_METRICS_EXPORTER] is False
+        assert schema[CONF_FLEET] is False
+        assert schema[CONF_EXPERIMENTAL_COMMANDS] is False
+        assert schema[CONF_PQ_SAG_THRESHOLD] == DEFAULT_PQ_SAG_THRESHOLD
+        assert schema[CONF_PQ_SWELL_THRESHOLD] == DEFAULT_PQ_SWELL_THRESHOLD
+        assert schema[CONF_PQ_FREQUENCY_TOLERANCE] == DEFAULT_PQ_FREQUENCY_TOLERANCE
+        assert schema[CONF_CRITICAL_TOPICS] == list(DEFAULT_CRITICAL_TOPICS)
+
+    async def test_options_enable_ingest_diagnostics(
+        self, hass: HomeAssistant, full_entry_data
+    ):
+        """Test enabling ingest diagnostics stores the option."""
+        entry = MockConfigEntry(domain=DOMAIN, title="Test UPS", data=full_entry_data)
+        entry.add_to_hass(hass)
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_INGEST_DIAGNOSTICS: True}
+        )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert entry.options == {
+            CONF_INGEST_DIAGNOSTICS: True,
+            CONF_MEASUREMENT_HISTORY: False,
+            CONF_STATISTICS_MODE: False,
+            CONF_METRICS_EXPORTER: False,
+            CONF_FLEET: False,
+            CONF_EXPERIMENTAL_COMMANDS: False,
+            CONF_PQ_SAG_THRESHOLD: DEFAULT_PQ_SAG_THRESHOLD,
+            CONF_PQ_SWELL_THRESHOLD: DEFAULT_PQ_SWELL_THRESHOLD,
+            CONF_PQ_FREQUENCY_TOLERANCE: DEFAULT_PQ_FREQUENCY_TOLERANCE,
+            CONF_CRITICAL_TOPICS: list(DEFAULT_CRITICAL_TOPICS),
+        }
+
+    async def test_options_set_critical_topics(
+        self, hass: HomeAssistant, full_entry_data
+    ):
+        """Test the critical topic list can be replaced."""
+        entry = MockConfigEntry(domain=DOMAIN, title="Test UPS", data=full_entry_data)
+        entry.add_to_hass(hass)
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {
+                CONF_INGEST_DIAGNOSTICS: False,
+                CONF_CRITICAL_TOPICS: ["powerDistributions/1/inputs/1/status"],
+            },
+        )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert entry.options[CONF_CRITICAL_TOPICS] == [
+            "powerDistributions/1/inputs/1/status"
+        ]
@@ -51,16 +51,19 @@ def mock_entry(mock_config_entry_data):
 class TestCoordinatorSetup:
     """Tests for coordinator setup and data fetching."""
 
-    async def test_coordinator_init(self, hass: HomeAssistant):
+    async def test_coordinator_init(self, hass: HomeAssistant, mock_entry):
         """Test coordinator initializes with correct defaults."""
+        mock_entry.add_to_hass(hass)
         coordinator = EatonUPSDataUpdateCoordinator(
             hass=hass,
             logger=MagicMock(),
             name=DOMAIN,
+            config_entry=mock_entry,
         )
 
         assert coordinator.update_interval is None
         assert coordinator._setup_done is False
+        assert coordinator.power_events is not None
 
     async def test_coordinator_data_callback(
         self, hass: HomeAssistant, mock_entry, ups_5px_g2_data
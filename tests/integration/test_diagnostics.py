@@ -58,6 +58,7 @@ async def test_diagnostics_returns_redacted_data(
         mock_client.async_disconnect = AsyncMock()
         mock_client.async_get_data = AsyncMock(return_value=ups_5px_g2_data)
         mock_client.subscribe_to_updates = MagicMock(return_value=lambda: None)
+        mock_client.critical_topic_latency = {"powerDistributions/1/status": 0.0123}
         mock_client_class.return_value = mock_client
 
         await hass.config_entries.async_setup(mock_entry.entry_id)
@@ -69,6 +70,8 @@ async def test_diagnostics_returns_redacted_data(
     assert "config_entry" in result
     assert "mqtt_prefix" in result
     assert "coordinator_data" in result
+    assert result["stale_topics"] == []
+    assert result["critical_topic_latency_ms"] == {"powerDistributions/1/status": 12.3}
 
     # Check config_entry has redacted certs
     config_data = result["config_entry"]["data"]
@@ -14,7 +14,8 @@ from custom_components.eaton_ups_mqtt.binary_sensor import (
     EatonUpsBinarySensor,
     get_binary_entity_descriptions,
 )
-from custom_components.eaton_ups_mqtt.const import MQTT_PREFIX_V2
+from custom_components.eaton_ups_mqtt.const import DOMAIN, MQTT_PREFIX_V2
+from custom_components.eaton_ups_mqtt.devices import DeviceMetadata
 from custom_components.eaton_ups_mqtt.sensor import (
     SENSOR_HUMIDITY_PATTERN,
     SENSOR_TEMP_PATTERN,
@@ -264,3 +265,71 @@ class TestSensorNameFallbacks:
     def test_binary_sensor_device_name_fallback_missing(self):
         """Test _get_sensor_device_name returns device_id when key is missing."""
         assert bs._get_sensor_device_name({}, "dev1") == "dev1"
+
+
+class TestSubDevices:
+    """Verify entities are split across outlet, battery and probe devices."""
+
+    @pytest.fixture
+    def coordinator(self, mock_coordinator):
+        """Attach real device metadata to the mock coordinator."""
+        mock_coordinator.devices = DeviceMetadata(MagicMock(), "m3", "Eaton UPS (host)")
+        mock_coordinator.devices.async_start(MagicMock(), mock_coordinator.data)
+        return mock_coordinator
+
+    @pytest.fixture
+    def devices(self, coordinator):
+        """Map every device identifier to its sensor and binary sensor keys."""
+        devices = {}
+        entities = [
+            EatonUpsSensor(coordinator, description)
+            for description in get_entity_descriptions(coordinator)
+        ] + [
+            EatonUpsBinarySensor(coordinator, description)
+            for description in get_binary_entity_descriptions(coordinator)
+        ]
+        for entity in entities:
+            ((_, identifier),) = entity.device_info["identifiers"]
+            devices.setdefault(identifier, []).append(entity.entity_description.key)
+        return devices
+
+    def test_devices(self, devices):
+        """Test the card, three outlets, the battery and the probe are devices."""
+        assert sorted(devices) == [
+            "m3",
+            "m3_battery",
+            "m3_outlet_1",
+            "m3_outlet_2",
+            "m3_outlet_3",
+            "m3_sensor_ZVUNRvBtWsalpX44CHxfeQ",
+        ]
+
+    def test_entities_on_their_device(self, devices):
+        """Test outlet, battery and probe entities leave the main device."""
+        assert all("/outlets/2/" in key for key in devices["m3_outlet_2"])
+        assert all("powerBank" in key for key in devices["m3_battery"])
+        assert not any(
+            "/outlets/" in key
+            or "powerBank" in key
+            or key.startswith("sensors/devices/")
+            for key in devices["m3"]
+        )
+
+    def test_probe_device(self, coordinator):
+        """Test the probe device is named from its identification."""
+        info = coordinator.devices.entity_device_info(
+            "sensors/devices/ZVUNRvBtWsalpX44CHxfeQ/communicationStatus",
+            coordinator.data,
+        )
+        assert info["name"] == "SI-NW-UV-1"
+        assert info["model"] == "EMPDT1H1C2"
+        assert info["sw_version"] == "01.04.0011"
+        assert info["via_device"] == (DOMAIN, "m3")
+
+    def test_outlet_device(self, coordinator):
+        """Test outlets are linked to their distribution device."""
+        info = coordinator.devices.entity_device_info(
+            "powerDistributions/1/outlets/1/measures", coordinator.data
+        )
+        assert info["name"] == "Eaton UPS (host) Outlet 1"
+        assert info["via_device"] == (DOMAIN, "m3")
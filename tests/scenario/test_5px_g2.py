@@ -6,7 +6,7 @@ from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
-from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
 
 from custom_components.eaton_ups_mqtt.binary_sensor import (
     get_binary_entity_descriptions,
@@ -16,6 +16,7 @@ from custom_components.eaton_ups_mqtt.sensor import (
     EatonUpsSensor,
     get_entity_descriptions,
 )
+from custom_components.eaton_ups_mqtt.suppliers import SupplierIndex
 
 
 @pytest.fixture
@@ -358,7 +359,7 @@ class TestNoEnvironmentalSensorProbes:
     def test_no_env_probe_sensors(self, mock_coordinator):
         """Test M2 data without sensor probes generates no env probe sensors."""
         descriptions = get_entity_descriptions(mock_coordinator)
-        env_keys = [d.key for d in descriptions if d.key.startswith("sensors/")]
+        env_keys = [d.key for d in descriptions if d.key.startswith("sensors/devices/")]
         assert env_keys == []
 
     def test_no_env_probe_binary_sensors(self, mock_coordinator):
@@ -366,3 +367,81 @@ class TestNoEnvironmentalSensorProbes:
         descriptions = get_binary_entity_descriptions(mock_coordinator)
         env_keys = [d.key for d in descriptions if d.key.startswith("sensors/")]
         assert env_keys == []
+
+
+class TestEnumStatus:
+    """Verify status fields are reported as enum options."""
+
+    @pytest.fixture
+    def sensors(self, mock_coordinator):
+        """Map description keys to sensors built from the M2 descriptions."""
+        return {
+            description.key: EatonUpsSensor(mock_coordinator, description)
+            for description in get_entity_descriptions(mock_coordinator)
+        }
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("powerDistributions/1/status$operating", "in_service"),
+            ("powerDistributions/1/status$health", "ok"),
+            ("powerDistributions/1/backupSystem/powerBank/status$operating", "stopped"),
+            (
+                "powerDistributions/1/backupSystem/powerBank/chargers/1/status$chargerStatus",
+                "on_not_charging",
+            ),
+            ("powerDistributions/1/outlets/1/status$health", "ok"),
+            # M2 publishes CIM integer codes on sensors/status; 7 is dormant
+            ("sensors/status$operating", "dormant"),
+            ("sensors/status$health", "ok"),
+        ],
+    )
+    def test_enum_values(self, sensors, key, expected):
+        """Test raw strings and integer codes map onto the options."""
+        sensor = sensors[key]
+        assert sensor.entity_description.device_class == SensorDeviceClass.ENUM
+        assert sensor.native_value == expected
+        assert sensor.native_value in sensor.entity_description.options
+
+
+PRIMARY_SUPPLIER = "powerService/suppliers/acWPSUdxWmSxL4f849URrg"
+GROUP_1_SUPPLIER = "powerService/suppliers/suNLcr7pWISz7bK79b_dkg"
+
+
+class TestPowerSuppliers:
+    """Tests for powerService supplier entities."""
+
+    @pytest.fixture
+    def supplier_coordinator(self, mock_coordinator, ups_5px_g2_data):
+        """Return the coordinator with a supplier index fed from the fixture."""
+        suppliers = SupplierIndex()
+        for key, data in ups_5px_g2_data.items():
+            suppliers.observe(key, data)
+        mock_coordinator.config_entry.runtime_data.client.suppliers = suppliers
+        return mock_coordinator
+
+    def test_supplier_descriptions(self, supplier_coordinator):
+        """Test supplier entities are named from identification."""
+        descriptions = get_entity_descriptions(supplier_coordinator)
+        names = {d.name for d in descriptions if d.key.startswith("powerService/")}
+        assert "PRIMARY Runtime" in names
+        assert "GROUP 1 Capacity" in names
+        assert "GROUP 2 Estimated Power Down Delay" in names
+        # Only outlet groups publish shutdown durations
+        assert "PRIMARY Shutdown Duration" not in names
+        assert "GROUP 1 Critical Shutdown Duration" in names
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            (f"{PRIMARY_SUPPLIER}/summary$protectionCapacityRuntime", 15636),
+            (f"{PRIMARY_SUPPLIER}/summary$protectionCapacityPercent", 99.0),
+            (f"{GROUP_1_SUPPLIER}/schedule$delayBeforePowerDown", -1),
+            (f"{GROUP_1_SUPPLIER}/estimatedPowerdownCommand$delay", -1),
+        ],
+    )
+    def test_supplier_values(self, supplier_coordinator, key, expected):
+        """Test supplier sensor values."""
+        desc = SensorEntityDescription(key=key, name="Test")
+        sensor = EatonUpsSensor(supplier_coordinator, desc)
+        assert sensor.native_value == expected
@@ -0,0 +1,155 @@
+"""Unit tests for the active alarm tracker."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.alarms import (
+    ACTIVE_ALARMS_TOPIC,
+    MOST_CRITICAL_TOPIC,
+    AlarmTracker,
+    get_alarm_id,
+)
+
+
+def alarm(alarm_id, level="warning"):
+    """Return an alarm member."""
+    return {
+        "@id": f"/mbdetnrs/1.0/alarmService/activeAlarms/{alarm_id}",
+        "id": alarm_id,
+        "level": level,
+    }
+
+
+def active_alarms(*members):
+    """Return an activeAlarms payload."""
+    return {
+        "@id": "/mbdetnrs/1.0/alarmService/activeAlarms",
+        "members@count": len(members),
+        "members": list(members),
+    }
+
+
+@pytest.fixture
+def tracker(client, ups_5px_g2_data):
+    """Create a tracker started on the 5PX G2 fixture (no alarms)."""
+    instance = AlarmTracker()
+    instance.async_start(client, ups_5px_g2_data)
+    instance.listener = MagicMock()
+    instance.async_add_listener(instance.listener)
+    return instance
+
+
+class TestGetAlarmId:
+    """Tests for get_alarm_id."""
+
+    def test_prefers_id(self):
+        """Test the id field is used when present."""
+        assert get_alarm_id(alarm("a1")) == "a1"
+
+    def test_falls_back_to_at_id(self):
+        """Test the @id link is used without an id field."""
+        assert get_alarm_id({"@id": "/alarms/7"}) == "/alarms/7"
+
+    def test_missing_id(self):
+        """Test a member without any identifier has no id."""
+        assert get_alarm_id({"level": "critical"}) is None
+
+
+class TestAlarmTracker:
+    """Tests for alarm diffing."""
+
+    def test_fixture_has_no_alarms(self, tracker, client):
+        """Test the fixture starts without active alarms and subscribes."""
+        assert tracker.active == {}
+        assert tracker.most_critical is None
+        assert set(client.callbacks) == {ACTIVE_ALARMS_TOPIC, MOST_CRITICAL_TOPIC}
+
+    def test_existing_alarms_adopted_silently(self, client):
+        """Test alarms present at startup are not reported as raised."""
+        instance = AlarmTracker()
+        listener = MagicMock()
+        instance.async_add_listener(listener)
+        instance.async_start(client, {ACTIVE_ALARMS_TOPIC: active_alarms(alarm("a1"))})
+
+        assert list(instance.active) == ["a1"]
+        listener.assert_not_called()
+
+    def test_raised(self, tracker, client):
+        """Test a new member is reported as raised."""
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a1")))
+
+        tracker.listener.assert_called_once_with([alarm("a1")], [])
+        assert list(tracker.active) == ["a1"]
+
+    def test_cleared(self, tracker, client):
+        """Test a removed member is reported as cleared."""
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a1"), alarm("a2")))
+        tracker.listener.reset_mock()
+
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a2")))
+
+        tracker.listener.assert_called_once_with([], [alarm("a1")])
+        assert list(tracker.active) == ["a2"]
+
+    def test_only_changed_members_reported(self, tracker, client):
+        """Test unchanged members are neither raised nor cleared again."""
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a1"), alarm("a2")))
+        tracker.listener.reset_mock()
+
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a2"), alarm("a3")))
+
+        tracker.listener.assert_called_once_with([alarm("a3")], [alarm("a1")])
+
+    def test_reordered_members_not_reported(self, tracker, client):
+        """Test a reordered member list is not a change."""
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a1"), alarm("a2")))
+        tracker.listener.reset_mock()
+
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a2"), alarm("a1")))
+
+        tracker.listener.assert_not_called()
+
+    def test_invalid_members_ignored(self, tracker, client):
+        """Test members without an id and non-dict payloads are ignored."""
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms({"level": "critical"}))
+        client.publish(ACTIVE_ALARMS_TOPIC, "garbage")
+
+        tracker.listener.assert_not_called()
+        assert tracker.active == {}
+
+    def test_most_critical(self, tracker, client):
+        """Test most critical changes are stored and notified."""
+        client.publish(MOST_CRITICAL_TOPIC, alarm("a1", "critical"))
+
+        assert tracker.most_critical == alarm("a1", "critical")
+        tracker.listener.assert_called_once_with([], [])
+
+        client.publish(MOST_CRITICAL_TOPIC, {})
+
+        assert tracker.most_critical is None
+
+    def test_most_critical_unchanged_not_notified(self, tracker, client):
+        """Test an unchanged most critical alarm does not notify."""
+        client.publish(MOST_CRITICAL_TOPIC, {})
+
+        tracker.listener.assert_not_called()
+
+    def test_remove_listener(self, tracker, client):
+        """Test a removed listener is no longer called."""
+        listener = MagicMock()
+        remove = tracker.async_add_listener(listener)
+        remove()
+        remove()
+
+        client.publish(ACTIVE_ALARMS_TOPIC, active_alarms(alarm("a1")))
+
+        listener.assert_not_called()
+
+    def test_stop_unsubscribes(self, tracker, client):
+        """Test stopping removes the topic subscriptions."""
+        tracker.async_stop()
+
+        assert client.callbacks == {}
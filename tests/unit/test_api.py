@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import ssl
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,7 +15,11 @@ from custom_components.eaton_ups_mqtt.api import (
     EatonUpsMqttClient,
     EatonUpsMqttConfig,
 )
-from custom_components.eaton_ups_mqtt.const import MQTT_SUPPORTED_PREFIXES
+from custom_components.eaton_ups_mqtt.const import (
+    DEFAULT_CRITICAL_TOPICS,
+    MQTT_COALESCE_WINDOW,
+    MQTT_SUPPORTED_PREFIXES,
+)
 
 
 @pytest.fixture
@@ -137,6 +141,103 @@ class TestMqttCallbacks:
             mqtt_client._mqtt_data["managers/1/identification"]["model"] == "Test UPS"
         )
 
+    def test_on_message_records_receive_timestamp(self, mqtt_client):
+        """Test on_message records a monotonic receive timestamp per topic."""
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "managers/1/identification"
+        msg.payload = json.dumps({"model": "Test UPS"}).encode()
+
+        with patch(
+            "custom_components.eaton_ups_mqtt.api.time.monotonic", return_value=42.0
+        ):
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        assert mqtt_client.topic_received_at["managers/1/identification"] == 42.0
+
+    def test_on_message_versions_changed_topics(self, mqtt_client):
+        """Test every changed payload advances the store and topic version."""
+        for payload in ({"v": 1}, {"v": 1}, {"v": 2}):
+            msg = MagicMock()
+            msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "inputs/1/measures"
+            msg.payload = json.dumps(payload).encode()
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        assert mqtt_client.version == 2
+        assert mqtt_client.topic_versions == {"inputs/1/measures": 2}
+
+    def test_epoch_per_client(self, mqtt_client, mqtt_config):
+        """Test every client starts a store epoch of its own."""
+        other = EatonUpsMqttClient(mqtt_config, MagicMock())
+        assert other.version == mqtt_client.version == 0
+        assert other.epoch != mqtt_client.epoch
+
+    def test_on_message_suppresses_duplicate_payloads(self, mqtt_client):
+        """Test unchanged payloads refresh the timestamp but skip dispatch."""
+        mqtt_client._loop = MagicMock()
+        mqtt_client._update_callbacks.append(MagicMock())
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "managers/1/identification"
+        msg.payload = json.dumps({"model": "Test UPS"}).encode()
+
+        with patch(
+            "custom_components.eaton_ups_mqtt.api.time.monotonic", return_value=1.0
+        ):
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+        with patch(
+            "custom_components.eaton_ups_mqtt.api.time.monotonic", return_value=2.0
+        ):
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        assert mqtt_client._loop.call_soon_threadsafe.call_count == 1
+        assert mqtt_client.topic_received_at["managers/1/identification"] == 2.0
+
+    def test_on_message_records_nothing_when_ingest_disabled(self, mqtt_client):
+        """Test no ingest counters exist unless instrumentation is enabled."""
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "managers/1/identification"
+        msg.payload = json.dumps({"model": "Test UPS"}).encode()
+
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        assert mqtt_client.ingest_counters is None
+
+    def test_on_message_records_ingest_counters(self, mqtt_client):
+        """Test ingest counters track messages, bytes, decode and duplicates."""
+        counters = mqtt_client.enable_ingest_stats()
+        mqtt_client._loop = MagicMock()
+        mqtt_client._update_callbacks.append(MagicMock())
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "managers/1/identification"
+        msg.payload = json.dumps({"model": "Test UPS"}).encode()
+
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        assert counters.messages == 2
+        assert counters.bytes == 2 * len(msg.payload)
+        assert counters.duplicates == 1
+        assert len(counters.decode_samples) == 1
+        mqtt_client._loop.call_soon_threadsafe.assert_called_once_with(
+            mqtt_client._schedule_flush, ANY
+        )
+
+    def test_set_message_probe_times_messages(self, mqtt_client):
+        """Test the message probe wraps the handler and can be removed."""
+        mqtt_client._mqtt_client = MagicMock()
+        probe = MagicMock()
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + "managers/1/identification"
+        msg.payload = json.dumps({"model": "Test UPS"}).encode()
+
+        mqtt_client.set_message_probe(probe)
+        mqtt_client._mqtt_client.on_message(MagicMock(), None, msg)
+
+        probe.assert_called_once_with(msg.topic, ANY)
+        assert "managers/1/identification" in mqtt_client._mqtt_data
+
+        mqtt_client.set_message_probe(None)
+        assert mqtt_client._mqtt_client.on_message == mqtt_client._on_message
+
     def test_on_message_invalid_json(self, mqtt_client):
         """Test on_message handles invalid JSON gracefully."""
         msg = MagicMock()
@@ -186,6 +287,127 @@ class TestMqttCallbacks:
         )
 
 
+class TestDispatch:
+    """Tests for coalesced bulk and immediate critical dispatch."""
+
+    @staticmethod
+    def _message(topic, payload):
+        msg = MagicMock()
+        msg.topic = MQTT_SUPPORTED_PREFIXES[0] + topic
+        msg.payload = json.dumps(payload).encode()
+        return msg
+
+    def test_bulk_updates_arm_single_flush(self, mqtt_client):
+        """Test a burst of bulk topics schedules one coalesced flush."""
+        mqtt_client._loop = MagicMock()
+        mqtt_client._update_callbacks.append(MagicMock())
+
+        for num in range(5):
+            msg = self._message(f"powerDistributions/1/outlets/{num}/measures", {})
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        mqtt_client._loop.call_soon_threadsafe.assert_called_once_with(
+            mqtt_client._schedule_flush, ANY
+        )
+
+    def test_flush_notifies_and_rearms(self, mqtt_client):
+        """Test the flush notifies callbacks and lets the next burst re-arm."""
+        mqtt_client._loop = MagicMock()
+        callback = MagicMock()
+        mqtt_client._update_callbacks.append(callback)
+        msg = self._message("powerDistributions/1/outputs/1/measures", {"v": 1})
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        mqtt_client._schedule_flush(0.0)
+        mqtt_client._loop.call_later.assert_called_once_with(
+            MQTT_COALESCE_WINDOW, mqtt_client._flush_updates
+        )
+        mqtt_client._flush_updates()
+
+        callback.assert_called_once_with(mqtt_client._mqtt_data)
+        assert mqtt_client._flush_pending is False
+
+    def test_critical_topic_dispatched_immediately(self, mqtt_client):
+        """Test critical topics bypass the coalescing flush."""
+        mqtt_client._loop = MagicMock()
+        mqtt_client._update_callbacks.append(MagicMock())
+        msg = self._message(DEFAULT_CRITICAL_TOPICS[0], {"operating": "in service"})
+
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        mqtt_client._loop.call_soon_threadsafe.assert_called_once_with(
+            mqtt_client._dispatch_critical, DEFAULT_CRITICAL_TOPICS[0], ANY
+        )
+        assert mqtt_client._flush_pending is False
+
+    def test_topic_subscribers_dispatched_immediately(self, mqtt_client):
+        """Test per-topic subscribers get their payload without coalescing."""
+        mqtt_client._loop = MagicMock()
+        callback = MagicMock()
+        unsubscribe = mqtt_client.subscribe_to_topic("inputs/1/status", callback)
+        msg = self._message("inputs/1/status", {"supply": False})
+
+        mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+        mqtt_client._loop.call_soon_threadsafe.assert_called_once_with(
+            mqtt_client._dispatch_topic, "inputs/1/status"
+        )
+        mqtt_client._dispatch_topic("inputs/1/status")
+        callback.assert_called_once_with({"supply": False})
+
+        unsubscribe()
+        assert mqtt_client._topic_callbacks == {}
+
+    def test_changed_keys_batched_per_flush(self, mqtt_client):
+        """Test change subscribers get the keys changed since the last batch."""
+        mqtt_client._loop = MagicMock()
+        callback = MagicMock()
+        unsubscribe = mqtt_client.subscribe_to_changes(callback)
+        for seq, num in enumerate((1, 2, 1)):
+            msg = self._message(f"outlets/{num}/measures", {"seq": seq})
+            mqtt_client._on_message(_client=MagicMock(), _userdata=None, msg=msg)
+
+        mqtt_client._loop.call_soon_threadsafe.assert_called_once_with(
+            mqtt_client._schedule_flush, ANY
+        )
+        mqtt_client._flush_updates()
+        mqtt_client._flush_updates()
+
+        callback.assert_called_once_with({"outlets/1/measures", "outlets/2/measures"})
+        unsubscribe()
+        assert mqtt_client._change_callbacks == []
+
+    def test_critical_topics_configurable(self, mqtt_config):
+        """Test the critical topic set comes from the config."""
+        mqtt_config.critical_topics = ("sensors/status",)
+        client = EatonUpsMqttClient(mqtt_config, MagicMock())
+
+        assert client.critical_topics == frozenset({"sensors/status"})
+
+    def test_critical_dispatch_records_latency(self, mqtt_client):
+        """Test critical dispatch notifies callbacks then reports latency."""
+        callback = MagicMock()
+        mqtt_client._update_callbacks.append(callback)
+        latency_callback = MagicMock()
+        unsubscribe = mqtt_client.subscribe_to_critical_latency(latency_callback)
+
+        with patch(
+            "custom_components.eaton_ups_mqtt.api.time.monotonic", return_value=10.05
+        ):
+            mqtt_client._dispatch_critical("powerDistributions/1/status", 10.0)
+
+        callback.assert_called_once_with(mqtt_client._mqtt_data)
+        latency_callback.assert_called_once_with(
+            "powerDistributions/1/status", pytest.approx(0.05)
+        )
+        assert mqtt_client.critical_topic_latency == {
+            "powerDistributions/1/status": pytest.approx(0.05)
+        }
+
+        unsubscribe()
+        mqtt_client._dispatch_critical("powerDistributions/1/status", 10.0)
+        latency_callback.assert_called_once()
+
+
 class TestSubscribeToTopics:
     """Tests for _subscribe_to_topics method."""
 
@@ -204,10 +426,12 @@ class TestSubscribeToTopics:
         call_args = mqtt_client._mqtt_client.subscribe.call_args
         topics = call_args.kwargs.get("topic") or call_args.args[0]
 
-        # Should subscribe to managers and powerDistributions
+        # Should subscribe to alarms, managers, powerDistributions and suppliers
         topic_paths = [t[0] for t in topics]
+        assert any("alarmService/#" in t for t in topic_paths)
         assert any("managers/#" in t for t in topic_paths)
         assert any("powerDistributions/#" in t for t in topic_paths)
+        assert any("powerService/#" in t for t in topic_paths)
 
 
 class TestSetupTls:
@@ -327,39 +551,52 @@ class TestAsyncSetup:
         assert mqtt_client._mqtt_client is not None
 
 
-class TestAsyncSetTitle:
-    """Tests for async_set_title method."""
+class TestAsyncPublishCommand:
+    """Tests for async_publish_command method."""
 
     @pytest.mark.asyncio
-    async def test_set_title_publishes_command(self, mqtt_client):
-        """Test set_title publishes to MQTT."""
+    async def test_publish_command(self, mqtt_client):
+        """Test commands are published under the detected prefix with QoS 1."""
         mqtt_client._mqtt_connected = True
         mqtt_client._mqtt_client = MagicMock()
+        mqtt_client._mqtt_client.publish.return_value.rc = 0
         mqtt_client._mqtt_prefix = "mbdetnrs/1.0/"
 
-        result = await mqtt_client.async_set_title("test_command")
+        await mqtt_client.async_publish_command("outlets/2/actions/switchOn", {})
+
+        mqtt_client._mqtt_client.publish.assert_called_once_with(
+            "mbdetnrs/1.0/outlets/2/actions/switchOn", "{}", qos=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_command_raises_when_publish_fails(self, mqtt_client):
+        """Test a rejected publish raises a communication error."""
+        mqtt_client._mqtt_connected = True
+        mqtt_client._mqtt_client = MagicMock()
+        mqtt_client._mqtt_client.publish.return_value.rc = 4
+        mqtt_client._mqtt_prefix = "mbdetnrs/1.0/"
 
-        mqtt_client._mqtt_client.publish.assert_called_once()
-        assert result == {"success": True}
+        with pytest.raises(EatonUpsClientCommunicationError):
+            await mqtt_client.async_publish_command("test", {})
 
     @pytest.mark.asyncio
-    async def test_set_title_raises_when_client_none(self, mqtt_client):
-        """Test set_title raises error when client is None."""
+    async def test_publish_command_raises_when_client_none(self, mqtt_client):
+        """Test publishing raises error when client is None."""
         mqtt_client._mqtt_connected = True
         mqtt_client._mqtt_client = None
 
         with pytest.raises(EatonUpsClientError, match="MQTT client not initialized"):
-            await mqtt_client.async_set_title("test")
+            await mqtt_client.async_publish_command("test", {})
 
     @pytest.mark.asyncio
-    async def test_set_title_raises_when_prefix_not_detected(self, mqtt_client):
-        """Test set_title raises error when prefix not yet detected."""
+    async def test_publish_command_raises_when_prefix_not_detected(self, mqtt_client):
+        """Test publishing raises error when prefix not yet detected."""
         mqtt_client._mqtt_connected = True
         mqtt_client._mqtt_client = MagicMock()
         mqtt_client._mqtt_prefix = None
 
         with pytest.raises(EatonUpsClientError, match="MQTT prefix not yet detected"):
-            await mqtt_client.async_set_title("test")
+            await mqtt_client.async_publish_command("test", {})
 
 
 class TestAsyncGetData:
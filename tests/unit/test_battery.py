@@ -0,0 +1,202 @@
+"""Unit tests for battery discharge analytics."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.battery import (
+    OUTPUT_MEASURES_TOPIC,
+    POWER_BANK_MEASURES_TOPIC,
+    POWER_BANK_STATUS_TOPIC,
+    SECONDS_PER_YEAR,
+    BatteryAnalytics,
+    DischargeCurve,
+    analyze_discharges,
+    discharge_capacity,
+)
+
+MONOTONIC = "custom_components.eaton_ups_mqtt.battery.time.monotonic"
+
+
+class FakeHass:
+    """Hass stand-in running executor jobs inline and collecting tasks."""
+
+    def __init__(self):
+        self.tasks = []
+
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+    def async_create_task(self, coro):
+        self.tasks.append(coro)
+
+
+def curve(soc_start=100, soc_end=50, power=500.0, duration=3600):
+    """Return a stored two-point discharge curve."""
+    return {
+        "elapsed": [0.0, float(duration)],
+        "soc": [float(soc_start), float(soc_end)],
+        "voltage": [54.0, 48.0],
+        "power": [power, power],
+    }
+
+
+@pytest.fixture
+def store():
+    """Patch the battery store with an empty mock store."""
+    with patch("custom_components.eaton_ups_mqtt.battery.Store") as store_class:
+        instance = store_class.return_value
+        instance.async_load = AsyncMock(return_value=None)
+        yield instance
+
+
+@pytest.fixture
+def fake_hass():
+    """Return a fake hass."""
+    return FakeHass()
+
+
+@pytest.fixture
+async def analytics(fake_hass, client, store, ups_5px_g2_data):
+    """Create battery analytics started on the 5PX G2 fixture."""
+    instance = BatteryAnalytics(fake_hass, "entry")
+    with patch("custom_components.eaton_ups_mqtt.battery.async_track_time_interval"):
+        await instance.async_start(client, ups_5px_g2_data)
+    return instance
+
+
+class TestDischargeCurve:
+    """Tests for the fixed-size discharge curve."""
+
+    def test_append(self):
+        """Test samples are appended to every channel."""
+        discharge = DischargeCurve(size=4)
+        discharge.append(0, 100, 54, 200)
+        discharge.append(10, 99, 53, 210)
+        assert discharge.as_dict() == {
+            "elapsed": [0, 10],
+            "soc": [100, 99],
+            "voltage": [54, 53],
+            "power": [200, 210],
+        }
+
+    def test_thinned_when_full(self):
+        """Test a full curve keeps evenly spread samples within its size."""
+        discharge = DischargeCurve(size=8)
+        for second in range(100):
+            discharge.append(second, 100 - second / 10, 50, 100)
+        elapsed = discharge.as_dict()["elapsed"]
+        assert len(discharge) <= 8
+        assert elapsed[0] == 0
+        steps = {b - a for a, b in pairwise(elapsed)}
+        assert len(steps) == 1
+
+
+class TestAnalysis:
+    """Tests for the capacity regression."""
+
+    def test_discharge_capacity(self):
+        """Test capacity scales the delivered energy to the full charge."""
+        assert discharge_capacity(curve()) == pytest.approx(1000.0)
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            curve(soc_end=99.5),
+            curve(power=0.0),
+            {"elapsed": [0.0], "soc": [100.0], "power": [1.0]},
+            {},
+        ],
+    )
+    def test_discharge_capacity_unusable(self, stored):
+        """Test short, idle and malformed curves give no capacity."""
+        assert discharge_capacity(stored) is None
+
+    def test_single_discharge(self):
+        """Test one discharge gives a capacity but no fade."""
+        analysis = analyze_discharges([{"start": 0.0, "curve": curve()}])
+        assert analysis.capacity == 1000.0
+        assert analysis.capacity_fade is None
+        assert analysis.discharges == 1
+
+    def test_capacity_fade(self):
+        """Test the fade is the fitted yearly loss."""
+        analysis = analyze_discharges(
+            [
+                {"start": 0.0, "curve": curve()},
+                {"start": float(SECONDS_PER_YEAR), "curve": curve(power=450.0)},
+            ]
+        )
+        assert analysis.capacity == 900.0
+        assert analysis.capacity_fade == 10.0
+
+    def test_no_usable_discharge(self):
+        """Test unusable discharges are still counted."""
+        analysis = analyze_discharges([{"start": 0.0, "curve": curve(power=0.0)}])
+        assert analysis.capacity is None
+        assert analysis.discharges == 1
+
+
+class TestBatteryAnalytics:
+    """Tests for recording discharges."""
+
+    async def test_start(self, analytics, client):
+        """Test the power bank and output topics are followed."""
+        assert set(client.callbacks) == {
+            POWER_BANK_MEASURES_TOPIC,
+            OUTPUT_MEASURES_TOPIC,
+            POWER_BANK_STATUS_TOPIC,
+        }
+        assert not analytics.discharging
+        assert analytics.snapshot["discharges"] == 0
+        assert analytics.snapshot["estimated_runtime"] is None
+
+    async def test_records_discharge(self, analytics, client, store, fake_hass):
+        """Test a discharge is recorded, saved and refit in the executor."""
+        client.publish(OUTPUT_MEASURES_TOPIC, {"activePower": 500})
+        with patch(MONOTONIC, side_effect=[0.0, 0.0, 1800.0, 3600.0, 3600.0]):
+            client.publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+            assert analytics.discharging
+            client.publish(
+                POWER_BANK_MEASURES_TOPIC, {"stateOfCharge": 75, "voltage": 50}
+            )
+            client.publish(
+                POWER_BANK_MEASURES_TOPIC, {"stateOfCharge": 49, "voltage": 48}
+            )
+            client.publish(POWER_BANK_STATUS_TOPIC, {"supply": False})
+
+        assert not analytics.discharging
+        store.async_delay_save.assert_called_once()
+        for task in fake_hass.tasks:
+            await task
+        assert analytics.snapshot["discharges"] == 1
+        assert analytics.snapshot["capacity"] == 1000.0
+        # 1000 Wh at 49 % and 500 W lasts 0.98 h
+        assert analytics.snapshot["estimated_runtime"] == 3528
+
+    async def test_short_discharge_ignored(self, analytics, client, store):
+        """Test a blip on battery is not recorded."""
+        with patch(MONOTONIC, side_effect=[0.0, 0.0, 5.0]):
+            client.publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+            client.publish(POWER_BANK_STATUS_TOPIC, {"supply": False})
+        store.async_delay_save.assert_not_called()
+
+    async def test_restores_discharges(self, fake_hass, client, store):
+        """Test stored discharges are refit at startup."""
+        store.async_load.return_value = {
+            "discharges": [{"start": 0.0, "duration": 3600, "curve": curve()}]
+        }
+        instance = BatteryAnalytics(fake_hass, "entry")
+        listener = MagicMock()
+        instance.async_add_listener(listener)
+        with patch(
+            "custom_components.eaton_ups_mqtt.battery.async_track_time_interval"
+        ):
+            await instance.async_start(client, {})
+        assert instance.snapshot["capacity"] == 1000.0
+        listener.assert_called_once()
+        instance.async_stop()
+        assert client.callbacks == {}
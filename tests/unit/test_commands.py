@@ -0,0 +1,160 @@
+"""Unit tests for commands confirmed through status topics."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.api import EatonUpsCommandError
+from custom_components.eaton_ups_mqtt.commands import (
+    CommandDispatcher,
+    alarm_acknowledge_command,
+    alarm_topic,
+    battery_test_command,
+    outlet_switch_command,
+)
+
+OUTLET_STATUS_TOPIC = "powerDistributions/1/outlets/2/status"
+POWER_BANK_STATUS_TOPIC = "powerDistributions/1/backupSystem/powerBank/status"
+ACTIVE_ALARMS_TOPIC = "alarmService/activeAlarms"
+
+
+@pytest.fixture
+def client(fake_client, ups_5px_g2_data):
+    """Return a fake client holding the 5PX G2 fixture."""
+    return fake_client(ups_5px_g2_data)
+
+
+@pytest.fixture
+def dispatcher(client):
+    """Create a dispatcher started on the fake client."""
+    instance = CommandDispatcher()
+    instance.async_start(client, client.data)
+    return instance
+
+
+async def _publish_soon(client, key, payload):
+    """Publish a status payload once the commands sent so far are waiting."""
+    await asyncio.sleep(0)
+    client.publish(key, payload)
+
+
+@pytest.mark.parametrize(
+    ("alarm_id", "topic"),
+    [
+        ("7", "alarmService/activeAlarms/7"),
+        ("/mbdetnrs/2.0/alarmService/activeAlarms/x", "alarmService/activeAlarms/x"),
+        ("mbdetnrs/1.0/alarmService/activeAlarms/x", "alarmService/activeAlarms/x"),
+        ("/mbdetnrs/1.0/managers/1", None),
+        ("/mbdetnrs/1.0/alarmService/activeAlarms/", None),
+        ("", None),
+    ],
+)
+def test_alarm_topic(alarm_id, topic):
+    """Test alarm ids and @id links resolve to the alarm topic."""
+    assert alarm_topic(alarm_id) == topic
+
+
+def test_alarm_without_topic_rejected():
+    """Test an alarm whose id names no alarm topic has no command."""
+    with pytest.raises(ValueError, match="no topic"):
+        alarm_acknowledge_command("/mbdetnrs/1.0/managers/1")
+
+
+class TestCommandDispatcher:
+    """Tests for sending commands and resolving their confirmations."""
+
+    async def test_confirmed_by_status(self, dispatcher, client):
+        """Test a command resolves with the status payload that confirms it."""
+        status = {**client.data[OUTLET_STATUS_TOPIC], "switchedOn": False}
+        send = dispatcher.async_send(outlet_switch_command(2, switched_on=False))
+        result, _ = await asyncio.gather(
+            send, _publish_soon(client, OUTLET_STATUS_TOPIC, status)
+        )
+
+        assert result == status
+        client.async_publish_command.assert_awaited_once_with(
+            "powerDistributions/1/outlets/2/actions/switchOff", {}
+        )
+        assert client.callbacks == {}
+
+    async def test_current_state_confirms(self, dispatcher, client):
+        """Test asking for the state already reported resolves right away."""
+        result = await dispatcher.async_send(outlet_switch_command(2, switched_on=True))
+        assert result["switchedOn"] is True
+
+    async def test_timeout(self, dispatcher, client):
+        """Test an unconfirmed command fails after its timeout."""
+        command = replace(outlet_switch_command(2, switched_on=False), timeout=0.01)
+        with pytest.raises(EatonUpsCommandError, match="not confirmed"):
+            await dispatcher.async_send(command)
+        assert client.callbacks == {}
+
+    async def test_pipelined(self, dispatcher, client):
+        """Test commands in flight are confirmed independently of each other."""
+        off = asyncio.create_task(
+            dispatcher.async_send(outlet_switch_command(2, switched_on=False))
+        )
+        test = asyncio.create_task(dispatcher.async_send(battery_test_command()))
+        await _publish_soon(
+            client,
+            POWER_BANK_STATUS_TOPIC,
+            {**client.data[POWER_BANK_STATUS_TOPIC], "testStatus": 2},
+        )
+        assert (await test)["testStatus"] == 2
+        assert not off.done()
+
+        client.publish(OUTLET_STATUS_TOPIC, {"switchedOn": False})
+        assert (await off) == {"switchedOn": False}
+
+    async def test_battery_test_needs_change(self, dispatcher, client):
+        """Test a battery test is not confirmed by the status it started from."""
+        command = replace(battery_test_command(), timeout=0.01)
+        with pytest.raises(EatonUpsCommandError):
+            await dispatcher.async_send(command)
+
+    async def test_alarm_acknowledged(self, dispatcher, client):
+        """Test an alarm acknowledge resolves once the alarm is acknowledged."""
+        client.data[ACTIVE_ALARMS_TOPIC] = {"members": [{"id": "7"}]}
+        send = dispatcher.async_send(alarm_acknowledge_command("7"))
+        result, _ = await asyncio.gather(
+            send,
+            _publish_soon(
+                client,
+                ACTIVE_ALARMS_TOPIC,
+                {"members": [{"id": "7", "acknowledged": True}]},
+            ),
+        )
+        assert result["members"][0]["acknowledged"] is True
+        client.async_publish_command.assert_awaited_once_with(
+            "alarmService/activeAlarms/7/actions/acknowledge", {}
+        )
+
+    async def test_alarm_acknowledged_by_link(self, dispatcher, client):
+        """Test an alarm with only an @id link is acknowledged on its topic."""
+        link = "/mbdetnrs/1.0/alarmService/activeAlarms/x"
+        client.data[ACTIVE_ALARMS_TOPIC] = {"members": [{"@id": link}]}
+        send = dispatcher.async_send(alarm_acknowledge_command(link))
+        await asyncio.gather(
+            send,
+            _publish_soon(client, ACTIVE_ALARMS_TOPIC, {"members": []}),
+        )
+        client.async_publish_command.assert_awaited_once_with(
+            "alarmService/activeAlarms/x/actions/acknowledge", {}
+        )
+
+    async def test_stop_fails_commands_in_flight(self, dispatcher, client):
+        """Test stopping fails waiting commands and drops subscriptions."""
+        send = asyncio.create_task(
+            dispatcher.async_send(outlet_switch_command(2, switched_on=False))
+        )
+        await asyncio.sleep(0)
+        dispatcher.async_stop()
+
+        with pytest.raises(EatonUpsCommandError, match="closed"):
+            await send
+        assert client.callbacks == {}
+        with pytest.raises(EatonUpsCommandError, match="not set up"):
+            await dispatcher.async_send(battery_test_command())
@@ -0,0 +1,185 @@
+"""Unit tests for shared device info and registry metadata updates."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.const import DOMAIN
+from custom_components.eaton_ups_mqtt.devices import (
+    DEFAULT_MODEL,
+    DeviceMetadata,
+    get_identification_metadata,
+    identification_topic,
+)
+
+MODEL = "Eaton 5PX 1500i RT2U G2"
+FIRMWARE = "01.12.0024"
+
+
+@pytest.fixture
+def registry():
+    """Patch the device registry with a mock holding one device."""
+    instance = MagicMock()
+    instance.async_get_device.return_value.id = "device-1"
+    with patch(
+        "custom_components.eaton_ups_mqtt.devices.dr.async_get",
+        return_value=instance,
+    ):
+        yield instance
+
+
+@pytest.fixture
+def devices(client, ups_5px_g2_data):
+    """Create device metadata started on the 5PX G2 fixture."""
+    instance = DeviceMetadata(MagicMock(), "entry", "Eaton UPS (host)")
+    instance.async_start(client, ups_5px_g2_data)
+    return instance
+
+
+def identification(model=MODEL, firmware=FIRMWARE):
+    """Return an identification payload."""
+    return {"model": model, "firmwareVersion": firmware, "serialNumber": "X"}
+
+
+class TestGetIdentificationMetadata:
+    """Tests for get_identification_metadata."""
+
+    def test_fields(self):
+        """Test model and firmware version are read."""
+        assert get_identification_metadata(identification()) == (MODEL, FIRMWARE)
+
+    def test_invalid_fields(self):
+        """Test empty or non-string fields and payloads are ignored."""
+        assert get_identification_metadata({"model": "", "firmwareVersion": 1}) == (
+            None,
+            None,
+        )
+        assert get_identification_metadata(None) == (None, None)
+
+
+class TestDeviceMetadata:
+    """Tests for shared device info."""
+
+    def test_device_info_from_fixture(self, devices):
+        """Test device info is built from the startup identification."""
+        info = devices.device_info("1")
+        assert info["identifiers"] == {(DOMAIN, "entry")}
+        assert info["name"] == "Eaton UPS (host)"
+        assert info["model"] == MODEL
+        assert info["sw_version"] == FIRMWARE
+
+    def test_device_info_shared(self, devices):
+        """Test one DeviceInfo is returned per device."""
+        assert devices.device_info("1") is devices.device_info("1")
+        assert devices.device_info("2") is not devices.device_info("1")
+
+    def test_other_distribution(self, devices):
+        """Test other distributions get their own device."""
+        info = devices.device_info("2")
+        assert info["identifiers"] == {(DOMAIN, "entry_2")}
+        assert info["name"] == "Eaton UPS (host) Distribution 2"
+
+    def test_default_model_before_start(self):
+        """Test the default model is used before any data was seen."""
+        instance = DeviceMetadata(MagicMock(), "entry", "Eaton UPS (host)")
+        assert instance.device_info("1")["model"] == DEFAULT_MODEL
+
+    def test_watches_identification(self, devices, client):
+        """Test the identification topic is watched, and released on stop."""
+        assert set(client.callbacks) == {identification_topic("1")}
+        devices.async_stop()
+        assert client.callbacks == {}
+
+
+class TestRegistryUpdates:
+    """Tests for device registry updates on identification changes."""
+
+    def test_unchanged_metadata_ignored(self, devices, client, registry):
+        """Test republishing the same model and firmware does nothing."""
+        client.publish(identification_topic("1"), identification())
+        registry.async_update_device.assert_not_called()
+
+    def test_firmware_upgrade(self, devices, client, registry):
+        """Test a new firmware version updates the registry and device info."""
+        info = devices.device_info("1")
+        client.publish(identification_topic("1"), identification(firmware="02.00.0001"))
+
+        registry.async_get_device.assert_called_once_with(
+            identifiers={(DOMAIN, "entry")}
+        )
+        registry.async_update_device.assert_called_once_with(
+            "device-1", model=MODEL, sw_version="02.00.0001"
+        )
+        assert info["sw_version"] == "02.00.0001"
+
+    def test_unregistered_device(self, devices, client, registry):
+        """Test a device missing from the registry is skipped."""
+        registry.async_get_device.return_value = None
+        client.publish(identification_topic("1"), identification(model="Other"))
+        registry.async_update_device.assert_not_called()
+
+
+class TestSubDevices:
+    """Tests for outlet, powerBank and probe sub-devices."""
+
+    @pytest.mark.parametrize(
+        ("topic", "identifier", "name"),
+        [
+            (
+                "powerDistributions/1/outlets/3/status",
+                "entry_outlet_3",
+                "Eaton UPS (host) Outlet 3",
+            ),
+            (
+                "powerDistributions/1/backupSystem/powerBank/chargers/1/status",
+                "entry_battery",
+                "Eaton UPS (host) Battery",
+            ),
+            (
+                "powerDistributions/2/outlets/1/measures",
+                "entry_2_outlet_1",
+                "Eaton UPS (host) Distribution 2 Outlet 1",
+            ),
+            (
+                "sensors/devices/probe/communicationStatus",
+                "entry_sensor_probe",
+                "probe",
+            ),
+        ],
+    )
+    def test_sub_device(self, devices, topic, identifier, name):
+        """Test sub-device identifiers and names are derived from the topic."""
+        info = devices.entity_device_info(topic, {})
+        assert info["identifiers"] == {(DOMAIN, identifier)}
+        assert info["name"] == name
+
+    @pytest.mark.parametrize(
+        "topic",
+        [
+            "powerDistributions/1/outlets",
+            "powerDistributions/1/inputs/1/status",
+            "sensors/devices",
+            "managers/1/identification",
+        ],
+    )
+    def test_main_device(self, devices, topic):
+        """Test topics outside sub-devices stay on the distribution device."""
+        assert devices.entity_device_info(topic, {}) is devices.device_info("1")
+
+    def test_sub_device_shared(self, devices):
+        """Test entities of one sub-device share a single DeviceInfo."""
+        first = devices.entity_device_info("powerDistributions/1/outlets/1/status", {})
+        second = devices.entity_device_info(
+            "powerDistributions/1/outlets/1/measures", {}
+        )
+        assert first is second
+        assert first["via_device"] == (DOMAIN, "entry")
+
+    def test_register_devices(self, devices, registry):
+        """Test distribution devices are registered ahead of their entities."""
+        devices.async_register_devices("config-entry")
+        registry.async_get_or_create.assert_called_once_with(
+            config_entry_id="config-entry", **devices.device_info("1")
+        )
@@ -0,0 +1,117 @@
+"""Unit tests for powerDistribution discovery."""
+
+from __future__ import annotations
+
+import sys
+
+from homeassistant.components.sensor import SensorEntityDescription
+
+from custom_components.eaton_ups_mqtt.distributions import (
+    for_distribution,
+    get_descriptions,
+    get_distribution_id,
+    index_distributions,
+)
+
+
+class TestIndexDistributions:
+    """Tests for index_distributions."""
+
+    def test_fixture_layout(self, ups_5px_g2_data):
+        """Test the 5PX G2 fixture has one distribution with its members."""
+        layouts = index_distributions(ups_5px_g2_data)
+        assert list(layouts) == ["1"]
+        layout = layouts["1"]
+        assert layout.numbers("inputs") == [1]
+        assert layout.numbers("outputs") == [1]
+        assert layout.numbers("outlets") == [1, 2, 3]
+        assert layout.phases("outputs", 1) == [1]
+
+    def test_distribution_1_always_present(self):
+        """Test distribution 1 is indexed without any topics."""
+        layouts = index_distributions([])
+        assert list(layouts) == ["1"]
+        assert layouts["1"].numbers("inputs") == []
+
+    def test_multiple_distributions_and_phases(self):
+        """Test distributions and phases are collected in one pass."""
+        layouts = index_distributions(
+            [
+                "powerDistributions/2/status",
+                "powerDistributions/2/outputs/1/phases/1/measures",
+                "powerDistributions/2/outputs/1/phases/3/measures",
+                "powerDistributions/2/outputs/1/phases/2/measures",
+                "powerDistributions/3/inputs/12/status",
+                "managers/1/identification",
+            ]
+        )
+        assert sorted(layouts) == ["1", "2", "3"]
+        assert layouts["2"].phases("outputs", 1) == [1, 2, 3]
+        assert layouts["3"].numbers("inputs") == [12]
+        assert layouts["3"].phases("inputs", 12) == []
+
+
+class TestGetDistributionId:
+    """Tests for get_distribution_id."""
+
+    def test_distribution_topic(self):
+        """Test the id is read from a distribution topic."""
+        assert get_distribution_id("powerDistributions/2/inputs/1/status") == "2"
+
+    def test_other_topic(self):
+        """Test topics outside powerDistributions have no id."""
+        assert get_distribution_id("managers/1/identification") is None
+
+
+class TestForDistribution:
+    """Tests for for_distribution."""
+
+    descriptions = (
+        SensorEntityDescription(key="powerDistributions/1/status$mode", name="Mode"),
+        SensorEntityDescription(key="managers/1/identification$name", name="Name"),
+    )
+
+    def test_distribution_1_unchanged(self):
+        """Test distribution 1 reuses the descriptions as is."""
+        rebased = for_distribution(self.descriptions, "1")
+        assert rebased[0] is self.descriptions[0]
+
+    def test_rebased_keys(self):
+        """Test distribution keys are rebased and others kept."""
+        rebased = for_distribution(self.descriptions, "2")
+        assert rebased[0].key == "powerDistributions/2/status$mode"
+        assert rebased[0].name == "Mode"
+        assert rebased[1] is self.descriptions[1]
+
+
+def _generate_test_descriptions(num):
+    """Generate descriptions with runtime-built keys."""
+    return (
+        SensorEntityDescription(
+            key=f"powerDistributions/1/inputs/{num}/measures$voltage", name="Voltage"
+        ),
+    )
+
+
+class TestGetDescriptions:
+    """Tests for the shared description registry."""
+
+    def test_cached_per_arguments(self):
+        """Test the same tuple is returned for the same arguments."""
+        first = get_descriptions(_generate_test_descriptions, 1)
+        assert get_descriptions(_generate_test_descriptions, 1) is first
+        assert get_descriptions(_generate_test_descriptions, 2) is not first
+
+    def test_cached_per_distribution(self):
+        """Test distributions get their own rebased tuple."""
+        first = get_descriptions(_generate_test_descriptions, 1)
+        second = get_descriptions(_generate_test_descriptions, 1, distribution_id="2")
+        assert second[0].key == "powerDistributions/2/inputs/1/measures$voltage"
+        assert first[0].key == "powerDistributions/1/inputs/1/measures$voltage"
+
+    def test_keys_interned(self):
+        """Test keys are interned."""
+        num = 3
+        (description,) = get_descriptions(_generate_test_descriptions, num)
+        key = f"powerDistributions/1/inputs/{num}/measures$voltage"
+        assert sys.intern(key) is description.key
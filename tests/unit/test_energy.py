@@ -0,0 +1,161 @@
+"""Unit tests for energy integrated from active power."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.energy import EnergyIntegrator, EnergyMeters
+from custom_components.eaton_ups_mqtt.sensor import (
+    EatonUpsEnergySensor,
+    _generate_energy_description,
+    _needs_derived_energy,
+)
+
+OUTLET_TOPIC = "powerDistributions/1/outlets/2/measures"
+POWER_KEY = f"{OUTLET_TOPIC}$activePower"
+MONOTONIC = "custom_components.eaton_ups_mqtt.energy.time.monotonic"
+
+
+@pytest.fixture
+def meters(client):
+    """Create energy meters started on the fake client, without a real timer."""
+    instance = EnergyMeters(MagicMock())
+    instance.async_start(client)
+    with patch("custom_components.eaton_ups_mqtt.energy.async_track_time_interval"):
+        yield instance
+
+
+def power_description(name="Outlet 2 Active Power"):
+    """Return the outlet power description stand-in."""
+    description = MagicMock(key=POWER_KEY)
+    description.name = name
+    return description
+
+
+class TestEnergyIntegrator:
+    """Tests for trapezoidal, gap-aware integration."""
+
+    def test_trapezoid(self):
+        """Test the energy between readings is the trapezoid under them."""
+        meter = EnergyIntegrator()
+        meter.add(0, 100.0)
+        meter.add(36, 300.0)
+        assert meter.energy == pytest.approx(2.0)
+
+    def test_gap_not_integrated(self):
+        """Test readings further apart than the maximum gap start over."""
+        meter = EnergyIntegrator(10.0, max_gap=60)
+        meter.add(0, 1000.0)
+        meter.add(600, 1000.0)
+        assert meter.energy == 10.0
+        meter.add(636, 1000.0)
+        assert meter.energy == pytest.approx(20.0)
+
+    def test_missing_power(self):
+        """Test a missing reading interrupts integration."""
+        meter = EnergyIntegrator()
+        meter.add(0, 100.0)
+        meter.add(10, None)
+        meter.add(20, 100.0)
+        assert meter.energy == 0.0
+
+    def test_hold_extends_reading(self):
+        """Test an unchanged reading is integrated up to its last republish."""
+        meter = EnergyIntegrator()
+        meter.add(0, 360.0)
+        meter.hold(30)
+        meter.hold(30)
+        meter.hold(None)
+        assert meter.energy == pytest.approx(3.0)
+
+    def test_never_decreases(self):
+        """Test negative readings cannot decrease the total."""
+        meter = EnergyIntegrator(5.0)
+        meter.add(0, -100.0)
+        meter.add(10, -100.0)
+        assert meter.energy == 5.0
+
+
+class TestEnergyMeters:
+    """Tests for metering topics."""
+
+    def test_track_and_integrate(self, meters, client):
+        """Test tracked meters continue from the restored total."""
+        with patch(MONOTONIC, side_effect=[0, 36]):
+            meter = meters.async_track(
+                POWER_KEY, 100.0, {OUTLET_TOPIC: {"activePower": 100}}
+            )
+            client.publish(OUTLET_TOPIC, {"activePower": 300})
+        assert meters.async_track(POWER_KEY, 0.0, {}) is meter
+        assert meter.energy == pytest.approx(102.0)
+
+    def test_update_holds_and_notifies(self, meters, client):
+        """Test the update extends republished readings and notifies listeners."""
+        listener = MagicMock()
+        meters.async_add_listener(listener)
+        with patch(MONOTONIC, return_value=0):
+            meter = meters.async_track(
+                POWER_KEY, 0.0, {OUTLET_TOPIC: {"activePower": 120}}
+            )
+        client.topic_received_at[OUTLET_TOPIC] = 30
+        meters._async_update()
+        assert meter.energy == pytest.approx(1.0)
+        listener.assert_called_once()
+
+    def test_stop_unsubscribes(self, meters, client):
+        """Test stopping releases the topic subscriptions."""
+        meters.async_track(POWER_KEY, 0.0, {})
+        meters.async_stop()
+        assert client.callbacks == {}
+
+
+class TestEnergySensor:
+    """Tests for the integrated energy sensors."""
+
+    @pytest.mark.parametrize(
+        ("measures", "expected"),
+        [
+            ({"activePower": 58}, True),
+            ({"activePower": 58, "cumulatedEnergy": 1211635.9}, False),
+            ({"current": 0.4}, False),
+            (None, False),
+        ],
+    )
+    def test_needs_derived_energy(self, measures, expected):
+        """Test only power readings without an energy counter are derived."""
+        data = {OUTLET_TOPIC: measures}
+        assert _needs_derived_energy(power_description(), data) is expected
+
+    def test_inputs_not_derived(self):
+        """Test input power readings never get an integrated energy sensor."""
+        description = MagicMock(
+            key="powerDistributions/1/inputs/1/measures$activePower"
+        )
+        data = {"powerDistributions/1/inputs/1/measures": {"activePower": 1}}
+        assert not _needs_derived_energy(description, data)
+
+    def test_description(self):
+        """Test the description is keyed and named after the power reading."""
+        description = _generate_energy_description(power_description())
+        assert description.key == f"{POWER_KEY}@energy"
+        assert description.name == "Outlet 2 Integrated Energy"
+        assert description.translation_key == "integrated_energy"
+
+    async def test_restores_total(self, meters):
+        """Test the sensor continues from its restored state."""
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "entry"
+        coordinator.energy = meters
+        coordinator.data = {OUTLET_TOPIC: {"activePower": 58}}
+        sensor = EatonUpsEnergySensor(
+            coordinator, _generate_energy_description(power_description())
+        )
+        assert sensor.native_value is None
+        sensor.async_get_last_sensor_data = AsyncMock(
+            return_value=MagicMock(native_value="1234.5")
+        )
+        await sensor.async_added_to_hass()
+        assert sensor.unique_id == f"entry_{POWER_KEY}@energy"
+        assert sensor.native_value == 1234.5
@@ -5,16 +5,27 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+from homeassistant.components.sensor import SensorEntityDescription
 
 from custom_components.eaton_ups_mqtt.binary_sensor import (
     _generate_input_binary_descriptions,
     _generate_outlet_binary_descriptions,
+    get_binary_entity_descriptions,
 )
-from custom_components.eaton_ups_mqtt.const import MQTT_PREFIX_V1, MQTT_PREFIX_V2
+from custom_components.eaton_ups_mqtt.const import (
+    DOMAIN,
+    MQTT_PREFIX_V1,
+    MQTT_PREFIX_V2,
+)
+from custom_components.eaton_ups_mqtt.devices import DeviceMetadata
+from custom_components.eaton_ups_mqtt.distributions import index_distributions
 from custom_components.eaton_ups_mqtt.sensor import (
+    EatonUpsSensor,
     _generate_input_descriptions,
     _generate_outlet_descriptions,
     _generate_output_descriptions,
+    _generate_phase_descriptions,
+    _get_phase_descriptions,
     get_entity_descriptions,
 )
 
@@ -60,6 +71,49 @@ class TestSensorDescriptionGenerators:
             assert f"outlets/{outlet_num}/" in desc.key
 
 
+class TestPhaseDescriptions:
+    """Tests for per-phase input and output descriptions."""
+
+    @staticmethod
+    def three_phase_data():
+        """Return measures topics of a three-phase input and output."""
+        return {
+            f"powerDistributions/1/{kind}/1/phases/{phase}/measures": {}
+            for kind in ("inputs", "outputs")
+            for phase in (1, 2, 3)
+        }
+
+    def test_phase_keys(self):
+        """Test phase descriptions read from the phase measures topic."""
+        descriptions = _generate_phase_descriptions("outputs", 2, 3)
+        keys = [d.key for d in descriptions]
+        assert "powerDistributions/1/outputs/2/phases/3/measures$voltage" in keys
+        assert "powerDistributions/1/outputs/2/phases/3/measures$activePower" in keys
+        assert descriptions[0].name == "Output 2 Phase 3 Voltage"
+
+    def test_input_phases_have_no_power(self):
+        """Test input phases only expose voltage and current."""
+        descriptions = _generate_phase_descriptions("inputs", 1, 2)
+        assert [d.key.rpartition("$")[2] for d in descriptions] == [
+            "voltage",
+            "current",
+        ]
+
+    def test_three_phase_discovery(self):
+        """Test every phase of a three-phase input and output is exposed."""
+        layout = index_distributions(self.three_phase_data())["1"]
+        descriptions = _get_phase_descriptions(layout, "1")
+        keys = {d.key for d in descriptions}
+        assert len(descriptions) == 3 * 2 + 3 * 6
+        assert "powerDistributions/1/inputs/1/phases/3/measures$current" in keys
+        assert "powerDistributions/1/outputs/1/phases/2/measures$powerFactor" in keys
+
+    def test_single_phase_not_exposed(self, ups_5px_g2_data):
+        """Test single-phase units get no phase entities."""
+        layout = index_distributions(ups_5px_g2_data)["1"]
+        assert _get_phase_descriptions(layout, "1") == []
+
+
 class TestBinarySensorDescriptionGenerators:
     """Tests for binary sensor description generator functions."""
 
@@ -132,3 +186,81 @@ class TestVersionDependentDescriptions:
         assert "managers/1/identification$friendlyName" in keys
         assert "managers/1/identification$name" not in keys
         assert "managers/1/identification$manufacturer" not in keys
+
+
+class TestMultipleDistributions:
+    """Tests for descriptions generated per powerDistribution."""
+
+    @pytest.fixture
+    def coordinator(self, ups_5px_g2_data):
+        """Create a mock coordinator whose card exposes two distributions."""
+        data = dict(ups_5px_g2_data)
+        data["powerDistributions/2/identification"] = {"model": "Second"}
+        data["powerDistributions/2/inputs/1/measures"] = {"voltage": 230.0}
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "test"
+        coordinator.config_entry.runtime_data.client.mqtt_prefix = MQTT_PREFIX_V1
+        coordinator.data = data
+        coordinator.devices = DeviceMetadata(MagicMock(), "test", "Eaton UPS (host)")
+        coordinator.devices.async_start(MagicMock(), data)
+        return coordinator
+
+    def test_distribution_1_keys_unchanged(self, coordinator, ups_5px_g2_data):
+        """Test distribution 1 keeps its keys, and so its unique ids."""
+        single = MagicMock()
+        single.config_entry.runtime_data.client.mqtt_prefix = MQTT_PREFIX_V1
+        single.data = ups_5px_g2_data
+        expected = {d.key for d in get_entity_descriptions(single)}
+        keys = {d.key for d in get_entity_descriptions(coordinator)}
+        assert expected <= keys
+
+    def test_second_distribution_sensors(self, coordinator):
+        """Test the second distribution gets its own base and input sensors."""
+        keys = [d.key for d in get_entity_descriptions(coordinator)]
+        assert "powerDistributions/2/identification$model" in keys
+        assert "powerDistributions/2/inputs/1/measures$voltage" in keys
+        assert "powerDistributions/2/outlets/1/measures$voltage" not in keys
+        assert len(keys) == len(set(keys))
+
+    def test_descriptions_shared_between_entries(self, coordinator):
+        """Test entries with the same layout share description objects."""
+        other = MagicMock()
+        other.config_entry.runtime_data.client.mqtt_prefix = MQTT_PREFIX_V1
+        other.data = dict(coordinator.data)
+        first = get_entity_descriptions(coordinator)
+        second = get_entity_descriptions(other)
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_second_distribution_binary_sensors(self, coordinator):
+        """Test the second distribution gets its own binary sensors."""
+        keys = [d.key for d in get_binary_entity_descriptions(coordinator)]
+        assert "powerDistributions/2/status$internalFailure" in keys
+        assert "powerDistributions/2/inputs/1/status$supply" in keys
+        assert len(keys) == len(set(keys))
+
+    @pytest.mark.parametrize(
+        ("key", "identifier", "model"),
+        [
+            (
+                "powerDistributions/1/identification$model",
+                "test",
+                "Eaton 5PX 1500i RT2U G2",
+            ),
+            ("powerDistributions/2/identification$model", "test_2", "Second"),
+            ("managers/1/identification$name", "test", "Eaton 5PX 1500i RT2U G2"),
+        ],
+    )
+    def test_one_device_per_distribution(self, coordinator, key, identifier, model):
+        """Test entities are attached to the device of their distribution."""
+        description = SensorEntityDescription(key=key, name="Test")
+        sensor = EatonUpsSensor(coordinator, description)
+        assert sensor.device_info["identifiers"] == {(DOMAIN, identifier)}
+        assert sensor.device_info["model"] == model
+
+    def test_device_info_shared(self, coordinator):
+        """Test entities of one device share a single DeviceInfo."""
+        first, second = (
+            EatonUpsSensor(coordinator, description)
+            for description in get_entity_descriptions(coordinator)[:2]
+        )
+        assert first.device_info is second.device_info
@@ -0,0 +1,76 @@
+"""Unit tests for the status enum tables."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.enums import (
+    CHARGER_STATUS_OPTIONS,
+    ENUM_INDEXES,
+    HEALTH_OPTIONS,
+    OPERATING_OPTIONS,
+    get_enum_converter,
+)
+
+CHARGER_STATUS_KEY = (
+    "powerDistributions/1/backupSystem/powerBank/chargers/1/status$chargerStatus"
+)
+
+
+class TestEnumIndexes:
+    """Tests for the precomputed indexes."""
+
+    @pytest.mark.parametrize(
+        ("field", "options"),
+        [
+            ("operating", OPERATING_OPTIONS),
+            ("health", HEALTH_OPTIONS),
+            ("chargerStatus", CHARGER_STATUS_OPTIONS),
+        ],
+    )
+    def test_indexes_resolve_to_options(self, field, options):
+        """Test every indexed raw value resolves to a declared option."""
+        assert set(ENUM_INDEXES[field].values()) <= set(options)
+
+    def test_options_are_translation_keys(self):
+        """Test options are lowercase snake case, as state translations need."""
+        for option in OPERATING_OPTIONS + HEALTH_OPTIONS + CHARGER_STATUS_OPTIONS:
+            assert option == option.lower()
+            assert " " not in option
+
+
+class TestGetEnumConverter:
+    """Tests for get_enum_converter."""
+
+    @pytest.mark.parametrize(
+        ("key", "value", "expected"),
+        [
+            ("powerDistributions/1/status$operating", "in service", "in_service"),
+            ("sensors/status$operating", 16, "in_service"),
+            ("sensors/status$operating", 5, "stopped"),
+            ("sensors/status$operating", 7, "dormant"),
+            ("powerDistributions/1/status$health", "ok", "ok"),
+            ("sensors/status$health", 5, "ok"),
+            ("sensors/status$health", 25, "critical_failure"),
+            (CHARGER_STATUS_KEY, "on not charging", "on_not_charging"),
+        ],
+    )
+    def test_known_values(self, key, value, expected):
+        """Test raw strings and integer codes map onto options."""
+        assert get_enum_converter(key)(value) == expected
+
+    def test_field_without_table(self):
+        """Test fields without a table have no converter."""
+        assert get_enum_converter("powerDistributions/1/status$mode") is None
+
+    @pytest.mark.parametrize("value", ["exploded", 99, {"nested": 1}])
+    def test_unknown_values_logged(self, value, caplog):
+        """Test values outside the table convert to None and are logged."""
+        converter = get_enum_converter("powerDistributions/1/status$operating")
+        assert converter(value) is None
+        assert "Unknown operating value" in caplog.text
+
+    def test_missing_value_not_logged(self, caplog):
+        """Test a missing value converts to None silently."""
+        assert get_enum_converter("sensors/status$health")(None) is None
+        assert caplog.text == ""
@@ -0,0 +1,178 @@
+"""Unit tests for the fleet aggregates."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.fleet import (
+    DISTRIBUTION_STATUS_TOPIC,
+    MEMBERS,
+    MINIMUM_RUNTIME,
+    ON_BATTERY,
+    TOTAL_ENERGY,
+    TOTAL_LOAD,
+    WORST_HEALTH,
+    FleetAggregator,
+    async_get_fleet,
+)
+from custom_components.eaton_ups_mqtt.sensor import (
+    FLEET_ENTITY_DESCRIPTIONS,
+    EatonUpsFleetSensor,
+)
+
+OUTPUT_TOPIC = "powerDistributions/1/outputs/1/measures"
+POWER_BANK_TOPIC = "powerDistributions/1/backupSystem/powerBank/measures"
+POWER_BANK_STATUS_TOPIC = "powerDistributions/1/backupSystem/powerBank/status"
+
+
+@pytest.fixture
+def clients(fake_client):
+    """Return fake clients of two UPSes."""
+    return fake_client(), fake_client()
+
+
+@pytest.fixture
+def fleet(clients, ups_5px_g2_data, ups_5px_2200_g2_m3_data):
+    """Create a fleet joined by the 5PX G2 and 5PX 2200 G2 fixtures."""
+    instance = FleetAggregator()
+    instance.async_join("first", clients[0], ups_5px_g2_data)
+    instance.async_join("second", clients[1], ups_5px_2200_g2_m3_data)
+    return instance
+
+
+class TestFleetAggregator:
+    """Tests for the incremental fleet aggregates."""
+
+    def test_join(self, fleet):
+        """Test joining seeds the aggregates from each UPS's topics."""
+        assert fleet.values == {
+            TOTAL_LOAD: 937.0,
+            TOTAL_ENERGY: 0.0,
+            ON_BATTERY: 0,
+            MINIMUM_RUNTIME: 4781.0,
+            WORST_HEALTH: "ok",
+            MEMBERS: 2,
+        }
+
+    def test_load(self, fleet, clients):
+        """Test a load change replaces only that UPS's contribution."""
+        clients[0].publish(OUTPUT_TOPIC, {"activePower": 200})
+        assert fleet.values[TOTAL_LOAD] == 963.0
+        clients[0].publish(OUTPUT_TOPIC, None)
+        assert fleet.values[TOTAL_LOAD] == 763.0
+
+    def test_energy_increments(self, fleet, clients):
+        """Test the energy total adds counter increments and ignores resets."""
+        clients[0].publish(OUTPUT_TOPIC, {"cumulatedEnergy": 4686431.1559296})
+        clients[1].publish(OUTPUT_TOPIC, {"cumulatedEnergy": 8607934.944992})
+        assert fleet.values[TOTAL_ENERGY] == 15.0
+        clients[0].publish(OUTPUT_TOPIC, {"cumulatedEnergy": 0})
+        clients[0].publish(OUTPUT_TOPIC, {"cumulatedEnergy": 2})
+        assert fleet.values[TOTAL_ENERGY] == 17.0
+
+    def test_on_battery(self, fleet, clients):
+        """Test the on-battery count follows each UPS's supply flag."""
+        clients[0].publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+        clients[1].publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+        clients[1].publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+        assert fleet.values[ON_BATTERY] == 2
+        clients[0].publish(POWER_BANK_STATUS_TOPIC, {"supply": False})
+        assert fleet.values[ON_BATTERY] == 1
+
+    def test_minimum_runtime(self, fleet, clients):
+        """Test the minimum follows raised and lowered runtimes."""
+        clients[1].publish(POWER_BANK_TOPIC, {"remainingTime": 20000})
+        assert fleet.values[MINIMUM_RUNTIME] == 15636.0
+        clients[0].publish(POWER_BANK_TOPIC, {"remainingTime": 100})
+        assert fleet.values[MINIMUM_RUNTIME] == 100.0
+        clients[0].publish(POWER_BANK_TOPIC, {})
+        assert fleet.values[MINIMUM_RUNTIME] == 20000.0
+
+    def test_runtime_heap_bounded(self, fleet, clients):
+        """Test stale runtime entries are pruned rather than piling up."""
+        for runtime in range(1000, 2000):
+            clients[0].publish(POWER_BANK_TOPIC, {"remainingTime": runtime})
+        assert fleet.values[MINIMUM_RUNTIME] == 1999.0
+        assert len(fleet._runtimes) <= 4 * 3
+
+    @pytest.mark.parametrize(
+        ("first", "second", "worst"),
+        [
+            ("ok", "degraded", "degraded"),
+            (25, "ok", "critical_failure"),
+            ("unknown", "minor failure", "minor_failure"),
+            ("unknown", "bogus", "unknown"),
+        ],
+    )
+    def test_worst_health(self, fleet, clients, first, second, worst):
+        """Test the worst known health wins, including M2 integer codes."""
+        clients[0].publish(DISTRIBUTION_STATUS_TOPIC, {"health": first})
+        clients[1].publish(DISTRIBUTION_STATUS_TOPIC, {"health": second})
+        assert fleet.values[WORST_HEALTH] == worst
+
+    def test_leave(self, fleet, clients):
+        """Test leaving removes a UPS's contributions and subscriptions."""
+        clients[1].publish(POWER_BANK_STATUS_TOPIC, {"supply": True})
+        clients[1].publish(OUTPUT_TOPIC, {"cumulatedEnergy": 8607939.944992})
+        fleet.async_leave("second")
+        assert clients[1].callbacks == {}
+        assert fleet.values == {
+            TOTAL_LOAD: 174.0,
+            TOTAL_ENERGY: 10.0,
+            ON_BATTERY: 0,
+            MINIMUM_RUNTIME: 15636.0,
+            WORST_HEALTH: "ok",
+            MEMBERS: 1,
+        }
+        fleet.async_leave("first")
+        assert fleet.values[TOTAL_LOAD] == 0.0
+        assert fleet.values[WORST_HEALTH] is None
+
+    def test_listeners_per_value(self, fleet, clients):
+        """Test listeners are only called when their own aggregate changes."""
+        load = MagicMock()
+        health = MagicMock()
+        fleet.async_add_listener(TOTAL_LOAD, load)
+        remove = fleet.async_add_listener(WORST_HEALTH, health)
+        clients[0].publish(OUTPUT_TOPIC, {"activePower": 180})
+        clients[0].publish(OUTPUT_TOPIC, {"activePower": 180})
+        load.assert_called_once()
+        health.assert_not_called()
+        remove()
+        clients[0].publish(DISTRIBUTION_STATUS_TOPIC, {"health": "degraded"})
+        health.assert_not_called()
+
+    def test_restore_energy_once(self, fleet):
+        """Test the restored energy total is only applied once."""
+        fleet.async_restore_energy(1000.0)
+        fleet.async_restore_energy(1000.0)
+        assert fleet.values[TOTAL_ENERGY] == 1000.0
+
+    def test_providers(self, fleet):
+        """Test one entry provides the entities and the next takes over."""
+        first = MagicMock()
+        second = MagicMock()
+        fleet.async_add_provider("first", first)
+        fleet.async_add_provider("second", second)
+        first.assert_called_once()
+        second.assert_not_called()
+        fleet.async_leave("first")
+        second.assert_called_once()
+
+
+def test_get_fleet_shared():
+    """Test all entries share one fleet per Home Assistant instance."""
+    hass = MagicMock(data={})
+    assert async_get_fleet(hass) is async_get_fleet(hass)
+
+
+def test_fleet_sensor(fleet):
+    """Test fleet sensors live on the shared device and read their aggregate."""
+    sensors = [
+        EatonUpsFleetSensor(fleet=fleet, entity_description=description)
+        for description in FLEET_ENTITY_DESCRIPTIONS
+    ]
+    assert {sensor.native_value for sensor in sensors} >= {937.0, 4781.0, "ok"}
+    assert sensors[0].unique_id == "eaton_ups_mqtt_fleet_total_load"
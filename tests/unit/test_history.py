@@ -0,0 +1,189 @@
+"""Unit tests for the in-memory measurement history."""
+
+from __future__ import annotations
+
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.history import MeasurementHistory, RollingWindow
+from custom_components.eaton_ups_mqtt.sensor import (
+    EatonUpsHistorySensor,
+    _generate_history_descriptions,
+)
+
+LOAD_TOPIC = "powerDistributions/1/outputs/1/measures"
+LOAD_KEY = f"{LOAD_TOPIC}$percentLoad"
+VOLTAGE_KEY = f"{LOAD_TOPIC}$voltage"
+
+
+@pytest.fixture
+def history(client):
+    """Create a measurement history started on the fake client."""
+    instance = MeasurementHistory(MagicMock(), window=300, capacity=8)
+    with patch("custom_components.eaton_ups_mqtt.history.async_track_time_interval"):
+        instance.async_start(client)
+    return instance
+
+
+class TestRollingWindow:
+    """Tests for the ring buffer aggregates."""
+
+    def test_empty(self):
+        """Test an empty window has no aggregates."""
+        rolling = RollingWindow(4, 60)
+        assert len(rolling) == 0
+        assert rolling.minimum is None
+        assert rolling.maximum is None
+        assert rolling.mean is None
+
+    def test_aggregates(self):
+        """Test minimum, maximum and mean over the samples."""
+        rolling = RollingWindow(8, 60)
+        for timestamp, value in enumerate([5.0, 2.0, 9.0, 4.0]):
+            rolling.append(timestamp, value)
+        assert len(rolling) == 4
+        assert rolling.minimum == 2.0
+        assert rolling.maximum == 9.0
+        assert rolling.mean == pytest.approx(16 / 3)
+        rolling.expire(5)
+        assert rolling.mean == pytest.approx(24 / 5)
+
+    def test_mean_time_weighted(self):
+        """Test a steady value outweighs a short burst of jitter."""
+        rolling = RollingWindow(16, 300)
+        rolling.append(0, 100.0)
+        for offset, value in enumerate([90.0, 110.0] * 3):
+            rolling.append(240 + offset * 10, value)
+        rolling.append(299, 100.0)
+        rolling.expire(300)
+        assert rolling.mean == pytest.approx(
+            (100.0 * 240 + (90.0 + 110.0) * 20 + 90.0 * 10 + 110.0 * 9 + 100.0) / 300
+        )
+
+    def test_mean_weights_carried_value_from_window_start(self):
+        """Test the value carried into the window only counts from its start."""
+        rolling = RollingWindow(8, 60)
+        rolling.append(0, 10.0)
+        rolling.append(100, 40.0)
+        rolling.expire(110)
+        assert len(rolling) == 2
+        assert rolling.mean == pytest.approx((10.0 * 50 + 40.0 * 10) / 60)
+
+    def test_capacity_evicts_oldest(self):
+        """Test a full buffer drops its oldest sample."""
+        rolling = RollingWindow(3, 60)
+        for timestamp, value in enumerate([1.0, 9.0, 5.0, 6.0, 7.0]):
+            rolling.append(timestamp, value)
+        assert len(rolling) == 3
+        assert rolling.minimum == 5.0
+        assert rolling.maximum == 7.0
+        assert rolling.mean == 5.5
+
+    def test_expire_keeps_value_in_effect(self):
+        """Test the newest sample before the window is kept at its start."""
+        rolling = RollingWindow(8, 60)
+        rolling.append(0, 10.0)
+        rolling.append(10, 20.0)
+        rolling.append(100, 30.0)
+        assert len(rolling) == 2
+        assert rolling.minimum == 20.0
+        rolling.expire(1000)
+        assert len(rolling) == 1
+        assert rolling.mean == 30.0
+
+    def test_wraparound(self):
+        """Test aggregates stay correct across many wraps of the buffer."""
+        rolling = RollingWindow(4, 1000)
+        values = [float((i * 7) % 11) for i in range(50)]
+        for timestamp, value in enumerate(values):
+            rolling.append(timestamp, value)
+        assert rolling.minimum == min(values[-4:])
+        assert rolling.maximum == max(values[-4:])
+        assert rolling.mean == pytest.approx(sum(values[-4:-1]) / 3)
+
+
+class TestMeasurementHistory:
+    """Tests for tracking topics into rolling windows."""
+
+    def test_track_seeds_and_subscribes(self, history, client):
+        """Test tracking seeds the current value and subscribes once per topic."""
+        data = {LOAD_TOPIC: {"percentLoad": 12, "voltage": 230.5}}
+        load = history.async_track(LOAD_KEY, data)
+        voltage = history.async_track(VOLTAGE_KEY, data)
+        assert history.async_track(LOAD_KEY, data) is load
+        assert history.window(VOLTAGE_KEY) is voltage
+        assert set(client.callbacks) == {LOAD_TOPIC}
+        assert load.mean == 12.0
+        assert voltage.mean == 230.5
+
+    def test_payloads_appended(self, history, client):
+        """Test numeric fields of published payloads are appended."""
+        load = history.async_track(LOAD_KEY, {})
+        client.publish(LOAD_TOPIC, {"percentLoad": 20})
+        client.publish(LOAD_TOPIC, {"percentLoad": 40})
+        assert load.minimum == 20.0
+        assert load.maximum == 40.0
+
+    @pytest.mark.parametrize("value", [None, "20", True])
+    def test_non_numeric_ignored(self, history, client, value):
+        """Test missing, string and boolean values are not appended."""
+        load = history.async_track(LOAD_KEY, {})
+        client.publish(LOAD_TOPIC, {"percentLoad": value})
+        client.publish(LOAD_TOPIC, {})
+        assert len(load) == 0
+
+    def test_publish_notifies_listeners(self, history):
+        """Test listeners are called on publish until removed."""
+        listener = MagicMock()
+        remove = history.async_add_listener(listener)
+        history._async_publish()
+        listener.assert_called_once()
+        remove()
+        history._async_publish()
+        listener.assert_called_once()
+
+    def test_stop_unsubscribes(self, history, client):
+        """Test stopping releases the topic subscriptions."""
+        history.async_track(LOAD_KEY, {})
+        history.async_stop()
+        assert client.callbacks == {}
+
+
+class TestHistorySensor:
+    """Tests for the rolling aggregate sensors."""
+
+    def test_descriptions(self):
+        """Test one description per aggregate, keyed after the source."""
+        source = MagicMock(key=LOAD_KEY)
+        source.name = "Output Load"
+        descriptions = _generate_history_descriptions(source)
+        assert [d.key for d in descriptions] == [
+            f"{LOAD_KEY}@minimum",
+            f"{LOAD_KEY}@maximum",
+            f"{LOAD_KEY}@mean",
+        ]
+        assert descriptions[2].name == "Output Load 5 min Average"
+        assert descriptions[2].translation_key == "measurement_mean"
+
+    def test_native_value(self, history):
+        """Test the sensor reports its aggregate of the window."""
+        with patch(
+            "custom_components.eaton_ups_mqtt.history.time.monotonic", return_value=0
+        ):
+            rolling = history.async_track(LOAD_KEY, {LOAD_TOPIC: {"percentLoad": 30}})
+        rolling.append(10, 50.0)
+        rolling.expire(20)
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "entry"
+        source = MagicMock(key=LOAD_KEY)
+        source.name = "Output Load"
+        minimum, maximum, mean = (
+            EatonUpsHistorySensor(coordinator, description, rolling)
+            for description in _generate_history_descriptions(source)
+        )
+        assert minimum.unique_id == f"entry_{LOAD_KEY}@minimum"
+        assert minimum.native_value == 30.0
+        assert maximum.native_value == 50.0
+        assert mean.native_value == 40.0
+        coordinator.devices.entity_device_info.assert_called_with(LOAD_TOPIC, ANY)
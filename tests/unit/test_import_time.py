@@ -0,0 +1,132 @@
+"""Import-time checks for the integration modules."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE = "custom_components.eaton_ups_mqtt"
+
+# Modules Home Assistant imports when setting up an existing entry
+BOOT_MODULES = (PACKAGE, f"{PACKAGE}.sensor", f"{PACKAGE}.binary_sensor")
+
+# Home Assistant modules loaded before any custom integration, so their own
+# imports (such as jwt pulling in cryptography) are not the integration's
+PRELOADED_MODULES = (
+    "homeassistant.core",
+    "homeassistant.auth",
+    "homeassistant.config_entries",
+    "homeassistant.components.http",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+)
+
+# Dependencies that are only needed for certificate generation or a connection
+DEFERRED_DEPENDENCIES = ("cryptography", "paho")
+
+# Modules only needed when their option is enabled
+OPTIONAL_MODULES = (
+    f"{PACKAGE}.history",
+    f"{PACKAGE}.metrics",
+    f"{PACKAGE}.recorder_stats",
+)
+
+ROOT = Path(__file__).parents[2]
+
+SAMPLE_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:         5 |          5 |     c
+import time:        10 |         15 |   b
+import time:        20 |         35 | a
+import time:         7 |          7 | d
+"""
+
+
+def run_importtime(modules):
+    """Import modules in a fresh interpreter and return the -X importtime log."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "; ".join(f"import {module}" for module in modules),
+        ],
+        capture_output=True,
+        check=False,
+        cwd=ROOT,
+        text=True,
+    )
+    if "No module named 'homeassistant" in result.stderr:
+        pytest.skip("Home Assistant is not installed")
+    assert result.returncode == 0, result.stderr
+    return result.stderr
+
+
+def parse_importtime(log):
+    """
+    Parse an -X importtime log into (name, self time, descendants) entries.
+
+    Imports are logged after the modules they import, indented one level
+    deeper, so descendants are collected bottom-up per nesting depth.
+    """
+    entries = []
+    pending: dict[int, set[str]] = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, raw_name = line.removeprefix("import time:").split("|")
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        descendants = pending.pop(depth + 1, set())
+        entries.append((name, int(self_us), descendants))
+        pending.setdefault(depth, set()).update(descendants | {name})
+    return entries
+
+
+class TestParseImporttime:
+    """Tests for the importtime log parser."""
+
+    def test_nesting(self):
+        """Test descendants are attributed to the importing module."""
+        entries = {
+            name: (self_us, desc)
+            for name, self_us, desc in parse_importtime(SAMPLE_LOG)
+        }
+        assert entries["a"] == (20, {"b", "c"})
+        assert entries["b"] == (10, {"c"})
+        assert entries["d"] == (7, set())
+
+
+def package_imports(entries):
+    """Return the modules first imported by the integration's own modules."""
+    return {
+        descendant
+        for name, _, descendants in entries
+        if name == PACKAGE or name.startswith(f"{PACKAGE}.")
+        for descendant in descendants
+    }
+
+
+class TestImportTime:
+    """Checks for what importing the integration at boot pulls in."""
+
+    @pytest.fixture(scope="class")
+    def entries(self):
+        """Return the parsed importtime log of the boot modules."""
+        return parse_importtime(run_importtime(PRELOADED_MODULES + BOOT_MODULES))
+
+    @pytest.mark.parametrize("dependency", DEFERRED_DEPENDENCIES)
+    def test_dependency_deferred(self, entries, dependency):
+        """Test heavy dependencies are not imported by the integration."""
+        imported = {module.partition(".")[0] for module in package_imports(entries)}
+        assert dependency not in imported
+
+    @pytest.mark.parametrize("module", OPTIONAL_MODULES)
+    def test_optional_module_deferred(self, entries, module):
+        """Test modules of opt-in features are not imported at boot."""
+        assert module not in {name for name, _, _ in entries}
@@ -0,0 +1,115 @@
+"""Unit tests for ingest pipeline self-instrumentation."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.ingest import (
+    IngestCounters,
+    IngestStatsPublisher,
+)
+
+
+@pytest.fixture
+def publisher():
+    """Create a started publisher with its timer patched out."""
+    counters = IngestCounters()
+    instance = IngestStatsPublisher(MagicMock(), counters)
+    with (
+        patch("custom_components.eaton_ups_mqtt.ingest.time.monotonic", return_value=0),
+        patch(
+            "custom_components.eaton_ups_mqtt.ingest.async_track_time_interval"
+        ) as mock_interval,
+    ):
+        instance.async_start()
+    instance.timer = mock_interval
+    return instance
+
+
+def publish_at(publisher, now):
+    """Publish a snapshot at the given monotonic time."""
+    with patch(
+        "custom_components.eaton_ups_mqtt.ingest.time.monotonic", return_value=now
+    ):
+        publisher._async_publish()
+    return publisher.snapshot
+
+
+class TestIngestStatsPublisher:
+    """Tests for periodic ingest snapshots."""
+
+    def test_rates(self, publisher):
+        """Test message and byte rates are computed over the window."""
+        counters = publisher._counters
+        for _ in range(50):
+            counters.record_message(200)
+
+        snapshot = publish_at(publisher, 10)
+
+        assert snapshot["messages_per_second"] == 5.0
+        assert snapshot["bytes_per_second"] == 1000
+
+    def test_rates_are_per_window(self, publisher):
+        """Test rates only count messages since the last snapshot."""
+        counters = publisher._counters
+        counters.record_message(100)
+        publish_at(publisher, 10)
+
+        snapshot = publish_at(publisher, 20)
+
+        assert snapshot["messages_per_second"] == 0.0
+        assert snapshot["bytes_per_second"] == 0
+
+    def test_decode_percentiles(self, publisher):
+        """Test decode percentiles and that the sample window resets."""
+        counters = publisher._counters
+        counters.decode_samples.extend(n / 1000 for n in range(1, 101))
+
+        snapshot = publish_at(publisher, 10)
+
+        assert snapshot["decode_time_p50"] == 51.0
+        assert snapshot["decode_time_p99"] == 100.0
+        assert len(counters.decode_samples) == 0
+
+    def test_empty_windows_report_none(self, publisher):
+        """Test timings are None when nothing was sampled."""
+        snapshot = publish_at(publisher, 10)
+
+        assert snapshot["decode_time_p50"] is None
+        assert snapshot["dispatch_lag_p99"] is None
+        assert snapshot["connack_latency"] is None
+
+    def test_connection_counters(self, publisher):
+        """Test connection counters are reported in milliseconds."""
+        counters = publisher._counters
+        counters.duplicates = 7
+        counters.reconnects = 2
+        counters.connack_latency = 0.0125
+        counters.tls_handshake = 0.25
+
+        snapshot = publish_at(publisher, 10)
+
+        assert snapshot["suppressed_duplicates"] == 7
+        assert snapshot["reconnects"] == 2
+        assert snapshot["connack_latency"] == 12.5
+        assert snapshot["tls_handshake_time"] == 250.0
+
+    def test_listeners_notified(self, publisher):
+        """Test listeners are notified until removed."""
+        listener = MagicMock()
+        remove = publisher.async_add_listener(listener)
+
+        publish_at(publisher, 10)
+        remove()
+        publish_at(publisher, 20)
+
+        listener.assert_called_once()
+
+    def test_stop_cancels_timer(self, publisher):
+        """Test stopping the publisher cancels its timer."""
+        unsub = publisher._unsub_timer
+        publisher.async_stop()
+        unsub.assert_called_once()
+        assert publisher._unsub_timer is None
@@ -0,0 +1,26 @@
+"""Unit tests for the shared listener registration."""
+
+from __future__ import annotations
+
+from custom_components.eaton_ups_mqtt.listeners import async_register_listener
+
+
+class TestRegisterListener:
+    """Tests for adding and removing listeners."""
+
+    def test_remove(self):
+        """Test the returned function removes only its own listener."""
+        listeners = []
+        first = async_register_listener(listeners, "first")
+        async_register_listener(listeners, "second")
+        assert listeners == ["first", "second"]
+        first()
+        assert listeners == ["second"]
+
+    def test_remove_twice(self):
+        """Test removing a listener again is a no-op."""
+        listeners = []
+        remove = async_register_listener(listeners, "listener")
+        remove()
+        remove()
+        assert listeners == []
@@ -0,0 +1,201 @@
+"""Unit tests for the OpenMetrics exporter."""
+
+from __future__ import annotations
+
+import itertools
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.http import KEY_HASS
+
+from custom_components.eaton_ups_mqtt.const import CONF_METRICS_EXPORTER
+from custom_components.eaton_ups_mqtt.metrics import (
+    CONTENT_TYPE,
+    OPAQUE_ID_LABELS,
+    EatonUpsMetricsView,
+    MetricsRenderer,
+    _snake,
+    render_metrics,
+    topic_template,
+)
+
+OUTLET_TOPIC = "powerDistributions/1/outlets/2/measures"
+VOLTAGE_FAMILY = "eaton_ups_power_distributions_inputs_measures_voltage"
+
+
+def make_entry(renderer, data, *, enabled=True):
+    """Return a loaded config entry stand-in serving a renderer."""
+    entry = MagicMock()
+    entry.options = {CONF_METRICS_EXPORTER: enabled}
+    entry.runtime_data.coordinator.metrics = renderer
+    entry.runtime_data.coordinator.data = data
+    return entry
+
+
+def make_request(entries):
+    """Return a request stand-in whose hass holds the given entries."""
+    hass = MagicMock()
+    hass.config_entries.async_loaded_entries.return_value = entries
+    return MagicMock(app={KEY_HASS: hass})
+
+
+class TestTopicTemplate:
+    """Tests for metric name and label templates."""
+
+    def test_indexed_topic(self):
+        """Test numeric segments become labels named after their collection."""
+        assert topic_template(OUTLET_TOPIC, 'host="ups"') == (
+            "eaton_ups_power_distributions_outlets_measures",
+            'host="ups",power_distribution="1",outlet="2"',
+        )
+
+    def test_plain_topic(self):
+        """Test topics without indexes only carry the base labels."""
+        assert topic_template("managers/1/identification", "") == (
+            "eaton_ups_managers_identification",
+            'manager="1"',
+        )
+
+    def test_opaque_ids(self):
+        """Test opaque sensor and supplier ids become labels."""
+        assert topic_template(
+            "sensors/devices/ZVUNRvBtWsalpX44CHxfeQ/channels/temperatures/"
+            "PoOj7VPqWUqjDMyPYd4yYw/measures",
+            "",
+        ) == (
+            "eaton_ups_sensors_devices_channels_temperatures_measures",
+            'device="ZVUNRvBtWsalpX44CHxfeQ",channel="PoOj7VPqWUqjDMyPYd4yYw"',
+        )
+        assert topic_template("powerService/suppliers/sM_i2O-TVIa87/measures", "") == (
+            "eaton_ups_power_service_suppliers_measures",
+            'supplier="sM_i2O-TVIa87"',
+        )
+
+    def test_fixture_family_names(self, ups_5px_2200_g2_m3_data):
+        """Test no opaque id of the M3 fixture ends up in a family name."""
+        ids = {
+            segment
+            for topic in ups_5px_2200_g2_m3_data
+            for collection, segment in itertools.pairwise(topic.split("/"))
+            if collection in OPAQUE_ID_LABELS
+        }
+        blocks = MetricsRenderer("ups").families(ups_5px_2200_g2_m3_data)
+        assert ids
+        assert not any(
+            _snake(opaque_id) in family for family in blocks for opaque_id in ids
+        )
+
+
+class TestMetricsRenderer:
+    """Tests for incremental rendering."""
+
+    def test_samples(self):
+        """Test numeric and boolean fields render, other values are skipped."""
+        renderer = MetricsRenderer("10.0.0.5")
+        blocks = renderer.families(
+            {
+                OUTLET_TOPIC: {
+                    "@id": "x",
+                    "activePower": 58,
+                    "current": 0.4,
+                    "name": "Outlet",
+                    "switchedOn": True,
+                    "nested": {"valueA": 1.5},
+                }
+            }
+        )
+        labels = 'host="10.0.0.5",power_distribution="1",outlet="2"'
+        prefix = "eaton_ups_power_distributions_outlets_measures"
+        assert blocks == {
+            f"{prefix}_active_power": f"{prefix}_active_power{{{labels}}} 58\n",
+            f"{prefix}_current": f"{prefix}_current{{{labels}}} 0.4\n",
+            f"{prefix}_switched_on": f"{prefix}_switched_on{{{labels}}} 1\n",
+            f"{prefix}_nested_value_a": f"{prefix}_nested_value_a{{{labels}}} 1.5\n",
+        }
+
+    def test_fixture(self, ups_5px_g2_data):
+        """Test the fixture renders the input voltage."""
+        blocks = MetricsRenderer("ups").families(ups_5px_g2_data)
+        assert blocks[VOLTAGE_FAMILY] == (
+            f'{VOLTAGE_FAMILY}{{host="ups",power_distribution="1",input="1"}} 230.8\n'
+        )
+
+    @pytest.mark.parametrize("fixture", ["ups_5px_g2_data", "ups_5px_2200_g2_m3_data"])
+    def test_fixture_series_unique(self, request, fixture):
+        """Test every rendered series of a fixture is unique."""
+        blocks = MetricsRenderer("ups").families(request.getfixturevalue(fixture))
+        series = [
+            line.rpartition(" ")[0]
+            for block in blocks.values()
+            for line in block.splitlines()
+        ]
+        assert len(series) == len(set(series))
+
+    def test_exchange_topics_skipped(self):
+        """Test request and response exchanges and $ fields are not rendered."""
+        blocks = MetricsRenderer("ups").families(
+            {
+                "powerService/suppliers/a/timeSync??/b": {"$reqId": 1, "client": 2.0},
+                "powerService/suppliers/a/timeSync?=/b": {"$err": 1, "ref": 2.5},
+                OUTLET_TOPIC: {"$reqId": 1, "activePower": 58},
+            }
+        )
+        assert list(blocks) == [
+            "eaton_ups_power_distributions_outlets_measures_active_power"
+        ]
+
+    def test_unchanged_payloads_not_rerendered(self, ups_5px_g2_data):
+        """Test a scrape without replaced payloads keeps the version."""
+        renderer = MetricsRenderer("ups")
+        data = dict(ups_5px_g2_data)
+        renderer.families(data)
+        version = renderer.version
+        renderer.families(data)
+        assert renderer.version == version
+
+        data["powerDistributions/1/inputs/1/measures"] = {"voltage": 231}
+        blocks = renderer.families(data)
+        assert renderer.version == version + 1
+        assert blocks[VOLTAGE_FAMILY].endswith("} 231\n")
+        assert "eaton_ups_power_distributions_inputs_measures_current" not in blocks
+
+
+class TestRenderMetrics:
+    """Tests for merging several UPS into one exposition."""
+
+    def test_families_not_interleaved(self):
+        """Test each family is typed once with the samples of every UPS."""
+        data = {OUTLET_TOPIC: {"current": 0.4}}
+        text = render_metrics(
+            MetricsRenderer(host).families(data) for host in ("a", "b")
+        )
+        family = "eaton_ups_power_distributions_outlets_measures_current"
+        assert text == (
+            f"# TYPE {family} gauge\n"
+            f'{family}{{host="a",power_distribution="1",outlet="2"}} 0.4\n'
+            f'{family}{{host="b",power_distribution="1",outlet="2"}} 0.4\n'
+            "# EOF\n"
+        )
+
+
+class TestMetricsView:
+    """Tests for the metrics view."""
+
+    async def test_get(self, ups_5px_g2_data):
+        """Test the view serves the exposition and caches it between scrapes."""
+        view = EatonUpsMetricsView()
+        entry = make_entry(MetricsRenderer("ups"), ups_5px_g2_data)
+        response = await view.get(make_request([entry]))
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert response.body.endswith(b"# EOF\n")
+        assert VOLTAGE_FAMILY.encode() in response.body
+        again = await view.get(make_request([entry]))
+        assert again.body is response.body
+
+    @pytest.mark.parametrize("enabled", [False, None])
+    async def test_not_enabled(self, enabled):
+        """Test the view is not found without an entry exporting metrics."""
+        entries = [] if enabled is None else [make_entry(None, {}, enabled=enabled)]
+        response = await EatonUpsMetricsView().get(make_request(entries))
+        assert response.status == HTTPStatus.NOT_FOUND
@@ -0,0 +1,40 @@
+"""Unit tests for the payload field helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.payload import get_number
+
+
+class TestGetNumber:
+    """Tests for reading numeric payload fields."""
+
+    @pytest.mark.parametrize(
+        ("payload", "path", "expected"),
+        [
+            ({"voltage": 230}, ("voltage",), 230.0),
+            ({"frequency": {"nominal": 50.0}}, ("frequency", "nominal"), 50.0),
+            (12.5, (), 12.5),
+        ],
+    )
+    def test_number(self, payload, path, expected):
+        """Test numbers are returned as floats at any depth."""
+        value = get_number(payload, *path)
+        assert value == expected
+        assert isinstance(value, float)
+
+    @pytest.mark.parametrize(
+        ("payload", "path"),
+        [
+            (None, ("voltage",)),
+            ({}, ("voltage",)),
+            ({"voltage": "230"}, ("voltage",)),
+            ({"voltage": True}, ("voltage",)),
+            ({"voltage": None}, ("voltage",)),
+            ({"frequency": 50}, ("frequency", "nominal")),
+        ],
+    )
+    def test_not_a_number(self, payload, path):
+        """Test missing levels, strings, booleans and nulls return None."""
+        assert get_number(payload, *path) is None
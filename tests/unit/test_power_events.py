@@ -0,0 +1,135 @@
+"""Unit tests for the power event state machine."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.const import EVENT_POWER_EVENT
+from custom_components.eaton_ups_mqtt.power_events import (
+    INPUT_STATUS_TOPIC,
+    POWER_BANK_STATUS_TOPIC,
+    STATUS_TOPIC,
+    PowerEventMachine,
+    PowerState,
+)
+
+INPUT_TOPIC = INPUT_STATUS_TOPIC.format(input_num=1)
+
+
+@pytest.fixture
+def initial_data(ups_5px_g2_data):
+    """Return the status topics of the 5PX G2 fixture (on mains)."""
+    return {
+        key: ups_5px_g2_data[key]
+        for key in (STATUS_TOPIC, POWER_BANK_STATUS_TOPIC, INPUT_TOPIC)
+    }
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch async_call_later and return the mock."""
+    with patch(
+        "custom_components.eaton_ups_mqtt.power_events.async_call_later"
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def machine(initial_data, mock_call_later, client):
+    """Create a machine seeded with on-mains data that has settled."""
+    hass = MagicMock()
+    instance = PowerEventMachine(hass, "test_entry_id")
+    instance.async_start(client, initial_data)
+    instance._async_debounce_elapsed(None)
+    mock_call_later.reset_mock()
+    instance.hass = hass
+    instance.client = client
+    return instance
+
+
+def fired_types(machine):
+    """Return the event types fired on the bus."""
+    return [
+        call.args[1]["type"]
+        for call in machine.hass.bus.async_fire.call_args_list
+        if call.args[0] == EVENT_POWER_EVENT
+    ]
+
+
+class TestPowerEventMachine:
+    """Tests for power state transitions."""
+
+    def test_initial_state_adopted_silently(self, machine):
+        """Test the seeded state is adopted without firing an event."""
+        assert machine.state == PowerState.ON_MAINS
+        assert fired_types(machine) == []
+
+    def test_subscribes_to_status_topics(self, machine):
+        """Test the machine subscribes to distribution, bank and input status."""
+        assert STATUS_TOPIC in machine.client.callbacks
+        assert POWER_BANK_STATUS_TOPIC in machine.client.callbacks
+        assert INPUT_TOPIC in machine.client.callbacks
+
+    def test_on_battery_fires_after_debounce(
+        self, machine, initial_data, mock_call_later
+    ):
+        """Test going on battery fires once the state held for the debounce."""
+        machine.client.publish(
+            POWER_BANK_STATUS_TOPIC,
+            {**initial_data[POWER_BANK_STATUS_TOPIC], "supply": True},
+        )
+        mock_call_later.assert_called_once()
+        assert fired_types(machine) == []
+
+        machine._async_debounce_elapsed(None)
+
+        assert machine.state == PowerState.ON_BATTERY
+        assert fired_types(machine) == ["on_battery"]
+        event_data = machine.hass.bus.async_fire.call_args.args[1]
+        assert event_data["previous_state"] == "on_mains"
+        assert event_data["config_entry_id"] == "test_entry_id"
+
+    def test_flap_is_debounced(self, machine, initial_data):
+        """Test a flap back to the committed state within the window fires nothing."""
+        machine.client.publish(
+            POWER_BANK_STATUS_TOPIC,
+            {**initial_data[POWER_BANK_STATUS_TOPIC], "supply": True},
+        )
+        machine.client.publish(
+            POWER_BANK_STATUS_TOPIC, initial_data[POWER_BANK_STATUS_TOPIC]
+        )
+
+        assert machine._unsub_debounce is None
+        assert machine.state == PowerState.ON_MAINS
+        assert fired_types(machine) == []
+
+    def test_mains_lost_and_restored(self, machine, initial_data):
+        """Test input supply loss and return fire mains_lost then mains_restored."""
+        machine.client.publish(
+            INPUT_TOPIC, {**initial_data[INPUT_TOPIC], "supply": False}
+        )
+        machine._async_debounce_elapsed(None)
+        machine.client.publish(INPUT_TOPIC, initial_data[INPUT_TOPIC])
+        machine._async_debounce_elapsed(None)
+
+        assert fired_types(machine) == ["mains_lost", "mains_restored"]
+
+    def test_shutdown_imminent_is_immediate(
+        self, machine, initial_data, mock_call_later
+    ):
+        """Test shutdown imminent bypasses the debounce."""
+        machine.client.publish(
+            STATUS_TOPIC, {**initial_data[STATUS_TOPIC], "shutdownImminent": True}
+        )
+
+        mock_call_later.assert_not_called()
+        assert machine.state == PowerState.SHUTDOWN_IMMINENT
+        assert fired_types(machine) == ["shutdown_imminent"]
+
+    def test_stop_unsubscribes(self, machine):
+        """Test stopping removes all topic subscriptions."""
+        machine.async_stop()
+
+        assert machine.client.callbacks == {}
@@ -0,0 +1,223 @@
+"""Unit tests for power quality event detection."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.power_quality import (
+    ExcursionDetector,
+    InputMonitor,
+    PowerQualityEventType,
+    PowerQualityMonitor,
+)
+from custom_components.eaton_ups_mqtt.sensor import EatonUpsPowerQualitySensor
+
+INPUT_TOPIC = "powerDistributions/1/inputs/1/measures"
+SETTINGS_TOPIC = "powerDistributions/1/settings"
+MONOTONIC = "custom_components.eaton_ups_mqtt.power_quality.time.monotonic"
+
+
+@pytest.fixture
+def client(fake_client, ups_5px_g2_data):
+    """Return a fake client of the 5PX G2 fixture."""
+    return fake_client(ups_5px_g2_data)
+
+
+def _start(client, data):
+    """Create a power quality monitor started on data."""
+    instance = PowerQualityMonitor(MagicMock())
+    with patch(
+        "custom_components.eaton_ups_mqtt.power_quality.async_track_time_change"
+    ):
+        instance.async_start(client, data)
+    return instance
+
+
+@pytest.fixture
+def monitor(client, ups_5px_g2_data):
+    """Create a power quality monitor started on the 5PX G2 fixture."""
+    return _start(client, ups_5px_g2_data)
+
+
+class TestExcursionDetector:
+    """Tests for the hysteresis detector."""
+
+    def test_event(self):
+        """Test an event spans from entering to leaving the band."""
+        detector = ExcursionDetector(enter=10, exit_=8)
+        assert detector.update(0, 220, 11) is None
+        assert detector.update(1, 215, 15) is None
+        assert detector.active
+        assert detector.update(2, 218, 12) is None
+        _, duration, extreme = detector.update(5, 225, 5)
+        assert duration == 5
+        assert extreme == 215
+        assert not detector.active
+
+    def test_hysteresis(self):
+        """Test a value hovering at the threshold stays one event."""
+        detector = ExcursionDetector(enter=10, exit_=8)
+        results = [
+            detector.update(second, 0, score)
+            for second, score in enumerate([11, 9, 11, 9, 11, 7])
+        ]
+        assert results[:-1] == [None] * 5
+        assert results[-1][1] == 5
+
+
+class TestInputMonitor:
+    """Tests for per-input sag, swell and frequency detection."""
+
+    @pytest.mark.parametrize(
+        ("voltage", "frequency", "nominal_voltage", "nominal_frequency"),
+        [(230.8, 50, 230, 50), (118.2, 59.9, 120, 60), (209.5, 60.1, 208, 60)],
+    )
+    def test_nominal(self, voltage, frequency, nominal_voltage, nominal_frequency):
+        """Test the first sample is snapped to the closest nominal values."""
+        monitor = InputMonitor(90, 110, 1.0)
+        monitor.update(0, {"voltage": voltage, "frequency": frequency})
+        assert monitor.nominal_voltage == nominal_voltage
+        assert monitor.nominal_frequency == nominal_frequency
+
+    @pytest.mark.parametrize(
+        ("low", "recovered", "event_type"),
+        [
+            ({"voltage": 200}, {"voltage": 212}, PowerQualityEventType.SAG),
+            ({"voltage": 260}, {"voltage": 248}, PowerQualityEventType.SWELL),
+            (
+                {"frequency": 50.8},
+                {"frequency": 50.3},
+                PowerQualityEventType.FREQUENCY_EXCURSION,
+            ),
+        ],
+    )
+    def test_events(self, low, recovered, event_type):
+        """Test each excursion type is reported once it recovers."""
+        monitor = InputMonitor(90, 110, 1.0)
+        assert monitor.update(0, {"voltage": 230, "frequency": 50}) == []
+        assert monitor.update(1, low) == []
+        ((ended_type, _, duration, extreme),) = monitor.update(4, recovered)
+        assert ended_type == event_type
+        assert duration == 3
+        assert extreme == next(iter(low.values()))
+
+    def test_recovery_needs_hysteresis(self):
+        """Test a sag only ends once the voltage recovers past the hysteresis."""
+        monitor = InputMonitor(90, 110, 1.0)
+        monitor.update(0, {"voltage": 230})
+        monitor.update(1, {"voltage": 205})
+        assert monitor.update(2, {"voltage": 208}) == []
+        assert len(monitor.update(3, {"voltage": 213})) == 1
+
+    @pytest.mark.parametrize("payload", [None, {}, {"voltage": "n/a"}, {"voltage": 0}])
+    def test_invalid_payloads(self, payload):
+        """Test payloads without usable readings are ignored."""
+        monitor = InputMonitor(90, 110, 1.0)
+        assert monitor.update(0, payload) == []
+        assert monitor.nominal_voltage is None
+
+    def test_set_nominal_not_snapped(self):
+        """Test a nominal set before the first sample is not snapped to it."""
+        monitor = InputMonitor(90, 110, 1.0)
+        monitor.set_nominal_voltage(230)
+        monitor.set_nominal_frequency(50)
+        assert monitor.update(0, {"voltage": 200, "frequency": 50}) == []
+        assert monitor.nominal_voltage == 230
+        ((event_type, *_),) = monitor.update(1, {"voltage": 230})
+        assert event_type == PowerQualityEventType.SAG
+
+
+class TestPowerQualityMonitor:
+    """Tests for following the input measures."""
+
+    def test_start(self, monitor, client):
+        """Test the input measures are followed and seeded from the data."""
+        assert monitor.inputs == [1]
+        assert set(client.callbacks) == {INPUT_TOPIC, SETTINGS_TOPIC}
+        assert monitor.count(1, PowerQualityEventType.SAG) == 0
+
+    def test_nominals_from_card(self, fake_client, ups_5px_g2_data):
+        """Test the nominals come from the settings and suppliers, not samples."""
+        data = {**ups_5px_g2_data, INPUT_TOPIC: {"voltage": 212.0, "frequency": 56}}
+        monitor = _start(fake_client(data), data)
+        assert monitor._inputs[1].nominal_voltage == 230
+        assert monitor._inputs[1].nominal_frequency == 50
+
+    def test_nominal_snapped_without_settings(self, fake_client, ups_5px_g2_data):
+        """Test the first sample is snapped when the card publishes no nominals."""
+        data = {
+            key: payload
+            for key, payload in ups_5px_g2_data.items()
+            if key != SETTINGS_TOPIC and not key.startswith("powerService/")
+        }
+        data[INPUT_TOPIC] = {"voltage": 118.0, "frequency": 59.8}
+        monitor = _start(fake_client(data), data)
+        assert monitor._inputs[1].nominal_voltage == 120
+        assert monitor._inputs[1].nominal_frequency == 60
+
+    def test_settings_reseed(self, monitor, client, ups_5px_g2_data):
+        """Test a changed nominal voltage setting re-seeds the detectors."""
+        events = []
+        monitor.async_add_event_listener(events.append)
+        client.publish(
+            SETTINGS_TOPIC, {**ups_5px_g2_data[SETTINGS_TOPIC], "nominalVoltage": 240}
+        )
+        assert monitor._inputs[1].nominal_voltage == 240
+        client.publish(INPUT_TOPIC, {"voltage": 212.0})
+        client.publish(INPUT_TOPIC, {"voltage": 239.0})
+        (event,) = events
+        assert event.event_type == PowerQualityEventType.SAG
+        assert event.nominal == 240
+
+    def test_event_counted_and_reported(self, monitor, client):
+        """Test a finished event is counted and passed to listeners."""
+        events = []
+        listener = MagicMock()
+        monitor.async_add_event_listener(events.append)
+        monitor.async_add_listener(listener)
+        with patch(MONOTONIC, side_effect=[10.0, 12.5]):
+            client.publish(INPUT_TOPIC, {"voltage": 190.0, "frequency": 50})
+            client.publish(INPUT_TOPIC, {"voltage": 229.0, "frequency": 50})
+
+        (event,) = events
+        assert event.input_num == 1
+        assert event.event_type == PowerQualityEventType.SAG
+        assert event.duration == 2.5
+        assert event.extreme == 190.0
+        assert event.nominal == 230
+        assert monitor.count(1, PowerQualityEventType.SAG) == 1
+        listener.assert_called_once()
+
+    def test_midnight_reset(self, monitor, client):
+        """Test the daily counters start over at midnight."""
+        client.publish(INPUT_TOPIC, {"voltage": 190.0})
+        client.publish(INPUT_TOPIC, {"voltage": 229.0})
+        listener = MagicMock()
+        monitor.async_add_listener(listener)
+        monitor._async_reset_counts(None)
+        assert monitor.count(1, PowerQualityEventType.SAG) == 0
+        listener.assert_called_once()
+
+    def test_stop_unsubscribes(self, monitor, client):
+        """Test stopping releases the topic subscriptions."""
+        monitor.async_stop()
+        assert client.callbacks == {}
+
+
+class TestPowerQualitySensor:
+    """Tests for the daily counter sensors."""
+
+    def test_counter(self, monitor, client, ups_5px_g2_data):
+        """Test the sensor reports the monitor's daily count."""
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "entry"
+        coordinator.power_quality = monitor
+        coordinator.data = ups_5px_g2_data
+        sensor = EatonUpsPowerQualitySensor(coordinator, 1, PowerQualityEventType.SWELL)
+        client.publish(INPUT_TOPIC, {"voltage": 260.0})
+        client.publish(INPUT_TOPIC, {"voltage": 231.0})
+        assert sensor.unique_id == "entry_input_1_swell_today"
+        assert sensor.entity_description.name == "Input 1 Swells Today"
+        assert sensor.native_value == 1
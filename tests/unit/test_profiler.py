@@ -0,0 +1,143 @@
+"""Unit tests for the hot path profiler."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.eaton_ups_mqtt.profiler import HotPathProfiler
+
+
+class FakeEntity:
+    """Minimal entity with a class-level state writer."""
+
+    def __init__(self, entity_id):
+        self.entity_id = entity_id
+        self.writes = 0
+
+    def async_write_ha_state(self):
+        self.writes += 1
+
+
+class FakeCoordinator:
+    """Minimal coordinator with a class-level update method."""
+
+    def __init__(self):
+        self.profiler = None
+        self.updates = 0
+
+    def async_set_updated_data(self, data):
+        self.updates += 1
+
+
+@pytest.fixture
+def entry():
+    """Create a config entry with a fake coordinator and mocked client."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.title = "Test UPS"
+    mock_entry.runtime_data.coordinator = FakeCoordinator()
+    return mock_entry
+
+
+@pytest.fixture
+def entities(entry):
+    """Patch the entity platforms to expose two entities of the entry."""
+    own = [FakeEntity("sensor.ups_load"), FakeEntity("sensor.ups_voltage")]
+    platform = MagicMock()
+    platform.config_entry = entry
+    platform.entities = {entity.entity_id: entity for entity in own}
+    other = MagicMock()
+    other.config_entry = MagicMock()
+    other.entities = {"sensor.other": FakeEntity("sensor.other")}
+    with patch(
+        "custom_components.eaton_ups_mqtt.profiler.async_get_platforms",
+        return_value=[platform, other],
+    ):
+        yield own
+
+
+class TestHotPathProfiler:
+    """Tests for probe installation, removal and reporting."""
+
+    def test_probes_installed_and_removed(self, entry, entities):
+        """Test probes wrap instance methods only while running."""
+        coordinator = entry.runtime_data.coordinator
+        profiler = HotPathProfiler(MagicMock(), entry)
+
+        profiler.async_start()
+        assert "async_set_updated_data" in vars(coordinator)
+        assert all("async_write_ha_state" in vars(entity) for entity in entities)
+        entry.runtime_data.client.set_message_probe.assert_called_once_with(
+            profiler._record_message
+        )
+
+        profiler.async_stop()
+        assert "async_set_updated_data" not in vars(coordinator)
+        assert not any("async_write_ha_state" in vars(entity) for entity in entities)
+        entry.runtime_data.client.set_message_probe.assert_called_with(None)
+        assert coordinator.profiler is None
+
+    def test_wrapped_methods_still_run(self, entry, entities):
+        """Test wrapped methods call through to the originals."""
+        coordinator = entry.runtime_data.coordinator
+        profiler = HotPathProfiler(MagicMock(), entry)
+
+        profiler.async_start()
+        coordinator.async_set_updated_data({})
+        entities[0].async_write_ha_state()
+        profiler.async_stop()
+
+        assert coordinator.updates == 1
+        assert entities[0].writes == 1
+
+    def test_rejects_concurrent_session(self, entry, entities):
+        """Test a second session for the same entry is rejected."""
+        HotPathProfiler(MagicMock(), entry).async_start()
+
+        with pytest.raises(HomeAssistantError, match="already running"):
+            HotPathProfiler(MagicMock(), entry).async_start()
+
+    def test_report(self, entry, entities):
+        """Test the report aggregates per topic and per entity."""
+        coordinator = entry.runtime_data.coordinator
+        profiler = HotPathProfiler(MagicMock(), entry)
+
+        profiler.async_start()
+        profiler._record_message("mbdetnrs/2.0/powerDistributions/1/status", 0.002)
+        profiler._record_message("mbdetnrs/2.0/powerDistributions/1/status", 0.004)
+        profiler._record_message("mbdetnrs/2.0/sensors/1/status", 0.001)
+        coordinator.async_set_updated_data({})
+        entities[1].async_write_ha_state()
+        profiler.async_stop()
+
+        report = profiler.report()
+        assert report["dispatch_counts"] == {
+            "messages": 3,
+            "coordinator_updates": 1,
+            "entity_state_writes": 1,
+        }
+        status = report["topics"]["mbdetnrs/2.0/powerDistributions/1/status"]
+        assert status["count"] == 2
+        assert status["total_ms"] == 6.0
+        assert status["max_ms"] == 4.0
+        assert (
+            next(iter(report["topics"])) == "mbdetnrs/2.0/powerDistributions/1/status"
+        )
+        assert list(report["entities"]) == ["sensor.ups_voltage"]
+
+    def test_write_reports(self, entry, entities, tmp_path):
+        """Test the JSON report and cProfile dump are written to the config dir."""
+        profiler = HotPathProfiler(MagicMock(), entry, with_cprofile=True)
+        profiler.async_start()
+        profiler.async_stop()
+
+        paths = profiler.write_reports(str(tmp_path))
+
+        report = json.loads((tmp_path / paths["report"]).read_text())
+        assert report["config_entry_id"] == "test_entry_id"
+        assert paths["cprofile"].endswith(".prof")
+        assert (tmp_path / paths["cprofile"]).exists()
@@ -0,0 +1,197 @@
+"""Unit tests for pre-aggregated recorder statistics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.components.sensor import SensorStateClass
+
+from custom_components.eaton_ups_mqtt.const import DOMAIN
+from custom_components.eaton_ups_mqtt.recorder_stats import (
+    STATISTICS_PERIOD,
+    HourlyAggregate,
+    StatisticsAggregator,
+)
+from custom_components.eaton_ups_mqtt.sensor import EatonUpsSensor
+
+POWER_TOPIC = "powerDistributions/1/outputs/1/measures"
+POWER_KEY = f"{POWER_TOPIC}$activePower"
+HOUR = 1_700_000_000 - 1_700_000_000 % STATISTICS_PERIOD
+ADD_STATISTICS = (
+    "homeassistant.components.recorder.statistics.async_add_external_statistics"
+)
+
+
+@pytest.fixture
+def aggregator(client):
+    """Create an aggregator started on the fake client with the recorder loaded."""
+    hass = MagicMock()
+    hass.config.components = {"recorder"}
+    instance = StatisticsAggregator(hass, "ENTRY", "Eaton UPS (host)")
+    with patch(
+        "custom_components.eaton_ups_mqtt.recorder_stats.async_track_utc_time_change"
+    ):
+        instance.async_start(client)
+    return instance
+
+
+def power_description():
+    """Return a description stand-in for output active power."""
+    description = MagicMock(
+        key=POWER_KEY,
+        native_unit_of_measurement="W",
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    description.name = "Output 1 Active Power"
+    return description
+
+
+class TestHourlyAggregate:
+    """Tests for the time-weighted hourly aggregate."""
+
+    def test_time_weighted_mean(self):
+        """Test values are weighted by how long they were in effect."""
+        aggregate = HourlyAggregate(HOUR, 100.0)
+        aggregate.add(HOUR + 900, 300.0)
+        aggregate.roll(HOUR + 1200)
+        assert aggregate.row() == (HOUR, 150.0, 100.0, 300.0)
+
+    def test_no_value(self):
+        """Test an aggregate without any value has no row."""
+        aggregate = HourlyAggregate(HOUR, None)
+        aggregate.roll(HOUR + 600)
+        assert aggregate.row() is None
+
+    def test_seeded_mid_hour(self):
+        """Test time before the first value does not dilute the mean."""
+        aggregate = HourlyAggregate(HOUR + 1800, 50.0)
+        aggregate.roll(HOUR + 2400)
+        assert aggregate.row() == (HOUR, 50.0, 50.0, 50.0)
+
+    def test_hour_rollover(self):
+        """Test a finished hour is completed and its last value carries over."""
+        aggregate = HourlyAggregate(HOUR, 100.0)
+        aggregate.add(HOUR + 1800, 200.0)
+        aggregate.roll(HOUR + STATISTICS_PERIOD + 600)
+        assert aggregate.completed == [(HOUR, 150.0, 100.0, 200.0)]
+        assert aggregate.row() == (HOUR + STATISTICS_PERIOD, 200.0, 200.0, 200.0)
+
+    def test_value_across_hours(self):
+        """Test a value arriving after a missed rollover closes the hour first."""
+        aggregate = HourlyAggregate(HOUR, 100.0)
+        aggregate.add(HOUR + STATISTICS_PERIOD + 1800, 400.0)
+        aggregate.roll(HOUR + 2 * STATISTICS_PERIOD)
+        assert aggregate.completed[0] == (HOUR, 100.0, 100.0, 100.0)
+        assert aggregate.completed[1] == (
+            HOUR + STATISTICS_PERIOD,
+            250.0,
+            100.0,
+            400.0,
+        )
+
+
+class TestStatisticsAggregator:
+    """Tests for tracking measurements and importing statistics."""
+
+    def test_statistic_id(self, aggregator):
+        """Test statistic ids are valid external ids."""
+        assert aggregator.statistic_id(POWER_KEY) == (
+            f"{DOMAIN}:entry_powerdistributions_1_outputs_1_measures_activepower"
+        )
+
+    def test_track_subscribes(self, aggregator, client):
+        """Test tracking subscribes to the topic and marks the key."""
+        aggregator.async_track(power_description(), {})
+        assert aggregator.tracks(POWER_KEY)
+        assert not aggregator.tracks(f"{POWER_TOPIC}$voltage")
+        assert set(client.callbacks) == {POWER_TOPIC}
+
+    def test_publish_imports_current_hour(self, aggregator, client):
+        """Test publishing imports the hour so far as an external statistic."""
+        with patch(
+            "custom_components.eaton_ups_mqtt.recorder_stats.time.time",
+            side_effect=[HOUR, HOUR + 600, HOUR + 1200],
+        ):
+            aggregator.async_track(power_description(), {POWER_TOPIC: {}})
+            client.publish(POWER_TOPIC, {"activePower": 500})
+            with patch(ADD_STATISTICS) as add_statistics:
+                aggregator._async_publish()
+
+        metadata, rows = add_statistics.call_args.args[1:]
+        assert metadata["statistic_id"] == aggregator.statistic_id(POWER_KEY)
+        assert metadata["name"] == "Eaton UPS (host) Output 1 Active Power"
+        assert metadata["source"] == DOMAIN
+        assert metadata["unit_of_measurement"] == "W"
+        assert metadata["has_sum"] is False
+        assert rows == [
+            {
+                "start": datetime.fromtimestamp(HOUR, UTC),
+                "mean": 500.0,
+                "min": 500.0,
+                "max": 500.0,
+            }
+        ]
+
+    def test_publish_without_recorder(self, aggregator):
+        """Test nothing is imported while the recorder is not loaded."""
+        aggregator._hass.config.components = set()
+        aggregator.async_track(power_description(), {POWER_TOPIC: {"activePower": 1}})
+        with patch(ADD_STATISTICS) as add_statistics:
+            aggregator._async_publish()
+        add_statistics.assert_not_called()
+
+    def test_stop_unsubscribes(self, aggregator, client):
+        """Test stopping flushes the aggregates and releases subscriptions."""
+        aggregator.async_track(power_description(), {})
+        with patch(ADD_STATISTICS):
+            aggregator.async_stop()
+        assert client.callbacks == {}
+
+
+class TestRateLimitedSensor:
+    """Tests for state writes of aggregated measurements."""
+
+    @pytest.fixture
+    def sensor(self, aggregator):
+        """Create a sensor for an aggregated measurement."""
+        description = power_description()
+        aggregator.async_track(description, {})
+        coordinator = MagicMock()
+        coordinator.statistics = aggregator
+        return EatonUpsSensor(coordinator, description)
+
+    def test_state_class_kept(self, sensor):
+        """Test the entity keeps its statistics alongside the imported ones."""
+        state_class = getattr(
+            sensor, "_attr_state_class", sensor.entity_description.state_class
+        )
+        assert state_class == SensorStateClass.MEASUREMENT
+
+    def test_writes_deferred(self, sensor):
+        """Test updates within the interval are deferred to a single write."""
+        sensor.async_write_ha_state = MagicMock()
+        with patch(
+            "custom_components.eaton_ups_mqtt.sensor.async_call_later"
+        ) as call_later:
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+        sensor.async_write_ha_state.assert_called_once()
+        call_later.assert_called_once()
+
+        sensor._async_deferred_write(None)
+        assert sensor.async_write_ha_state.call_count == 2
+        assert sensor._unsub_deferred_write is None
+
+    def test_unaggregated_not_limited(self, aggregator):
+        """Test measurements outside statistics mode write on every update."""
+        description = MagicMock(key=f"{POWER_TOPIC}$voltage")
+        coordinator = MagicMock()
+        coordinator.statistics = aggregator
+        sensor = EatonUpsSensor(coordinator, description)
+        sensor.async_write_ha_state = MagicMock()
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
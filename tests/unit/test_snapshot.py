@@ -0,0 +1,141 @@
+"""Unit tests for the topic store snapshot view."""
+
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.components.http import KEY_HASS
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.eaton_ups_mqtt.const import DOMAIN
+from custom_components.eaton_ups_mqtt.snapshot import (
+    EatonUpsSnapshotView,
+    changed_topics,
+)
+
+INPUT_TOPIC = "powerDistributions/1/inputs/1/measures"
+OUTPUT_TOPIC = "powerDistributions/1/outputs/1/measures"
+EPOCH = "3f2a"
+
+
+@pytest.fixture
+def entry():
+    """Return a loaded entry whose store holds two topics at version 5."""
+    instance = MagicMock(domain=DOMAIN, entry_id="entry", state=ConfigEntryState.LOADED)
+    instance.runtime_data.client.epoch = EPOCH
+    instance.runtime_data.client.version = 5
+    instance.runtime_data.client.topic_versions = {INPUT_TOPIC: 2, OUTPUT_TOPIC: 5}
+    instance.runtime_data.coordinator.data = {
+        INPUT_TOPIC: {"voltage": 230.8},
+        OUTPUT_TOPIC: {"activePower": 58},
+    }
+    return instance
+
+
+def make_request(entry, query=None, headers=None):
+    """Return a request stand-in whose hass holds entry."""
+    hass = MagicMock()
+    hass.config_entries.async_get_entry.side_effect = lambda entry_id: (
+        entry if entry_id == entry.entry_id else None
+    )
+    return MagicMock(app={KEY_HASS: hass}, query=query or {}, headers=headers or {})
+
+
+def test_changed_topics():
+    """Test only topics changed after the given version are returned."""
+    data = {INPUT_TOPIC: 1, OUTPUT_TOPIC: 2}
+    versions = {INPUT_TOPIC: 2, OUTPUT_TOPIC: 5}
+    assert changed_topics(data, versions, 2) == {OUTPUT_TOPIC: 2}
+    assert changed_topics(data, versions, 0) == data
+
+
+class TestSnapshotView:
+    """Tests for conditional snapshot requests."""
+
+    async def test_full_snapshot(self, entry):
+        """Test the full store is returned with the version token as entity tag."""
+        response = await EatonUpsSnapshotView().get(make_request(entry), "entry")
+        assert response.headers["ETag"] == f'"{EPOCH}-5"'
+        assert json.loads(response.body) == {
+            "version": f"{EPOCH}-5",
+            "topics": entry.runtime_data.coordinator.data,
+        }
+
+    async def test_body_cached_until_change(self, entry):
+        """Test repeated polls reuse the serialized body until the version moves."""
+        view = EatonUpsSnapshotView()
+        first = await view.get(make_request(entry), "entry")
+        with patch(
+            "custom_components.eaton_ups_mqtt.snapshot.json_bytes"
+        ) as json_bytes:
+            again = await view.get(make_request(entry), "entry")
+            json_bytes.assert_not_called()
+            assert again.body is first.body
+            entry.runtime_data.client.version = 6
+            await view.get(make_request(entry), "entry")
+            json_bytes.assert_called_once()
+
+    async def test_body_not_reused_across_epochs(self, entry):
+        """Test a new client at the same version does not get an old body."""
+        view = EatonUpsSnapshotView()
+        first = await view.get(make_request(entry), "entry")
+        entry.runtime_data.client.epoch = "9b1c"
+        again = await view.get(make_request(entry), "entry")
+        assert again.body is not first.body
+        assert json.loads(again.body)["version"] == "9b1c-5"
+
+    async def test_not_modified(self, entry):
+        """Test a matching If-None-Match gets a 304."""
+        request = make_request(
+            entry, headers={"If-None-Match": f'W/"{EPOCH}-4", "{EPOCH}-5"'}
+        )
+        response = await EatonUpsSnapshotView().get(request, "entry")
+        assert response.status == HTTPStatus.NOT_MODIFIED
+        assert response.body is None
+
+    async def test_since(self, entry):
+        """Test since returns only the topics changed after that version."""
+        request = make_request(entry, query={"since": f"{EPOCH}-2"})
+        response = await EatonUpsSnapshotView().get(request, "entry")
+        assert response.headers["ETag"] == f'"{EPOCH}-5-2"'
+        assert json.loads(response.body)["topics"] == {
+            OUTPUT_TOPIC: {"activePower": 58}
+        }
+
+    async def test_since_current_version(self, entry):
+        """Test polling since the current version is not modified."""
+        request = make_request(entry, query={"since": f"{EPOCH}-5"})
+        response = await EatonUpsSnapshotView().get(request, "entry")
+        assert response.status == HTTPStatus.NOT_MODIFIED
+
+    async def test_since_ahead_of_store(self, entry):
+        """Test a version ahead of the store gets the full store."""
+        request = make_request(entry, query={"since": f"{EPOCH}-99"})
+        response = await EatonUpsSnapshotView().get(request, "entry")
+        assert response.headers["ETag"] == f'"{EPOCH}-5"'
+        assert len(json.loads(response.body)["topics"]) == 2
+
+    async def test_since_other_epoch(self, entry):
+        """Test a version of an earlier client gets the full store."""
+        request = make_request(entry, query={"since": "9b1c-3"})
+        response = await EatonUpsSnapshotView().get(request, "entry")
+        assert response.headers["ETag"] == f'"{EPOCH}-5"'
+        assert len(json.loads(response.body)["topics"]) == 2
+
+    @pytest.mark.parametrize(
+        ("entry_id", "query", "status"),
+        [
+            ("missing", {}, HTTPStatus.NOT_FOUND),
+            ("entry", {"since": "abc"}, HTTPStatus.BAD_REQUEST),
+            ("entry", {"since": "2"}, HTTPStatus.BAD_REQUEST),
+            ("entry", {"since": f"{EPOCH}-x"}, HTTPStatus.BAD_REQUEST),
+        ],
+    )
+    async def test_errors(self, entry, entry_id, query, status):
+        """Test unknown entries and malformed versions are rejected."""
+        request = make_request(entry, query=query)
+        response = await EatonUpsSnapshotView().get(request, entry_id)
+        assert response.status == status
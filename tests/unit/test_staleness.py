@@ -0,0 +1,166 @@
+"""Unit tests for topic staleness tracking."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.const import (
+    STALENESS_TICK,
+    TOPIC_MAX_AGE_BY_CLASS,
+    TOPIC_MAX_AGE_DEFAULT,
+)
+from custom_components.eaton_ups_mqtt.staleness import (
+    StalenessTracker,
+    get_topic_max_age,
+)
+
+MEASURES_TOPIC = "powerDistributions/1/outputs/1/measures"
+STATUS_TOPIC = "powerDistributions/1/status"
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the tracker's monotonic clock."""
+    fake = FakeClock()
+    with patch("custom_components.eaton_ups_mqtt.staleness.time.monotonic", new=fake):
+        yield fake
+
+
+@pytest.fixture
+def tracker(clock):
+    """Create a started tracker fed from a plain timestamp dict."""
+    received: dict[str, float] = {}
+    instance = StalenessTracker(MagicMock())
+    with patch(
+        "custom_components.eaton_ups_mqtt.staleness.async_track_time_interval"
+    ) as mock_interval:
+        instance.async_start(received)
+    instance.received = received
+    instance.timer = mock_interval
+    return instance
+
+
+def advance(tracker, clock, seconds):
+    """Advance the clock tick by tick, firing the shared timer."""
+    end = clock.now + seconds
+    while clock.now < end:
+        clock.now = min(clock.now + STALENESS_TICK, end)
+        tracker._async_tick()
+
+
+class TestTopicMaxAge:
+    """Tests for the per-topic-class max age lookup."""
+
+    @pytest.mark.parametrize(
+        ("topic", "expected"),
+        [
+            (MEASURES_TOPIC, TOPIC_MAX_AGE_BY_CLASS["measures"]),
+            (STATUS_TOPIC, TOPIC_MAX_AGE_BY_CLASS["status"]),
+            ("powerDistributions/1/identification", TOPIC_MAX_AGE_DEFAULT),
+        ],
+    )
+    def test_max_age_by_class(self, topic, expected):
+        """Test max age is looked up by the last topic segment."""
+        assert get_topic_max_age(topic) == expected
+
+    def test_max_ages_cover_republish_cadence(self, ups_5px_g2_full):
+        """Test every topic is republished many times within its max age."""
+        topics = len(ups_5px_g2_full["data"])
+        cadence = (
+            ups_5px_g2_full["duration_seconds"]
+            * topics
+            / ups_5px_g2_full["message_count"]
+        )
+        assert cadence * 10 < min(TOPIC_MAX_AGE_BY_CLASS.values())
+
+
+class TestStalenessTracker:
+    """Tests for the shared timer wheel."""
+
+    def test_single_shared_timer(self, tracker):
+        """Test all tracked topics share a single timer."""
+        for num in range(50):
+            tracker.async_track(f"outlets/{num}/measures", MagicMock())
+        tracker.timer.assert_called_once()
+
+    def test_fresh_topic_not_stale(self, tracker, clock):
+        """Test a recently received topic is not stale."""
+        listener = MagicMock()
+        tracker.received[MEASURES_TOPIC] = clock.now
+        tracker.async_track(MEASURES_TOPIC, listener)
+
+        advance(tracker, clock, 30)
+
+        assert not tracker.is_stale(MEASURES_TOPIC)
+        listener.assert_not_called()
+
+    def test_refreshed_topic_stays_fresh(self, tracker, clock):
+        """Test a regularly refreshed topic never goes stale."""
+        listener = MagicMock()
+        tracker.received[MEASURES_TOPIC] = clock.now
+        tracker.async_track(MEASURES_TOPIC, listener)
+
+        for _ in range(10):
+            advance(tracker, clock, 30)
+            tracker.received[MEASURES_TOPIC] = clock.now
+
+        assert not tracker.is_stale(MEASURES_TOPIC)
+        listener.assert_not_called()
+
+    def test_topic_goes_stale_and_recovers(self, tracker, clock):
+        """Test a topic goes stale after max age and recovers on receive."""
+        listener = MagicMock()
+        tracker.received[MEASURES_TOPIC] = clock.now
+        tracker.async_track(MEASURES_TOPIC, listener)
+
+        advance(tracker, clock, TOPIC_MAX_AGE_BY_CLASS["measures"] + STALENESS_TICK)
+        assert tracker.is_stale(MEASURES_TOPIC)
+        assert listener.call_count == 1
+
+        tracker.received[MEASURES_TOPIC] = clock.now
+        advance(tracker, clock, STALENESS_TICK)
+        assert not tracker.is_stale(MEASURES_TOPIC)
+        assert listener.call_count == 2
+
+    def test_unseen_topic_gets_grace_period(self, tracker, clock):
+        """Test a never-received topic gets one max age of grace."""
+        listener = MagicMock()
+        tracker.async_track(STATUS_TOPIC, listener)
+
+        advance(tracker, clock, TOPIC_MAX_AGE_BY_CLASS["status"] - STALENESS_TICK)
+        assert not tracker.is_stale(STATUS_TOPIC)
+
+        advance(tracker, clock, 2 * STALENESS_TICK)
+        assert tracker.is_stale(STATUS_TOPIC)
+
+    def test_remove_listener_stops_tracking(self, tracker, clock):
+        """Test removing the last listener stops tracking the topic."""
+        listener = MagicMock()
+        tracker.received[MEASURES_TOPIC] = clock.now
+        remove = tracker.async_track(MEASURES_TOPIC, listener)
+        remove()
+
+        advance(tracker, clock, TOPIC_MAX_AGE_BY_CLASS["measures"] * 2)
+
+        assert not tracker.is_stale(MEASURES_TOPIC)
+        listener.assert_not_called()
+        assert tracker._wheel == {}
+
+    def test_stop_cancels_timer(self, tracker):
+        """Test stopping the tracker cancels the shared timer."""
+        unsub = tracker._unsub_timer
+        tracker.async_stop()
+        unsub.assert_called_once()
+        assert tracker._unsub_timer is None
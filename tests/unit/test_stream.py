@@ -0,0 +1,158 @@
+"""Unit tests for raw topic delta streams."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.stream import (
+    TopicMatcher,
+    TopicStream,
+    is_valid_filter,
+)
+
+INPUT_TOPIC = "powerDistributions/1/inputs/1/measures"
+OUTPUT_TOPIC = "powerDistributions/1/outputs/1/measures"
+
+
+class FakeClient:
+    """Client stand-in that records change subscriptions."""
+
+    def __init__(self):
+        self.change_callbacks = []
+
+    def subscribe_to_changes(self, callback):
+        self.change_callbacks.append(callback)
+        return lambda: self.change_callbacks.remove(callback)
+
+    def flush(self, keys):
+        for callback in list(self.change_callbacks):
+            callback(set(keys))
+
+
+@pytest.fixture
+def client():
+    """Return a fake client."""
+    return FakeClient()
+
+
+@pytest.fixture
+def stream(client, ups_5px_g2_data):
+    """Create a stream started on the 5PX G2 fixture."""
+    instance = TopicStream()
+    instance.async_start(client, ups_5px_g2_data)
+    return instance
+
+
+class TestTopicFilters:
+    """Tests for MQTT topic filter validation."""
+
+    @pytest.mark.parametrize(
+        ("topic_filter", "valid"),
+        [
+            ("#", True),
+            ("powerDistributions/+/inputs/#", True),
+            (INPUT_TOPIC, True),
+            ("", False),
+            ("powerDistributions/#/inputs", False),
+            ("powerDistributions/1+/inputs", False),
+            ("powerDistributions/1#", False),
+        ],
+    )
+    def test_is_valid_filter(self, topic_filter, valid):
+        """Test wildcards are only accepted as whole segments."""
+        assert is_valid_filter(topic_filter) is valid
+
+
+class TestTopicMatcher:
+    """Tests for the shared filter trie."""
+
+    @pytest.mark.parametrize(
+        ("topic_filter", "topic", "matches"),
+        [
+            ("#", INPUT_TOPIC, True),
+            ("powerDistributions/+/inputs/+/measures", INPUT_TOPIC, True),
+            ("powerDistributions/1/inputs/#", INPUT_TOPIC, True),
+            ("powerDistributions/1/inputs/#", "powerDistributions/1/inputs", True),
+            ("powerDistributions/+/measures", INPUT_TOPIC, False),
+            ("powerDistributions/1/outputs/#", INPUT_TOPIC, False),
+            (INPUT_TOPIC, INPUT_TOPIC, True),
+        ],
+    )
+    def test_match(self, topic_filter, topic, matches):
+        """Test MQTT wildcard semantics."""
+        matcher = TopicMatcher()
+        matcher.add(1, [topic_filter])
+        assert (1 in matcher.match(topic)) is matches
+
+    def test_many_subscribers(self):
+        """Test a topic matches exactly the subscribers with a matching filter."""
+        matcher = TopicMatcher()
+        matcher.add(1, ["powerDistributions/1/inputs/#"])
+        matcher.add(2, ["powerDistributions/+/outputs/+/measures", "#"])
+        matcher.add(3, [OUTPUT_TOPIC])
+        assert matcher.match(INPUT_TOPIC) == {1, 2}
+        assert matcher.match(OUTPUT_TOPIC) == {2, 3}
+
+    def test_remove(self):
+        """Test removing a subscriber invalidates cached matches and prunes."""
+        matcher = TopicMatcher()
+        matcher.add(1, [INPUT_TOPIC])
+        matcher.add(2, ["#"])
+        assert matcher.match(INPUT_TOPIC) == {1, 2}
+        matcher.remove(1)
+        assert matcher.match(INPUT_TOPIC) == {2}
+        matcher.remove(2)
+        assert matcher.match(INPUT_TOPIC) == frozenset()
+        assert matcher._root.children == {}
+
+
+class TestTopicStream:
+    """Tests for snapshot and delta streaming."""
+
+    def test_snapshot(self, stream, ups_5px_g2_data):
+        """Test the snapshot holds the matching topics."""
+        snapshot, _ = stream.async_subscribe(
+            ["powerDistributions/1/inputs/+/measures"], MagicMock()
+        )
+        assert snapshot == {INPUT_TOPIC: ups_5px_g2_data[INPUT_TOPIC]}
+
+    def test_deltas(self, stream, client, ups_5px_g2_data):
+        """Test each subscriber gets one batch of its changed topics per flush."""
+        inputs = MagicMock()
+        everything = MagicMock()
+        stream.async_subscribe(["powerDistributions/1/inputs/#"], inputs)
+        stream.async_subscribe(["#"], everything)
+        ups_5px_g2_data[INPUT_TOPIC] = {"voltage": 231}
+
+        client.flush([INPUT_TOPIC, OUTPUT_TOPIC])
+
+        inputs.assert_called_once_with({INPUT_TOPIC: {"voltage": 231}})
+        everything.assert_called_once_with(
+            {
+                INPUT_TOPIC: {"voltage": 231},
+                OUTPUT_TOPIC: ups_5px_g2_data[OUTPUT_TOPIC],
+            }
+        )
+
+    def test_follows_changes_only_while_subscribed(self, stream, client):
+        """Test the client's change batches are only followed with subscribers."""
+        assert client.change_callbacks == []
+        _, first = stream.async_subscribe(["#"], MagicMock())
+        _, second = stream.async_subscribe(["#"], MagicMock())
+        assert len(client.change_callbacks) == 1
+        first()
+        first()
+        assert len(client.change_callbacks) == 1
+        second()
+        assert client.change_callbacks == []
+
+    def test_stop(self, stream, client):
+        """Test stopping drops subscribers and the change subscription."""
+        listener = MagicMock()
+        _, unsubscribe = stream.async_subscribe(["#"], listener)
+        stream.async_stop()
+        assert client.change_callbacks == []
+        unsubscribe()
+        listener.assert_not_called()
@@ -0,0 +1,86 @@
+"""Unit tests for the powerService supplier index."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.eaton_ups_mqtt.suppliers import (
+    SUPPLIERS_TOPIC,
+    SupplierIndex,
+    supplier_topic,
+)
+
+PRIMARY = "acWPSUdxWmSxL4f849URrg"
+GROUP_1 = "suNLcr7pWISz7bK79b_dkg"
+GROUP_2 = "sM_i2O-TVIa87BqzMc3FDA"
+
+
+def members(*supplier_ids):
+    """Return a suppliers member list payload."""
+    return {
+        "members@count": len(supplier_ids),
+        "members": [
+            {"@id": f"mbdetnrs/1.0/powerService/suppliers/{supplier_id}"}
+            for supplier_id in supplier_ids
+        ],
+    }
+
+
+@pytest.fixture
+def index(ups_5px_g2_data):
+    """Return an index fed with every topic of the 5PX G2 fixture."""
+    instance = SupplierIndex()
+    for key, data in ups_5px_g2_data.items():
+        instance.observe(key, data)
+    return instance
+
+
+class TestSupplierIndex:
+    """Tests for supplier discovery."""
+
+    def test_fixture_suppliers(self, index):
+        """Test the three fixture suppliers are discovered by id."""
+        assert sorted(index.supplier_ids) == sorted([PRIMARY, GROUP_1, GROUP_2])
+
+    def test_topics(self, index):
+        """Test the topics of a supplier are indexed."""
+        topics = index.topics(GROUP_1)
+        assert supplier_topic(GROUP_1, "summary") in topics
+        assert supplier_topic(GROUP_1, "shutdownDurations") in topics
+        assert supplier_topic(PRIMARY, "shutdownDurations") not in index.topics(PRIMARY)
+
+    def test_unknown_supplier_has_no_topics(self, index):
+        """Test an unknown supplier has an empty topic set."""
+        assert index.topics("unknown") == frozenset()
+
+    def test_name_resolved_and_cached(self, index, ups_5px_g2_data):
+        """Test names come from identification and are cached."""
+        assert index.name(GROUP_1, ups_5px_g2_data) == "GROUP 1"
+        assert index.name(GROUP_1, {}) == "GROUP 1"
+
+    def test_name_falls_back_to_id(self, index):
+        """Test the id is used without identification, and not cached."""
+        assert index.name(GROUP_2, {}) == GROUP_2
+        identification = {supplier_topic(GROUP_2, "identification"): {"name": "G2"}}
+        assert index.name(GROUP_2, identification) == "G2"
+
+    def test_new_supplier_appears(self, index):
+        """Test a supplier appears on its first subtopic."""
+        index.observe(supplier_topic("new", "summary"), {})
+        assert "new" in index.supplier_ids
+
+    def test_supplier_vanishes(self, index, ups_5px_g2_data):
+        """Test a supplier missing from the member list is dropped."""
+        index.name(GROUP_2, ups_5px_g2_data)
+        index.observe(SUPPLIERS_TOPIC, members(PRIMARY, GROUP_1))
+
+        assert GROUP_2 not in index.supplier_ids
+        assert index.topics(GROUP_2) == frozenset()
+        assert index.name(GROUP_2, {}) == GROUP_2
+
+    def test_unrelated_topics_ignored(self):
+        """Test topics outside powerService suppliers are ignored."""
+        instance = SupplierIndex()
+        instance.observe("powerDistributions/1/status", {})
+        instance.observe(SUPPLIERS_TOPIC, "garbage")
+        assert instance.supplier_ids == []
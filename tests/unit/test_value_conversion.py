@@ -6,7 +6,7 @@ from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
-from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
 
 from custom_components.eaton_ups_mqtt.sensor import EatonUpsSensor
 
@@ -94,6 +94,40 @@ class TestDateConversion:
         assert mock_sensor._convert_date(value) is None
 
 
+class TestConversionCache:
+    """Tests for the per-entity converted value cache."""
+
+    @pytest.fixture
+    def date_sensor(self):
+        """Create a date sensor whose converter calls are counted."""
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = "test"
+        coordinator.data = {"topic": {"date": 1707301493}}
+        description = SensorEntityDescription(
+            key="topic$date", name="Test", device_class=SensorDeviceClass.DATE
+        )
+        sensor = EatonUpsSensor(coordinator, description)
+        sensor._converter = MagicMock(wraps=sensor._converter)
+        return sensor
+
+    def test_converter_resolved_from_device_class(self, mock_sensor):
+        """Test converters are only resolved for date and timestamp sensors."""
+        assert mock_sensor._converter is None
+
+    def test_unchanged_raw_value_not_reparsed(self, date_sensor):
+        """Test the converted value is reused while the raw value is unchanged."""
+        assert date_sensor.native_value == date(2024, 2, 7)
+        assert date_sensor.native_value == date(2024, 2, 7)
+        assert date_sensor._converter.call_count == 1
+
+    def test_changed_raw_value_reparsed(self, date_sensor):
+        """Test a new raw value is converted again."""
+        assert date_sensor.native_value == date(2024, 2, 7)
+        date_sensor.coordinator.data = {"topic": {"date": "2025-04-14T10:10:17Z"}}
+        assert date_sensor.native_value == date(2025, 4, 14)
+        assert date_sensor._converter.call_count == 2
+
+
 class TestBooleanConversion:
     """Tests for binary sensor boolean conversion logic."""
 